@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Dict
 from collections import defaultdict
 
+from core.events import TIMER_SESSION_ROLL
+
 
 @dataclass
 class Position:
@@ -60,6 +62,7 @@ class PositionManager:
                 pnl = -pnl
 
             pos.realized_pnl += pnl
+            self.daily_realized_pnl += pnl
             pos.qty += signed_qty
 
             if pos.qty == 0:
@@ -79,6 +82,16 @@ class PositionManager:
 
         self._recalculate_unrealized()
 
+    def update_market_batch(self, batch):
+        """
+        Mark-to-market from a MarketEventBatch: last price per symbol,
+        one unrealized PnL recalculation for the whole batch.
+        """
+        for symbol, price in batch.last_prices().items():
+            self.positions[symbol].market_price = price
+
+        self._recalculate_unrealized()
+
     # --------------------------------------------------
 
     def total_equity(self):
@@ -189,6 +202,10 @@ class PositionManager:
     def on_fill(self, fill):
         self.apply_fill(fill)
 
+    def on_timer(self, event):
+        if event.name == TIMER_SESSION_ROLL:
+            self.daily_realized_pnl = 0.0
+
     def on_market_data(self, market_data):
         symbol = market_data.symbol
         price = market_data.price
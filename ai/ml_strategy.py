@@ -3,8 +3,7 @@
 # Использует FeatureEngine из strategy слоя.
 # Публикует SignalEvent независимо.
 
-from datetime import datetime, timezone
-from storage.postgres import PostgresStorage
+from core.clock import WALL_CLOCK
 from core.events import SignalEvent
 from strategy.feature_engine import FeatureEngine
 from ai.model_loader import ModelLoader
@@ -13,11 +12,16 @@ from ai.inference_engine import InferenceEngine
 
 class MLStrategy:
 
-    def __init__(self, event_bus):
+    def __init__(self, event_bus, storage, clock=None):
         self.event_bus = event_bus
+        # None until the Engine / ReplayRunner binds theirs (see core.clock.bind_clock)
+        self.clock = clock
         self.features = FeatureEngine(window=10)
 
-        loader = ModelLoader()
+        # one storage (pool) for the strategy and its model loader
+        self.storage = storage
+
+        loader = ModelLoader(storage=self.storage)
         model_info = loader.load_latest()
 
         self.model_name = "baseline_logreg"
@@ -29,8 +33,6 @@ class MLStrategy:
             feature_order=model_info["features"],
         )
 
-        self.storage = PostgresStorage()
-
     def on_market(self, event):
         print("MLStrategy received market event")
         self.features.update(event.price)
@@ -52,10 +54,11 @@ class MLStrategy:
         )
         self.event_bus.publish(
             SignalEvent(
+                event_id=f"{event.event_id}:ml",
                 symbol=event.symbol,
                 signal_type=signal_type,
                 strength=confidence,
                 features=feature_dict,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=(self.clock or WALL_CLOCK).now(),
             )
         )
\ No newline at end of file
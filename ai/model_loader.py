@@ -7,17 +7,15 @@ import json
 import joblib
 from pathlib import Path
 
-from storage.postgres import PostgresStorage
-
 
 class ModelLoader:
 
-    def __init__(self, model_name="baseline_logreg"):
+    def __init__(self, storage, model_name="baseline_logreg"):
         self.model_name = model_name
-        self.storage = PostgresStorage()
+        self.storage = storage
 
     def load_latest(self):
-        with self.storage.conn.cursor() as cur:
+        with self.storage.session() as conn, conn.cursor() as cur:
             cur.execute(
                 """
                 SELECT version, dataset_path, features, threshold
@@ -4,7 +4,7 @@ import os
 from dotenv import load_dotenv
 from pathlib import Path
 from config.settings import Settings
-from storage.postgres import PostgresStorage
+from storage.pool import ConnectionPool, PooledStorage
 
 from execution.sim_executor import SimExecutionEngine
 from execution.oms import OMS
@@ -34,7 +34,8 @@ def main() -> int:
     mode = os.getenv("MODE", Settings.MODE)
 
     # --- Storage ---
-    storage = PostgresStorage(dsn)
+    # one bounded pool shared by the engine, OMS and strategies
+    storage = PooledStorage(ConnectionPool(dsn, maxconn=int(os.getenv("POSTGRES_POOL_SIZE", "8"))))
 
     # --- Execution ---
     execution_engine = SimExecutionEngine()
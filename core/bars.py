@@ -0,0 +1,52 @@
+# core/bars.py
+import numpy as np
+
+from core.events import MarketEventBatch
+
+
+COLUMNS = ("ts", "open", "high", "low", "close", "volume")
+DTYPES = {"ts": np.dtype("<i8"), **{c: np.dtype("<f8") for c in COLUMNS[1:]}}
+
+
+class Bars:
+    """
+    Column arrays of one range of bars: ts (int64 epoch ns, UTC) and
+    float64 open / high / low / close / volume. Missing OHLC are NaN;
+    columns not requested from the store are None.
+    """
+
+    __slots__ = COLUMNS
+
+    def __init__(self, ts, open, high, low, close, volume):
+        self.ts = ts
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    def __len__(self):
+        return len(self.ts)
+
+    def __getitem__(self, index):
+        return Bars(*(None if (v := getattr(self, c)) is None else v[index] for c in COLUMNS))
+
+    @classmethod
+    def empty(cls):
+        return cls(*(np.empty(0, dtype=DTYPES[c]) for c in COLUMNS))
+
+    @classmethod
+    def concat(cls, parts):
+        parts = [p for p in parts if len(p)]
+        if not parts:
+            return cls.empty()
+        if len(parts) == 1:
+            return parts[0]
+        return cls(*(
+            None if getattr(parts[0], c) is None else np.concatenate([getattr(p, c) for p in parts])
+            for c in COLUMNS
+        ))
+
+    def to_batch(self, symbol) -> MarketEventBatch:
+        """Close prices as a MarketEventBatch (replay / vectorized consumers)."""
+        return MarketEventBatch.for_symbol(symbol, self.ts, self.close, self.volume)
@@ -0,0 +1,53 @@
+# core/clock.py
+from datetime import datetime, timedelta, timezone
+
+
+class WallClock:
+    """
+    Real time, UTC.
+    """
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+
+class VirtualClock:
+    """
+    Time that only moves when the replay driver moves it.
+
+    Components read `now()` exactly like from WallClock, so a backtest
+    runs as fast as the CPU allows and every date-based rule (daily
+    freeze reset, sessions) sees the historical date, not today.
+    """
+
+    def __init__(self, start: datetime | None = None):
+        self._now = start
+
+    def now(self) -> datetime:
+        if self._now is None:
+            raise RuntimeError("VirtualClock has not been started")
+        return self._now
+
+    def advance_to(self, ts: datetime):
+        # monotonic: out-of-order bars never move time backwards
+        if ts is not None and (self._now is None or ts > self._now):
+            self._now = ts
+
+    def advance(self, delta: timedelta):
+        self._now = self.now() + delta
+
+
+# fallback for components whose clock was never bound
+WALL_CLOCK = WallClock()
+
+
+def bind_clock(clock, *components):
+    """
+    Hand `clock` to every component that has an unset `clock` attribute.
+    Bound handler methods count as their owner, so bus subscribers
+    (strategies) can be passed as they were subscribed.
+    """
+    for component in components:
+        component = getattr(component, "__self__", component)
+        if component is not None and getattr(component, "clock", False) is None:
+            component.clock = clock
@@ -0,0 +1,88 @@
+# core/conflation.py
+import threading
+from collections import defaultdict
+from dataclasses import replace
+
+
+def conflation_key(event):
+    return type(event), getattr(event, "symbol", None)
+
+
+def merge_ticks(older, newer):
+    """
+    Newest tick wins, volume of the replaced tick is carried over.
+    """
+    volume = getattr(older, "volume", None)
+    if volume:
+        return replace(newer, volume=newer.volume + volume)
+    return newer
+
+
+class ConflatingHandler:
+    """
+    Wraps a subscriber so it only sees the newest event per symbol while
+    it is busy.
+
+    Calls that arrive while the handler is running (from another publisher
+    thread, or re-entrantly from the handler itself) are parked, one slot
+    per (type, symbol); a later tick for the same symbol replaces the
+    parked one, volume is summed and the replaced tick counted in
+    `dropped`. When the handler returns, the parked events are delivered
+    in the order their symbols first arrived.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.__qualname__ = getattr(handler, "__qualname__", type(handler).__name__)
+
+        self._lock = threading.Lock()
+        self._busy = False
+        self._pending = {}
+
+        # ---- metrics ----
+        self.delivered = 0
+        self.dropped = 0
+        self.dropped_by_symbol = defaultdict(int)
+
+    def __call__(self, event):
+        key = conflation_key(event)
+
+        with self._lock:
+            if self._busy:
+                older = self._pending.get(key)
+                if older is not None:
+                    event = merge_ticks(older, event)
+                    self.dropped += 1
+                    self.dropped_by_symbol[key[1]] += 1
+                # overwriting an existing key keeps its first-arrival position
+                self._pending[key] = event
+                return
+            self._busy = True
+
+        try:
+            while True:
+                self.handler(event)
+                self.delivered += 1
+
+                with self._lock:
+                    if not self._pending:
+                        self._busy = False
+                        return
+                    key = next(iter(self._pending))
+                    event = self._pending.pop(key)
+        except BaseException:
+            with self._lock:
+                self._busy = False
+            raise
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def metrics(self) -> dict:
+        return {
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "pending": self.pending,
+            "dropped_by_symbol": dict(self.dropped_by_symbol),
+        }
@@ -0,0 +1,81 @@
+# core/dispatcher.py
+from collections import defaultdict
+
+
+_MISSING = object()
+
+
+class HandlerRegistry:
+    """
+    Event handler table keyed by event type.
+
+    Handlers are registered for a type; subclasses are resolved through
+    the MRO on first sight and cached, so dispatch is one dict lookup.
+    Keeps per-type counters for handled and unhandled events.
+    """
+
+    def __init__(self):
+        self._handlers = {}
+        self._resolved = {}
+
+        self.counts = defaultdict(int)
+        self.unhandled = defaultdict(int)
+
+    # ------------------------------------------------------------
+    # ------------------- Registration ---------------------------
+    # ------------------------------------------------------------
+
+    def register(self, event_type, handler):
+        self._handlers[event_type] = handler
+        # subclasses may now resolve to a different handler
+        self._resolved.clear()
+
+    def resolve(self, event_type):
+        handler = self._resolved.get(event_type, _MISSING)
+        if handler is not _MISSING:
+            return handler
+
+        handler = None
+        for klass in event_type.__mro__:
+            handler = self._handlers.get(klass)
+            if handler is not None:
+                break
+
+        self._resolved[event_type] = handler
+        return handler
+
+    # ------------------------------------------------------------
+    # ------------------- Dispatch -------------------------------
+    # ------------------------------------------------------------
+
+    def dispatch(self, event) -> bool:
+        event_type = type(event)
+
+        handler = self._resolved.get(event_type, _MISSING)
+        if handler is _MISSING:
+            handler = self.resolve(event_type)
+
+        if handler is None:
+            self.unhandled[event_type] += 1
+            return False
+
+        handler(event)
+        self.counts[event_type] += 1
+        return True
+
+    # ------------------------------------------------------------
+    # ------------------- Counters -------------------------------
+    # ------------------------------------------------------------
+
+    @property
+    def processed(self) -> int:
+        return sum(self.counts.values())
+
+    def stats(self) -> dict:
+        """
+        Counters keyed by event class name.
+        """
+        return {
+            "handled": {t.__name__: n for t, n in self.counts.items()},
+            "unhandled": {t.__name__: n for t, n in self.unhandled.items()},
+        }
@@ -1,6 +1,11 @@
 # core/engine.py
 from datetime import datetime, timezone
 
+from core.clock import WallClock, bind_clock
+from core.dispatcher import HandlerRegistry
+from core.events import MarketEvent, SignalEvent, FillEvent, RiskEvent, RISK_FREEZE, RISK_UNFREEZE
+from core.tracing import Tracer
+
 
 class Engine:
 
@@ -11,32 +16,102 @@ class Engine:
         portfolio_manager,
         risk_engine,
         storage,
+        journal=None,
+        clock=None,
+        tracer=None,
+        scheduler=None,
+        strategies=(),
     ):
         self.oms = oms
         self.position_manager = position_manager
         self.portfolio_manager = portfolio_manager
         self.risk_engine = risk_engine
         self.storage = storage
+        self.journal = journal
+
+        # единые часы для всех компонентов (WallClock live, VirtualClock replay)
+        self.clock = clock or WallClock()
+        # strategies run off the bus, the Engine only hands them its clock
+        bind_clock(self.clock, oms, position_manager, portfolio_manager, risk_engine, *strategies)
+
+        # stage spans signal -> order -> fill -> risk; off until tracer.enable()
+        self.tracer = tracer or Tracer()
 
-        self._processed = 0
+        # PriorityScheduler: fills / risk / signals overtake queued market data
+        self.scheduler = scheduler
+
+        self.handlers = HandlerRegistry()
+        self.handlers.register(MarketEvent, self._handle_market)
+        self.handlers.register(SignalEvent, self._handle_signal)
+        self.handlers.register(RiskEvent, self._handle_risk)
 
     # ------------------------------------------------------------
     # ------------------- Main Loop ------------------------------
     # ------------------------------------------------------------
 
-    def run(self):
+    def run(self, source=None):
+        """
+        Process events from `source` (any iterable, e.g. a RingBuffer);
+        defaults to storage.get_pending_events(). With a scheduler, events
+        are taken in priority order instead of arrival order.
+        """
+        if source is None:
+            source = self.storage.get_pending_events()
+        if self.scheduler is not None:
+            source = self.scheduler.schedule(source)
+
+        dispatch = self.handlers.dispatch
+        journal = self.journal
+        # asynchronous storage (WriteBehindStorage): surface write errors
+        raise_errors = getattr(self.storage, "raise_errors", None)
+        seen = 0
+
+        for event in source:
+            if journal is not None:
+                journal.append(event)
+            dispatch(event)
+            seen += 1
+            if raise_errors is not None:
+                raise_errors()
+
+        return seen
+
+    def dispatch(self, event) -> bool:
+        if self.journal is not None:
+            self.journal.append(event)
+        handled = self.handlers.dispatch(event)
+        raise_errors = getattr(self.storage, "raise_errors", None)
+        if raise_errors is not None:
+            raise_errors()
+        return handled
 
-        for event in self.storage.get_pending_events():
+    # ------------------------------------------------------------
+    # ------------------- Recovery -------------------------------
+    # ------------------------------------------------------------
 
-            if event.__class__.__name__ == "MarketEvent":
-                self._handle_market(event)
+    def recover(self, source) -> int:
+        """
+        Rebuild accounting state from journaled fills.
 
-            elif event.__class__.__name__ == "SignalEvent":
-                self._handle_signal(event)
+        `source` is an EventJournal or any iterable of events. Signals are
+        not re-executed: the fills they produced are in the journal.
+        """
+        if hasattr(source, "replay"):
+            source = source.replay()
 
-            self._processed += 1
+        registry = HandlerRegistry()
+        registry.register(FillEvent, self._apply_fill)
 
-        return self._processed
+        seen = 0
+        for event in source:
+            registry.dispatch(event)
+            seen += 1
+
+        return seen
+
+    @property
+    def processed(self) -> int:
+        return self.handlers.processed
 
     # ------------------------------------------------------------
     # ------------------- Market Handler -------------------------
@@ -52,39 +127,86 @@ class Engine:
             timestamp=event.timestamp,
         )
 
+    # ------------------------------------------------------------
+    # ------------------- Risk Handler ---------------------------
+    # ------------------------------------------------------------
+
+    def _handle_risk(self, event):
+        if self.risk_engine is None:
+            return
+
+        if event.action == RISK_FREEZE:
+            self.risk_engine.freeze(event.symbol)
+        elif event.action == RISK_UNFREEZE:
+            self.risk_engine.unfreeze(event.symbol)
+
     # ------------------------------------------------------------
     # ------------------- Signal Handler -------------------------
     # ------------------------------------------------------------
 
     def _handle_signal(self, event):
 
-        # 1️⃣ Создаем ордер
-        order = self.oms.create_order(event)
+        # 0️⃣ Risk freeze (портфельный, от координатора шардов, или по символу)
+        if self._is_frozen(event.symbol):
+            return
 
-        # 2️⃣ Получаем текущую рыночную цену
-        market_price = getattr(event, "price", 0.0)
-        ts = event.timestamp
+        tracer = self.tracer
+        correlation_id = getattr(event, "correlation_id", None) or event.event_id
 
-        # 3️⃣ Исполняем (partial fills)
-        fills = self.oms.process_order(order, market_price, ts)
+        with tracer.trace(correlation_id):
 
-        # 4️⃣ Accounting на каждый fill
-        for fill in fills:
+            # 1️⃣ Создаем ордер
+            with tracer.span("create_order"):
+                order = self.oms.create_order(event)
 
-            self.position_manager.on_fill(fill)
+            # 2️⃣ Получаем текущую рыночную цену
+            market_price = getattr(event, "price", 0.0)
+            ts = event.timestamp
+
+            # 3️⃣ Исполняем (partial fills)
+            with tracer.span("process_order"):
+                fills = self.oms.process_order(order, market_price, ts)
+
+            # 4️⃣ Accounting на каждый fill (fill пишем в журнал до применения)
+            for fill in fills:
+
+                if self.journal is not None:
+                    with tracer.span("journal"):
+                        self.journal.append(fill)
 
-            state = self.portfolio_manager.on_fill(fill)
+                state = self._apply_fill(fill)
 
-            # 5️⃣ Risk check после обновления портфеля
-            self.risk_engine.evaluate(state)
+                # 5️⃣ Risk check после обновления портфеля
+                with tracer.span("risk"):
+                    self.risk_engine.evaluate(state)
 
-        # 6️⃣ Логируем сигнал
-        self.storage.log_signal(event)
+            # 6️⃣ Логируем сигнал
+            with tracer.span("log_signal"):
+                self.storage.log_signal(event)
+
+            # 7️⃣ Логируем фичи если есть
+            if hasattr(event, "features"):
+                with tracer.span("log_features"):
+                    self.storage.log_features(
+                        event_id=event.event_id,
+                        features=event.features,
+                        timestamp=event.timestamp,
+                    )
+
+    def _is_frozen(self, symbol) -> bool:
+        risk = self.risk_engine
+        if risk is None:
+            return False
+        is_symbol_frozen = getattr(risk, "is_symbol_frozen", None)
+        if is_symbol_frozen is not None:
+            return is_symbol_frozen(symbol)
+        return getattr(risk, "is_frozen", False)
+
+    def _apply_fill(self, fill):
+        tracer = self.tracer
+
+        with tracer.span("position"):
+            self.position_manager.on_fill(fill)
 
-        # 7️⃣ Логируем фичи если есть
-        if hasattr(event, "features"):
-            self.storage.log_features(
-                event_id=event.event_id,
-                features=event.features,
-                timestamp=event.timestamp,
-            )
\ No newline at end of file
+        with tracer.span("portfolio"):
+            return self.portfolio_manager.on_fill(fill)
\ No newline at end of file
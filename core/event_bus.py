@@ -1,26 +1,533 @@
-from collections import defaultdict
+import asyncio
+import inspect
+import itertools
+import time
+from collections import defaultdict, deque
+from fnmatch import fnmatchcase
 from typing import Callable, Type
 
+from core.conflation import ConflatingHandler, conflation_key, merge_ticks
+from core.events import MarketEvent, MarketEventBatch
+from core.metrics import handler_name
+
+
+def _is_pattern(symbol: str) -> bool:
+    return any(c in symbol for c in "*?[")
+
 
 class EventBus:
     """
     Central synchronous event dispatcher.
+
+    Subscriptions are keyed by event type and, optionally, by symbol or a
+    glob pattern over symbols ("*@RTSX"). The handler list for each
+    (type, symbol) is resolved once and cached, so dispatch is one dict
+    lookup and only the interested handlers are called.
+
+    With a `journal`, every event is appended to it before dispatch. With
+    an `instrumentation` (core.metrics.BusInstrumentation), every handler
+    call is timed per event type x handler.
     """
 
-    def __init__(self):
-        self._subscribers = defaultdict(list)
+    def __init__(self, journal=None, instrumentation=None):
+        self._subscribers = defaultdict(list)  # all symbols
+        self._by_symbol = defaultdict(list)    # (type, symbol) -> exact topic
+        self._patterns = defaultdict(list)     # type -> [(pattern, seq, handler)]
+        self._routes = {}                      # (type, symbol) -> handler tuple
+        self._seq = itertools.count()
+        self.journal = journal
+        self.instrumentation = instrumentation
 
-    def subscribe(self, event_type: Type, handler: Callable):
+    def subscribe(
+        self,
+        event_type: Type,
+        handler: Callable,
+        *,
+        symbol: str | None = None,
+        conflate: bool = False,
+    ):
         """
         Register handler for specific event type.
+
+        `symbol` limits the subscription to one symbol or to a glob
+        pattern ("*@RTSX", "NG?6@*"); None means every symbol.
+
+        With `conflate=True` the handler is wrapped in a ConflatingHandler:
+        while it is busy only the newest event per symbol is kept. Returns
+        the registered callable.
         """
-        self._subscribers[event_type].append(handler)
+        if conflate:
+            handler = ConflatingHandler(handler)
+
+        seq = next(self._seq)
+        if symbol is None:
+            self._subscribers[event_type].append((seq, handler))
+        elif _is_pattern(symbol):
+            self._patterns[event_type].append((symbol, seq, handler))
+        else:
+            self._by_symbol[(event_type, symbol)].append((seq, handler))
+
+        self._routes.clear()
+        return handler
+
+    def handlers_for(self, event_type: Type, symbol=None) -> tuple:
+        """
+        Handlers interested in (event_type, symbol), in subscription order.
+        """
+        key = (event_type, symbol)
+        try:
+            return self._routes[key]
+        except KeyError:
+            pass
+
+        entries = list(self._subscribers.get(event_type, ()))
+        if symbol is not None:
+            entries.extend(self._by_symbol.get(key, ()))
+            entries.extend(
+                (seq, handler)
+                for pattern, seq, handler in self._patterns.get(event_type, ())
+                if fnmatchcase(symbol, pattern)
+            )
+        entries.sort(key=lambda entry: entry[0])
+
+        handlers = self._routes[key] = tuple(handler for _, handler in entries)
+        return handlers
+
+    def subscribers(self) -> list:
+        """
+        Every registered handler (unwrapped from ConflatingHandler /
+        Subscription), in subscription order.
+        """
+        entries = [e for entries in self._subscribers.values() for e in entries]
+        entries += [e for entries in self._by_symbol.values() for e in entries]
+        entries += [(seq, h) for entries in self._patterns.values() for _, seq, h in entries]
+        entries.sort(key=lambda entry: entry[0])
+        return [getattr(handler, "handler", handler) for _, handler in entries]
+
+    def has_subscribers(self, event_type: Type) -> bool:
+        return bool(
+            self._subscribers.get(event_type)
+            or self._patterns.get(event_type)
+            or any(t is event_type for t, _ in self._by_symbol)
+        )
 
     def publish(self, event):
         """
         Dispatch event to all subscribed handlers.
         """
-        handlers = self._subscribers.get(type(event), [])
+        if self.journal is not None:
+            self.journal.append(event)
+
+        self._dispatch(event)
+
+    def publish_batch(self, batch: MarketEventBatch):
+        """
+        Deliver a MarketEventBatch: batch-aware subscribers (subscribed to
+        MarketEventBatch) get it once; plain MarketEvent subscribers still
+        receive every event, one by one.
+        """
+        if self.journal is not None:
+            self.journal.append(batch)
+
+        self._dispatch(batch)
+
+        if self.has_subscribers(MarketEvent):
+            for event in batch.events():
+                self._dispatch(event)
+
+    def _dispatch(self, event):
+        event_type = type(event)
+        try:
+            handlers = self._routes[(event_type, getattr(event, "symbol", None))]
+        except KeyError:
+            handlers = self.handlers_for(event_type, getattr(event, "symbol", None))
+
+        inst = self.instrumentation
+        if inst is None:
+            for handler in handlers:
+                handler(event)
+        else:
+            for handler in handlers:
+                inst.call(event_type, handler, event)
+
+
+# ============================================================
+# ASYNC BUS
+# ============================================================
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_CONFLATE = "conflate"
+
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_CONFLATE)
+
+
+class _SubscriberQueue(asyncio.Queue):
+    """
+    Bounded asyncio queue that can conflate pending items in place.
+
+    Items are `[key, event, enqueued_at]` lists. `key` is None unless the
+    owning subscription conflates; then the newest pending item per key
+    is tracked so a fresh event can overwrite it without re-queueing.
+    """
+
+    def _init(self, maxsize):
+        super()._init(maxsize)
+        self._pending = {}
+
+    def _put(self, item):
+        self._queue.append(item)
+        if item[0] is not None:
+            self._pending[item[0]] = item
+
+    def _get(self):
+        item = self._queue.popleft()
+        key = item[0]
+        if key is not None and self._pending.get(key) is item:
+            del self._pending[key]
+        return item
+
+    def pending(self, key):
+        return self._pending.get(key)
+
+
+class Subscription:
+    """
+    One subscriber of the AsyncEventBus: handler + its own bounded queue.
+    """
+
+    def __init__(self, event_type, handler, maxsize, policy, instrumentation=None):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {policy}")
+
+        self.event_type = event_type
+        self.handler = handler
+        self.policy = policy
+        self.queue = _SubscriberQueue(maxsize)
+        self.instrumentation = instrumentation
+
+        self.name = f"{event_type.__name__}:{handler_name(handler)}"
+
+        # blocked puts waiting for room (keeps FIFO for sync publishers)
+        self._waiting = 0
+        # sync publishes under the block policy that found the queue full:
+        # one drain task moves them in order, at most `maxsize` of them
+        self._overflow = deque()
+        self._drainer = None
+
+        # ---- metrics ----
+        self.enqueued = 0
+        self.processed = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.conflated_by_symbol = defaultdict(int)
+        self.errors = 0
+        self.last_error = None
+        self.max_depth = 0
+        self.lag_last = 0.0
+        self.lag_max = 0.0
+        self.lag_total = 0.0
+
+    # ------------------------------------------------------------
+    # ------------------- Enqueue --------------------------------
+    # ------------------------------------------------------------
+
+    def _key(self, event):
+        if self.policy != OVERFLOW_CONFLATE:
+            return None
+        return conflation_key(event)
+
+    def _conflate(self, key, event) -> bool:
+        if key is None:
+            return False
+        item = self.queue.pending(key)
+        if item is None:
+            return False
+        item[1] = merge_ticks(item[1], event)
+        self.conflated += 1
+        self.conflated_by_symbol[key[1]] += 1
+        return True
+
+    def _accepted(self):
+        self.enqueued += 1
+        depth = self.queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def offer(self, event):
+        """
+        Non-blocking enqueue used by the synchronous `publish` path.
+
+        Under the block policy a full queue parks the event in a bounded
+        overflow drained in order by a single task on the running loop.
+        With no running loop, or the overflow full as well, there is no
+        room to wait for: asyncio.QueueFull is raised (publish_async is
+        the backpressured path).
+        """
+        key = self._key(event)
+        if self._conflate(key, event):
+            return
+
+        queue = self.queue
+        item = [key, event, time.perf_counter()]
+
+        if self._waiting == 0 and not self._overflow and not queue.full():
+            queue.put_nowait(item)
+            self._accepted()
+            return
+
+        if self.policy == OVERFLOW_BLOCK:
+            self._park(item)
+            return
+
+        # drop-oldest, and conflate with no pending item for this key
+        queue.get_nowait()
+        queue.task_done()
+        self.dropped += 1
+        queue.put_nowait(item)
+        self._accepted()
+
+    # the bus routes to the subscription itself
+    __call__ = offer
+
+    def _park(self, item):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise asyncio.QueueFull(
+                f"{self.name}: queue full and no running event loop to wait on"
+            ) from None
+
+        if len(self._overflow) >= max(self.queue.maxsize, 1):
+            raise asyncio.QueueFull(
+                f"{self.name}: queue and overflow full ({len(self._overflow)} parked), "
+                "use publish_async for backpressure"
+            )
+
+        self._overflow.append(item)
+        if self._drainer is None:
+            self._drainer = loop.create_task(self._drain_overflow())
+
+    async def put(self, event):
+        """
+        Awaitable enqueue: the block policy waits for room (backpressure).
+        """
+        if self.policy != OVERFLOW_BLOCK:
+            self.offer(event)
+            return
+        while self._drainer is not None:
+            # parked sync publishes go first
+            await asyncio.shield(self._drainer)
+        await self._blocking_put([None, event, time.perf_counter()])
+
+    async def _drain_overflow(self):
+        overflow = self._overflow
+        try:
+            while overflow:
+                # stays parked (so offer keeps queueing behind it) until accepted
+                await self.queue.put(overflow[0])
+                overflow.popleft()
+                self._accepted()
+        finally:
+            self._drainer = None
+
+    async def _blocking_put(self, item):
+        self._waiting += 1
+        try:
+            await self.queue.put(item)
+        finally:
+            self._waiting -= 1
+        self._accepted()
+
+    # ------------------------------------------------------------
+    # ------------------- Consume --------------------------------
+    # ------------------------------------------------------------
+
+    async def run(self):
+        queue = self.queue
+        handler = self.handler
+        inst = self.instrumentation
+        stats = inst.stats_for(self.event_type, handler) if inst is not None else None
+
+        while True:
+            _, event, enqueued_at = await queue.get()
+
+            lag = time.perf_counter() - enqueued_at
+            self.lag_last = lag
+            self.lag_total += lag
+            if lag > self.lag_max:
+                self.lag_max = lag
+
+            start = time.perf_counter_ns()
+            try:
+                result = handler(event)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as exc:
+                self.errors += 1
+                self.last_error = exc
+                if stats is not None:
+                    stats.errors += 1
+                    stats.last_error = exc
+            finally:
+                if stats is not None:
+                    end = time.perf_counter_ns()
+                    inst.record(stats, end - start, end)
+                self.processed += 1
+                queue.task_done()
+
+    def metrics(self) -> dict:
+        return {
+            "depth": self.queue.qsize(),
+            "overflow": len(self._overflow),
+            "max_depth": self.max_depth,
+            "maxsize": self.queue.maxsize,
+            "policy": self.policy,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+            "conflated_by_symbol": dict(self.conflated_by_symbol),
+            "errors": self.errors,
+            "lag_last": self.lag_last,
+            "lag_max": self.lag_max,
+            "lag_avg": self.lag_total / self.processed if self.processed else 0.0,
+        }
+
+
+class AsyncEventBus(EventBus):
+    """
+    Event bus where every subscriber consumes from its own bounded queue.
+
+    `subscribe` / `publish` keep the EventBus signatures, so strategies
+    that publish from inside their handlers work unchanged. A slow handler
+    only backs up its own queue; what happens when that queue is full is
+    decided per subscriber by the overflow policy:
+
+      - "block":        publisher waits for room (use `publish_async`)
+      - "drop_oldest":  oldest queued event is discarded
+      - "conflate":     newest event per (type, symbol) replaces the pending one
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        policy: str = OVERFLOW_BLOCK,
+        journal=None,
+        instrumentation=None,
+    ):
+        super().__init__(journal=journal)
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {policy}")
+
+        # timed in the subscriber workers (handler time), not at enqueue
+        self.handler_instrumentation = instrumentation
+
+        self.maxsize = maxsize
+        self.policy = policy
+
+        self._subscriptions = defaultdict(list)
+        self._tasks = []
+        self._running = False
+
+    # ------------------------------------------------------------
+    # ------------------- Subscribe / Publish --------------------
+    # ------------------------------------------------------------
+
+    def subscribe(
+        self,
+        event_type: Type,
+        handler: Callable,
+        *,
+        symbol: str | None = None,
+        maxsize: int | None = None,
+        policy: str | None = None,
+        conflate: bool = False,
+    ):
+        if conflate:
+            policy = OVERFLOW_CONFLATE
+
+        sub = Subscription(
+            event_type,
+            handler,
+            maxsize=self.maxsize if maxsize is None else maxsize,
+            policy=policy or self.policy,
+            instrumentation=self.handler_instrumentation,
+        )
+        twins = sum(
+            1 for subs in self._subscriptions.values() for s in subs
+            if s.name.split("#")[0] == sub.name
+        )
+        if twins:
+            sub.name = f"{sub.name}#{twins}"
+
+        self._subscriptions[event_type].append(sub)
+        super().subscribe(event_type, sub, symbol=symbol)
+
+        if self._running:
+            self._tasks.append(asyncio.get_running_loop().create_task(sub.run()))
+
+        return sub
+
+    async def publish_async(self, event):
+        """
+        Publish with backpressure: waits while a blocking subscriber is full.
+        """
+        if self.journal is not None:
+            self.journal.append(event)
+
+        for sub in self.handlers_for(type(event), getattr(event, "symbol", None)):
+            await sub.put(event)
+
+    # ------------------------------------------------------------
+    # ------------------- Lifecycle ------------------------------
+    # ------------------------------------------------------------
+
+    async def start(self):
+        if self._running:
+            return
+        self._running = True
+
+        loop = asyncio.get_running_loop()
+        for subs in self._subscriptions.values():
+            for sub in subs:
+                self._tasks.append(loop.create_task(sub.run()))
+
+    async def join(self):
+        """
+        Wait until every subscriber queue is drained, including events
+        published by handlers while draining.
+        """
+        while True:
+            subs = [s for subs in self._subscriptions.values() for s in subs]
+            for sub in subs:
+                await sub.queue.join()
+
+            if all(s.queue.empty() and s._waiting == 0 and not s._overflow for s in subs):
+                return
+            await asyncio.sleep(0)
+
+    async def stop(self):
+        await self.join()
+
+        tasks = self._tasks + [
+            s._drainer for subs in self._subscriptions.values() for s in subs
+            if s._drainer is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._tasks = []
+        self._running = False
+
+    # ------------------------------------------------------------
+    # ------------------- Metrics --------------------------------
+    # ------------------------------------------------------------
 
-        for handler in handlers:
-            handler(event)
\ No newline at end of file
+    def metrics(self) -> dict:
+        return {
+            sub.name: sub.metrics()
+            for subs in self._subscriptions.values()
+            for sub in subs
+        }
@@ -1,11 +1,29 @@
 from .market_event import MarketEvent
+from .quote_event import QuoteEvent
 from .signal_event import SignalEvent
 from .order_event import OrderEvent
 from .fill_event import FillEvent
+from .risk_event import RiskEvent, RISK_FREEZE, RISK_UNFREEZE
+from .timer_event import TimerEvent, TIMER_SESSION_ROLL, TIMER_SNAPSHOT, TIMER_METRICS_FLUSH
+from .market_batch import MarketEventBatch
+from .symbols import SymbolTable, SYMBOLS
+from .codec import EventCodec
 
 __all__ = [
     "MarketEvent",
+    "QuoteEvent",
     "SignalEvent",
     "OrderEvent",
     "FillEvent",
+    "RiskEvent",
+    "RISK_FREEZE",
+    "RISK_UNFREEZE",
+    "TimerEvent",
+    "TIMER_SESSION_ROLL",
+    "TIMER_SNAPSHOT",
+    "TIMER_METRICS_FLUSH",
+    "MarketEventBatch",
+    "SymbolTable",
+    "SYMBOLS",
+    "EventCodec",
 ]
\ No newline at end of file
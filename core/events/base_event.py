@@ -1,8 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from uuid import uuid4
 
 
-@dataclass
+def new_event_id() -> str:
+    return str(uuid4())
+
+
+# slots: no per-instance __dict__ (we keep millions of fills/bars in memory)
+# kw_only: lets the base carry a default id while subclasses add required fields
+@dataclass(slots=True, kw_only=True)
 class BaseEvent:
-    event_id: str
-    timestamp: datetime
\ No newline at end of file
+    event_id: str = field(default_factory=new_event_id)
+    timestamp: datetime
@@ -0,0 +1,326 @@
+import pickle
+import struct
+
+from .fill_event import FillEvent
+from .market_batch import from_epoch_ns, to_epoch_ns
+from .market_event import MarketEvent
+from .order_event import OrderEvent
+from .signal_event import SignalEvent
+from .symbols import SYMBOLS
+
+
+# ------------------------------------------------------------
+# Wire format (little endian)
+#
+#   frame   := tag u8 | body_len u32 | body
+#
+#   SYMBOL  := sid u32 | str
+#   MARKET  := ts | sid u32 | price f64 | volume f64 | id
+#   SIGNAL  := ts | sid u32 | strength f64 | n u16 | values f64[n] | id | signal_type str | name str * n
+#   ORDER   := ts | sid u32 | qty f64 | id | side str
+#   FILL    := ts | sid u32 | qty f64 | price f64 | commission f64 | id | fill_id id | order_id id | side str
+#   PICKLE  := pickle bytes (any other type, incl. subclasses, and signals
+#              whose feature values are not all floats)
+#
+#   str     := len u16 (0xFFFF = None) | utf-8
+#   id      := kind u8 (1 = uuid, 16 raw bytes; 0 = str)
+#   ts      := epoch microseconds i64 (INT64_MIN = None) | naive u8
+#              (1 = naive, read as UTC wall time; 0 = aware, decoded in UTC)
+#
+# Symbol ids are the encoder's SymbolTable ids. A SYMBOL frame is emitted
+# the first time an id goes out on a stream, so decoders build their own
+# id table from the stream itself.
+# ------------------------------------------------------------
+
+TAG_SYMBOL = 0
+TAG_MARKET = 1
+TAG_SIGNAL = 2
+TAG_ORDER = 3
+TAG_FILL = 4
+TAG_PICKLE = 255
+
+_FRAME = struct.Struct("<BI")
+_MARKET = struct.Struct("<qBIdd")
+_SIGNAL = struct.Struct("<qBIdH")
+_ORDER = struct.Struct("<qBId")
+_FILL = struct.Struct("<qBIddd")
+_SID = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+_U8 = struct.Struct("<B")
+
+_NONE_STR = 0xFFFF
+_NONE_FEATURES = 0xFFFF
+_NONE_TS = -(2 ** 63)
+
+
+def _ts_out(ts):
+    if ts is None:
+        return _NONE_TS, 0
+    return to_epoch_ns(ts) // 1000, ts.tzinfo is None
+
+
+def _ts_in(us: int, naive: int):
+    if us == _NONE_TS:
+        return None
+    ts = from_epoch_ns(us * 1000)
+    return ts.replace(tzinfo=None) if naive else ts
+
+
+def _float_features(features) -> bool:
+    # the f64 vector keeps floats (np.float64 included) exactly; anything
+    # else would come back changed, so such signals go out pickled
+    for value in features.values():
+        if not isinstance(value, float):
+            return False
+    return True
+
+
+def _put_str(buf: bytearray, s):
+    if s is None:
+        buf += _U16.pack(_NONE_STR)
+        return
+    raw = s.encode("utf-8")
+    buf += _U16.pack(len(raw))
+    buf += raw
+
+
+def _get_str(view, off):
+    (n,) = _U16.unpack_from(view, off)
+    off += 2
+    if n == _NONE_STR:
+        return None, off
+    return str(view[off:off + n], "utf-8"), off + n
+
+
+def _uuid_str(raw: bytes) -> str:
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def _put_id(buf: bytearray, s):
+    # canonical lowercase uuid4 strings (the common case) go out as 16 bytes;
+    # hex/format directly, uuid.UUID is several times slower
+    if s is not None and len(s) == 36 and s[8] == "-":
+        try:
+            raw = bytes.fromhex(s.replace("-", ""))
+        except ValueError:
+            raw = None
+        if raw is not None and len(raw) == 16 and _uuid_str(raw) == s:
+            buf += b"\x01"
+            buf += raw
+            return
+    buf += b"\x00"
+    _put_str(buf, s)
+
+
+def _get_id(view, off):
+    kind = view[off]
+    off += 1
+    if kind == 1:
+        return _uuid_str(view[off:off + 16]), off + 16
+    return _get_str(view, off)
+
+
+class EventCodec:
+    """
+    Fixed-layout binary codec for core events.
+
+    One codec instance is one stream direction: the encoder remembers which
+    symbol ids it has announced, the decoder which ids it has learned.
+    Decoding works on memoryviews of the input (struct.unpack_from and
+    `cast("d")` for feature vectors), so no intermediate bytes are sliced.
+    """
+
+    def __init__(self, symbols=SYMBOLS):
+        self.symbols = symbols
+        self._announced = set()
+        self._remote = {}
+
+    # ------------------------------------------------------------
+    # ------------------- Encode ---------------------------------
+    # ------------------------------------------------------------
+
+    def encode(self, event) -> bytes:
+        buf = bytearray()
+        self.encode_into(buf, event)
+        return bytes(buf)
+
+    def encode_many(self, events) -> bytes:
+        buf = bytearray()
+        for event in events:
+            self.encode_into(buf, event)
+        return bytes(buf)
+
+    def _sid(self, buf, symbol) -> int:
+        sid = self.symbols.id_of(symbol)
+        if sid not in self._announced:
+            start = self._begin(buf, TAG_SYMBOL)
+            buf += _SID.pack(sid)
+            _put_str(buf, symbol)
+            self._end(buf, start)
+            self._announced.add(sid)
+        return sid
+
+    @staticmethod
+    def _begin(buf, tag) -> int:
+        start = len(buf)
+        buf += _FRAME.pack(tag, 0)
+        return start
+
+    @staticmethod
+    def _end(buf, start):
+        _FRAME.pack_into(buf, start, buf[start], len(buf) - start - _FRAME.size)
+
+    def encode_into(self, buf: bytearray, event):
+        cls = type(event)
+
+        if cls is SignalEvent and event.features and not _float_features(event.features):
+            cls = None
+
+        if cls is MarketEvent:
+            sid = self._sid(buf, event.symbol)
+            start = self._begin(buf, TAG_MARKET)
+            buf += _MARKET.pack(*_ts_out(event.timestamp), sid, event.price, event.volume)
+            _put_id(buf, event.event_id)
+
+        elif cls is SignalEvent:
+            sid = self._sid(buf, event.symbol)
+            features = event.features
+            start = self._begin(buf, TAG_SIGNAL)
+
+            if features is None:
+                buf += _SIGNAL.pack(*_ts_out(event.timestamp), sid, event.strength, _NONE_FEATURES)
+                names = ()
+            else:
+                names = list(features)
+                buf += _SIGNAL.pack(*_ts_out(event.timestamp), sid, event.strength, len(names))
+                buf += struct.pack(f"<{len(names)}d", *(float(features[k]) for k in names))
+
+            _put_id(buf, event.event_id)
+            _put_str(buf, event.signal_type)
+            for name in names:
+                _put_str(buf, name)
+
+        elif cls is OrderEvent:
+            sid = self._sid(buf, event.symbol)
+            start = self._begin(buf, TAG_ORDER)
+            buf += _ORDER.pack(*_ts_out(event.timestamp), sid, event.qty)
+            _put_id(buf, event.event_id)
+            _put_str(buf, event.side)
+
+        elif cls is FillEvent:
+            sid = self._sid(buf, event.symbol)
+            start = self._begin(buf, TAG_FILL)
+            buf += _FILL.pack(
+                *_ts_out(event.timestamp), sid, event.qty, event.price, event.commission
+            )
+            _put_id(buf, event.event_id)
+            _put_id(buf, event.fill_id)
+            _put_id(buf, event.order_id)
+            _put_str(buf, event.side)
+
+        else:
+            start = self._begin(buf, TAG_PICKLE)
+            buf += pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._end(buf, start)
+
+    # ------------------------------------------------------------
+    # ------------------- Decode ---------------------------------
+    # ------------------------------------------------------------
+
+    def decode(self, data) -> list:
+        return list(self.iter_decode(data))
+
+    def iter_decode(self, data):
+        view = memoryview(data)
+        off, end = 0, len(view)
+
+        while off < end:
+            tag, length = _FRAME.unpack_from(view, off)
+            off += _FRAME.size
+            body_end = off + length
+
+            if tag == TAG_SYMBOL:
+                (sid,) = _SID.unpack_from(view, off)
+                symbol, _ = _get_str(view, off + _SID.size)
+                self._remote[sid] = self.symbols.intern(symbol)
+
+            elif tag == TAG_MARKET:
+                ts, naive, sid, price, volume = _MARKET.unpack_from(view, off)
+                event_id, _ = _get_id(view, off + _MARKET.size)
+                yield MarketEvent(
+                    event_id=event_id,
+                    timestamp=_ts_in(ts, naive),
+                    symbol=self._remote[sid],
+                    price=price,
+                    volume=volume,
+                )
+
+            elif tag == TAG_SIGNAL:
+                ts, naive, sid, strength, n = _SIGNAL.unpack_from(view, off)
+                pos = off + _SIGNAL.size
+
+                if n == _NONE_FEATURES:
+                    values, n = None, 0
+                else:
+                    values = view[pos:pos + 8 * n].cast("d")
+                    pos += 8 * n
+
+                event_id, pos = _get_id(view, pos)
+                signal_type, pos = _get_str(view, pos)
+
+                features = None
+                if values is not None:
+                    names = []
+                    for _ in range(n):
+                        name, pos = _get_str(view, pos)
+                        names.append(name)
+                    features = dict(zip(names, values))
+
+                yield SignalEvent(
+                    event_id=event_id,
+                    timestamp=_ts_in(ts, naive),
+                    symbol=self._remote[sid],
+                    signal_type=signal_type,
+                    strength=strength,
+                    features=features,
+                )
+
+            elif tag == TAG_ORDER:
+                ts, naive, sid, qty = _ORDER.unpack_from(view, off)
+                event_id, pos = _get_id(view, off + _ORDER.size)
+                side, _ = _get_str(view, pos)
+                yield OrderEvent(
+                    event_id=event_id,
+                    timestamp=_ts_in(ts, naive),
+                    symbol=self._remote[sid],
+                    side=side,
+                    qty=qty,
+                )
+
+            elif tag == TAG_FILL:
+                ts, naive, sid, qty, price, commission = _FILL.unpack_from(view, off)
+                event_id, pos = _get_id(view, off + _FILL.size)
+                fill_id, pos = _get_id(view, pos)
+                order_id, pos = _get_id(view, pos)
+                side, _ = _get_str(view, pos)
+                yield FillEvent(
+                    event_id=event_id,
+                    timestamp=_ts_in(ts, naive),
+                    fill_id=fill_id,
+                    order_id=order_id,
+                    symbol=self._remote[sid],
+                    side=side,
+                    qty=qty,
+                    price=price,
+                    commission=commission,
+                )
+
+            elif tag == TAG_PICKLE:
+                yield pickle.loads(view[off:body_end])
+
+            else:
+                raise ValueError(f"unknown event frame tag: {tag}")
+
+            off = body_end
@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 from .base_event import BaseEvent
+from .symbols import SYMBOLS
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class FillEvent(BaseEvent):
     fill_id: str
     order_id: str
@@ -11,4 +12,7 @@ class FillEvent(BaseEvent):
     side: str
     qty: float
     price: float
-    commission: float
\ No newline at end of file
+    commission: float
+
+    def __post_init__(self):
+        self.symbol = SYMBOLS.intern(self.symbol)
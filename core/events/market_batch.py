@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from .market_event import MarketEvent
+from .symbols import SYMBOLS
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
+
+
+def to_epoch_ns(ts: datetime) -> int:
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ((ts - _EPOCH) // _US) * 1000
+
+
+def from_epoch_ns(ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(ns) // 1000)
+
+
+class MarketEventBatch:
+    """
+    Struct-of-arrays block of market events.
+
+    One batch of N bars is four NumPy arrays instead of N MarketEvent
+    objects: symbol ids (int32, see SymbolTable), UTC timestamps as int64
+    epoch nanoseconds, prices and volumes (float64). Bulk paths (replay,
+    history loads) work on it with array ops; `events()` is the slow path
+    back to MarketEvent objects for per-event consumers.
+    """
+
+    __slots__ = ("symbol_ids", "ts", "price", "volume", "symbols")
+
+    def __init__(self, symbol_ids, ts, price, volume=None, symbols=SYMBOLS):
+        self.symbol_ids = np.asarray(symbol_ids, dtype=np.int32)
+        self.ts = np.asarray(ts, dtype=np.int64)
+        self.price = np.asarray(price, dtype=np.float64)
+        self.volume = (
+            np.zeros(len(self.price), dtype=np.float64)
+            if volume is None else np.asarray(volume, dtype=np.float64)
+        )
+        self.symbols = symbols
+
+        n = len(self.price)
+        if not (len(self.symbol_ids) == len(self.ts) == len(self.volume) == n):
+            raise ValueError("MarketEventBatch arrays must have equal length")
+
+    # ------------------------------------------------------------
+    # ------------------- Construction ---------------------------
+    # ------------------------------------------------------------
+
+    @classmethod
+    def from_events(cls, events, symbols=SYMBOLS):
+        events = list(events)
+        n = len(events)
+
+        symbol_ids = np.empty(n, dtype=np.int32)
+        ts = np.empty(n, dtype=np.int64)
+        price = np.empty(n, dtype=np.float64)
+        volume = np.empty(n, dtype=np.float64)
+
+        for i, e in enumerate(events):
+            symbol_ids[i] = symbols.id_of(e.symbol)
+            ts[i] = to_epoch_ns(e.timestamp)
+            price[i] = e.price
+            volume[i] = getattr(e, "volume", 0.0)
+
+        return cls(symbol_ids, ts, price, volume, symbols)
+
+    @classmethod
+    def for_symbol(cls, symbol, ts, price, volume=None, symbols=SYMBOLS):
+        """
+        Single-instrument batch straight from arrays (history loads).
+        """
+        price = np.asarray(price, dtype=np.float64)
+        symbol_ids = np.full(len(price), symbols.id_of(symbol), dtype=np.int32)
+        return cls(symbol_ids, ts, price, volume, symbols)
+
+    # ------------------------------------------------------------
+    # ------------------- Access ---------------------------------
+    # ------------------------------------------------------------
+
+    def __len__(self):
+        return len(self.price)
+
+    def events(self):
+        """
+        Slow path: materialize MarketEvent objects one by one.
+        """
+        symbol_of = self.symbols.symbol_of
+        for sid, ts, price, volume in zip(
+            self.symbol_ids.tolist(), self.ts.tolist(), self.price.tolist(), self.volume.tolist()
+        ):
+            symbol = symbol_of(sid)
+            yield MarketEvent(
+                event_id=f"{symbol}:{ts}",
+                timestamp=from_epoch_ns(ts),
+                symbol=symbol,
+                price=price,
+                volume=volume,
+            )
+
+    def select(self, symbol):
+        """
+        Sub-batch of one symbol (boolean-mask copy).
+        """
+        mask = self.symbol_ids == self.symbols.id_of(symbol)
+        return MarketEventBatch(
+            self.symbol_ids[mask], self.ts[mask], self.price[mask], self.volume[mask], self.symbols
+        )
+
+    def last_prices(self) -> dict:
+        """
+        {symbol: last price in the batch}, computed with one np.unique.
+        """
+        if len(self) == 0:
+            return {}
+
+        rev = self.symbol_ids[::-1]
+        sids, first_in_rev = np.unique(rev, return_index=True)
+        last = len(rev) - 1 - first_in_rev
+
+        symbol_of = self.symbols.symbol_of
+        return {
+            symbol_of(sid): price
+            for sid, price in zip(sids.tolist(), self.price[last].tolist())
+        }
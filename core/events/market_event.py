@@ -1,9 +1,14 @@
 from dataclasses import dataclass
 from datetime import datetime
 from .base_event import BaseEvent
+from .symbols import SYMBOLS
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class MarketEvent(BaseEvent):
     symbol: str
-    price: float
\ No newline at end of file
+    price: float
+    volume: float = 0.0
+
+    def __post_init__(self):
+        self.symbol = SYMBOLS.intern(self.symbol)
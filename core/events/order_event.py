@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from datetime import datetime
 from .base_event import BaseEvent
+from .symbols import SYMBOLS
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class OrderEvent(BaseEvent):
     symbol: str
     side: str
     qty: float
+
+    def __post_init__(self):
+        self.symbol = SYMBOLS.intern(self.symbol)
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from .base_event import BaseEvent
+from .symbols import SYMBOLS
+
+
+@dataclass(slots=True, kw_only=True)
+class QuoteEvent(BaseEvent):
+    """
+    Top of book for a symbol. A side without a quote is None.
+    """
+    symbol: str
+    bid: float | None = None
+    ask: float | None = None
+    bid_size: float = 0.0
+    ask_size: float = 0.0
+
+    def __post_init__(self):
+        self.symbol = SYMBOLS.intern(self.symbol)
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from .base_event import BaseEvent
+from .symbols import SYMBOLS
+
+
+RISK_FREEZE = "FREEZE"
+RISK_UNFREEZE = "UNFREEZE"
+
+
+@dataclass(slots=True, kw_only=True)
+class RiskEvent(BaseEvent):
+    """
+    Risk control command (freeze / unfreeze trading). With a symbol only
+    that symbol is frozen / unfrozen; symbol=None means portfolio-wide
+    (an UNFREEZE then lifts every freeze).
+    """
+    action: str
+    symbol: str | None = None
+    reason: str | None = None
+
+    def __post_init__(self):
+        self.symbol = SYMBOLS.intern(self.symbol)
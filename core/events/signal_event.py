@@ -2,11 +2,15 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict, Any
 from .base_event import BaseEvent
+from .symbols import SYMBOLS
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SignalEvent(BaseEvent):
     symbol: str
     signal_type: str
     strength: float
-    features: Optional[Dict[str, Any]] = None
\ No newline at end of file
+    features: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        self.symbol = SYMBOLS.intern(self.symbol)
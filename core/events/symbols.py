@@ -0,0 +1,51 @@
+import sys
+import threading
+
+
+class SymbolTable:
+    """
+    Process-local symbol <-> small-int id table.
+
+    Every symbol string is interned once, so events, positions and batches
+    share one str object per instrument and can carry a compact int id.
+    Ids are dense (0, 1, 2, ...) and never reused.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._symbols = []
+        self._lock = threading.Lock()
+
+    def id_of(self, symbol: str) -> int:
+        sid = self._ids.get(symbol)
+        if sid is not None:
+            return sid
+
+        with self._lock:
+            sid = self._ids.get(symbol)
+            if sid is None:
+                sid = len(self._symbols)
+                self._symbols.append(sys.intern(symbol))
+                self._ids[self._symbols[sid]] = sid
+        return sid
+
+    def symbol_of(self, sid: int) -> str:
+        return self._symbols[sid]
+
+    def intern(self, symbol):
+        if symbol is None:
+            return None
+        return self._symbols[self.id_of(symbol)]
+
+    def symbols(self):
+        return list(self._symbols)
+
+    def __len__(self):
+        return len(self._symbols)
+
+    def __contains__(self, symbol):
+        return symbol in self._ids
+
+
+# shared table of the process
+SYMBOLS = SymbolTable()
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Any
+from .base_event import BaseEvent
+
+
+# well-known timer names
+TIMER_SESSION_ROLL = "session_roll"
+TIMER_SNAPSHOT = "snapshot"
+TIMER_METRICS_FLUSH = "metrics_flush"
+
+
+@dataclass(slots=True, kw_only=True)
+class TimerEvent(BaseEvent):
+    """
+    Emitted by TimerService when a scheduled timer fires. `timestamp` is
+    the scheduled deadline (deterministic under a VirtualClock), not the
+    moment the wheel noticed it.
+    """
+    name: str
+    timer_id: int
+    payload: Any = None
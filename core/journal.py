@@ -0,0 +1,215 @@
+# core/journal.py
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+
+from core.events import EventCodec
+
+
+# length (u32) | crc32 of payload (u32) | sequence (u64)
+_HEADER = struct.Struct("<IIQ")
+
+_SUFFIX = ".journal"
+
+
+class _Segment:
+    """
+    One preallocated, memory-mapped journal file.
+    """
+
+    def __init__(self, path: Path, size: int, readonly: bool = False):
+        self.path = path
+
+        if readonly:
+            self._fd = os.open(path, os.O_RDONLY)
+            size = os.fstat(self._fd).st_size
+            self.mm = mmap.mmap(self._fd, size, access=mmap.ACCESS_READ) if size else None
+        else:
+            self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+            if os.fstat(self._fd).st_size < size:
+                os.ftruncate(self._fd, size)
+            self.mm = mmap.mmap(self._fd, size)
+
+        self.size = size
+
+    def records(self, start: int = 0):
+        """
+        Yield (offset, sequence, payload view) until the zero header that
+        marks the end of written data, or a torn/corrupt record.
+        """
+        mm = self.mm
+        if mm is None:
+            return
+
+        view = memoryview(mm)
+        try:
+            pos = start
+            limit = self.size - _HEADER.size
+            while pos <= limit:
+                length, crc, seq = _HEADER.unpack_from(mm, pos)
+                if length == 0:
+                    return
+
+                end = pos + _HEADER.size + length
+                if end > self.size:
+                    return
+
+                payload = view[pos + _HEADER.size:end]
+                try:
+                    if zlib.crc32(payload) != crc:
+                        return
+                    yield pos, seq, payload
+                finally:
+                    payload.release()
+                pos = end
+        finally:
+            view.release()
+
+    def end(self):
+        """
+        Offset right after the last valid record, and the last sequence.
+        """
+        pos, last_seq = 0, None
+        for offset, seq, payload in self.records():
+            pos = offset + _HEADER.size + len(payload)
+            last_seq = seq
+        return pos, last_seq
+
+    def flush(self):
+        if self.mm is not None:
+            self.mm.flush()
+
+    def close(self):
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+        os.close(self._fd)
+
+
+class EventJournal:
+    """
+    Append-only, length-prefixed event journal on memory-mapped segments.
+
+    Records are written into the page cache through mmap, so they survive a
+    process crash without a blocking fsync; `flush()` forces them to disk.
+    Segments are preallocated files named by index and rotate when full.
+    Each record carries a crc32 so a torn tail write is detected on reopen
+    and ignored. Payloads are EventCodec frames.
+    """
+
+    def __init__(self, directory, segment_size: int = 64 * 1024 * 1024):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+
+        # the journal is one codec stream: symbol ids are announced once per
+        # open, readers always decode from the first segment
+        self.codec = EventCodec()
+
+        self._segment = None
+        self._pos = 0
+        self.next_seq = 0
+
+        indexes = self.segment_indexes()
+        self._index = indexes[-1] if indexes else 0
+        self._open_segment(self._index)
+
+        self._pos, last_seq = self._segment.end()
+        if last_seq is None and len(indexes) > 1:
+            # fresh segment right after a rotation: continue previous numbering
+            previous = _Segment(self._path(indexes[-2]), 0, readonly=True)
+            _, last_seq = previous.end()
+            previous.close()
+        if last_seq is not None:
+            self.next_seq = last_seq + 1
+
+    # ------------------------------------------------------------
+    # ------------------- Segments -------------------------------
+    # ------------------------------------------------------------
+
+    def _path(self, index: int) -> Path:
+        return self.directory / f"{index:08d}{_SUFFIX}"
+
+    def segment_indexes(self):
+        return sorted(
+            int(p.name[: -len(_SUFFIX)])
+            for p in self.directory.glob(f"*{_SUFFIX}")
+        )
+
+    def _open_segment(self, index: int):
+        if self._segment is not None:
+            self._segment.flush()
+            self._segment.close()
+
+        self._index = index
+        self._segment = _Segment(self._path(index), self.segment_size)
+        self._pos = 0
+
+    # ------------------------------------------------------------
+    # ------------------- Write ----------------------------------
+    # ------------------------------------------------------------
+
+    def append(self, event) -> int:
+        payload = self.codec.encode(event)
+        length = len(payload)
+        record_size = _HEADER.size + length
+
+        if record_size > self.segment_size - _HEADER.size:
+            raise ValueError(f"event too large for journal segment: {record_size} bytes")
+
+        # keep room for the zero terminator header
+        if self._pos + record_size > self.segment_size - _HEADER.size:
+            self._open_segment(self._index + 1)
+
+        seq = self.next_seq
+        mm = self._segment.mm
+        pos = self._pos + _HEADER.size
+
+        mm[pos:pos + length] = payload
+        # header last: a crash mid-write leaves a zero/invalid header
+        _HEADER.pack_into(mm, self._pos, length, zlib.crc32(payload), seq)
+
+        self._pos = pos + length
+        self.next_seq = seq + 1
+        return seq
+
+    def flush(self):
+        self._segment.flush()
+
+    def close(self):
+        if self._segment is not None:
+            self._segment.flush()
+            self._segment.close()
+            self._segment = None
+
+    # ------------------------------------------------------------
+    # ------------------- Read -----------------------------------
+    # ------------------------------------------------------------
+
+    def replay(self, from_seq: int = 0):
+        """
+        Yield journaled events in order, starting at `from_seq`.
+        """
+        return read_journal(self.directory, from_seq)
+
+
+def read_journal(directory, from_seq: int = 0):
+    """
+    Fast sequential reader over every segment of a journal directory.
+    """
+    directory = Path(directory)
+    paths = sorted(directory.glob(f"*{_SUFFIX}"))
+    codec = EventCodec()
+
+    for path in paths:
+        segment = _Segment(path, 0, readonly=True)
+        try:
+            for _, seq, payload in segment.records():
+                # decode every record: earlier ones carry symbol definitions
+                events = codec.decode(payload)
+                if seq >= from_seq:
+                    yield from events
+        finally:
+            segment.close()
@@ -1,9 +1,15 @@
+import queue
+import threading
+import time
+
 from core.events import (
     MarketEvent,
     SignalEvent,
     OrderEvent,
     FillEvent,
 )
+from data.quote_cache import QuoteCache
+from execution.oms import OMS
 
 
 class PipelineResult:
@@ -12,9 +18,113 @@ class PipelineResult:
         self.order = order
 
 
+_STOP = object()
+
+
+class PipelineStage:
+    """
+    One pipeline stage on its own thread.
+
+    Takes items from a bounded `inbox`, runs `fn(item)` and forwards a
+    non-None result to the next stage's inbox (blocking put: a slow stage
+    backs up the ones before it instead of growing memory). Exceptions are
+    counted and the item is dropped; the stage keeps running.
+    """
+
+    def __init__(self, name, fn, maxsize=1024):
+        self.name = name
+        self.fn = fn
+        self.inbox = queue.Queue(maxsize)
+        self.next = None
+        self.thread = None
+
+        # ---- metrics ----
+        self.processed = 0
+        self.emitted = 0
+        self.filtered = 0
+        self.errors = 0
+        self.last_error = None
+        self.busy = 0.0
+        self.max_depth = 0
+        self.started_at = None
+        self.stopped_at = None
+
+    def start(self):
+        self.started_at = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, name=f"stage-{self.name}", daemon=True)
+        self.thread.start()
+
+    def put(self, item):
+        self.inbox.put(item)
+        depth = self.inbox.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def _run(self):
+        get, fn, clock = self.inbox.get, self.fn, time.perf_counter
+
+        while True:
+            item = get()
+            if item is _STOP:
+                break
+
+            start = clock()
+            try:
+                result = fn(item)
+            except Exception as exc:
+                self.errors += 1
+                self.last_error = exc
+                result = None
+            self.busy += clock() - start
+            self.processed += 1
+
+            if result is None:
+                self.filtered += 1
+            elif self.next is not None:
+                self.next.put(result)
+                self.emitted += 1
+            else:
+                self.emitted += 1
+
+        self.stopped_at = clock()
+        if self.next is not None:
+            self.next.put(_STOP)
+
+    def join(self, timeout=None):
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def stats(self) -> dict:
+        end = self.stopped_at or time.perf_counter()
+        wall = end - self.started_at if self.started_at else 0.0
+        return {
+            "processed": self.processed,
+            "emitted": self.emitted,
+            "filtered": self.filtered,
+            "errors": self.errors,
+            "depth": self.inbox.qsize(),
+            "max_depth": self.max_depth,
+            "busy_s": self.busy,
+            "utilization": self.busy / wall if wall else 0.0,
+            "per_sec": self.processed / wall if wall else 0.0,
+        }
+
+
 class TradingPipeline:
     """
     Full event-driven trading pipeline (minimal compatible version for tests)
+
+    `run_once` handles one signal serially. `run_forever` streams market
+    data through four threaded stages connected by bounded queues:
+
+        strategy -> sizing/risk -> execution -> accounting/storage
+
+    so broker and database I/O of one event overlap with the strategy and
+    risk work on the next ones. The strategy publishes SignalEvents on
+    `bus` (default: strategy.event_bus); execution goes through the OMS
+    (create_order / process_order, which persists orders and fills) and
+    every fill is applied to `accounting` (PositionManager) and
+    `portfolio` (PortfolioManager), as in Engine._handle_signal.
     """
 
     def __init__(
@@ -28,6 +138,7 @@ class TradingPipeline:
         storage=None,
         sizing_engine=None,
         bus=None,
+        oms=None,
     ):
         self.market_data = market_data
         self.strategy = strategy
@@ -37,7 +148,20 @@ class TradingPipeline:
         self.accounting = accounting
         self.storage = storage
         self.sizing_engine = sizing_engine
-        self.bus = bus
+        self.bus = bus if bus is not None else getattr(strategy, "event_bus", None)
+        if oms is None and execution is not None and storage is not None:
+            oms = OMS(storage=storage, execution_engine=execution)
+        self.oms = oms
+
+        # last tick per symbol: the price a signal is executed at
+        self.quotes = QuoteCache()
+        # fills are applied on the accounting thread, read on the risk one
+        self._books = threading.Lock()
+
+        self.stages = []
+        self._stop = threading.Event()
+        self._running = False
+        self._forwarding = False
 
     def run_once(self):
 
@@ -50,23 +174,151 @@ class TradingPipeline:
         signal = self.strategy.generate()
 
         # -------------------------------------------------
-        # 2. Sizing
+        # 2-3. Sizing + Risk
+        # -------------------------------------------------
+        signal = self._size_and_check(signal)
+
+        if signal is None:
+            return PipelineResult(status="BLOCKED")
+
+        # -------------------------------------------------
+        # Minimal test-compatible return
+        # -------------------------------------------------
+        return PipelineResult(status="ORDER_EXECUTED", order="ORDER")
+
+    def _context(self):
+        for source in (self.portfolio, self.accounting):
+            if hasattr(source, "get_context"):
+                with self._books:
+                    return source.get_context()
+        return None
+
+    def _size_and_check(self, signal):
+        context = self._context() if signal else None
+        if context is None:
+            return signal
+
+        # -------------------------------------------------
+        # Sizing
         # -------------------------------------------------
-        if self.sizing_engine and signal and hasattr(self.portfolio, "get_context"):
-            context = self.portfolio.get_context()
+        if self.sizing_engine:
             signal = self.sizing_engine.size(signal, context)
 
         # -------------------------------------------------
-        # 3. Risk
+        # Risk
         # -------------------------------------------------
-        if self.risk_engine and signal and hasattr(self.portfolio, "get_context"):
-            context = self.portfolio.get_context()
+        if self.risk_engine and signal:
             signal = self.risk_engine.evaluate(signal, context)
 
+        return signal
+
+    # ------------------------------------------------------------
+    # ------------------- Streaming mode -------------------------
+    # ------------------------------------------------------------
+
+    def _strategy_stage(self, event):
+        self.quotes.on_market(event)
+        # signals come back through the bus (_forward_signal)
+        self.strategy.on_market(event)
+        return None
+
+    def _forward_signal(self, signal):
+        # the subscription outlives run_forever: ignore signals between runs
+        if not self._running:
+            return
+        price = getattr(signal, "price", None) or self.quotes.last_price(signal.symbol)
+        self.stages[1].put((signal, price))
+
+    def _risk_stage(self, item):
+        signal, price = item
+        signal = self._size_and_check(signal)
         if signal is None:
-            return PipelineResult(status="BLOCKED")
+            return None
+        return signal, price
 
-        # -------------------------------------------------
-        # Minimal test-compatible return
-        # -------------------------------------------------
-        return PipelineResult(status="ORDER_EXECUTED", order="ORDER")
\ No newline at end of file
+    def _execution_stage(self, item):
+        signal, price = item
+        order = self.oms.create_order(signal, qty=getattr(signal, "qty", 1.0))
+        fills = self.oms.process_order(order, price, signal.timestamp)
+        if not fills:
+            return None
+        return signal, fills
+
+    def _accounting_stage(self, item):
+        signal, fills = item
+
+        # fills and the order status are already persisted by the OMS
+        with self._books:
+            for fill in fills:
+                if self.accounting is not None:
+                    self.accounting.on_fill(fill)
+                if self.portfolio is not None:
+                    self.portfolio.on_fill(fill)
+
+        self.storage.log_signal(signal)
+        if signal.features:
+            self.storage.log_features(
+                event_id=signal.event_id,
+                features=signal.features,
+                timestamp=signal.timestamp,
+            )
+        return fills
+
+    def _market_source(self):
+        source = self.market_data
+        if hasattr(source, "stream"):
+            return source.stream(steps=None)
+        return source
+
+    def run_forever(self, source=None, maxsize: int = 1024) -> dict:
+        """
+        Stream `source` (default: market_data) through the threaded
+        stages until it is exhausted or `stop()` is called; returns the
+        per-stage counters once every stage has drained.
+        """
+        if self.bus is None:
+            raise ValueError("run_forever needs a bus (or a strategy with event_bus)")
+        if source is None:
+            source = self._market_source()
+
+        self._stop.clear()
+        self.stages = [
+            PipelineStage("strategy", self._strategy_stage, maxsize),
+            PipelineStage("risk", self._risk_stage, maxsize),
+            PipelineStage("execution", self._execution_stage, maxsize),
+            PipelineStage("accounting", self._accounting_stage, maxsize),
+        ]
+        for stage, nxt in zip(self.stages, self.stages[1:]):
+            stage.next = nxt
+
+        strategy_stage = self.stages[0]
+        if not self._forwarding:
+            # published from the strategy thread, so ahead of its _STOP
+            self.bus.subscribe(SignalEvent, self._forward_signal)
+            self._forwarding = True
+
+        for stage in self.stages:
+            stage.start()
+        self._running = True
+
+        try:
+            for event in source:
+                if self._stop.is_set():
+                    break
+                strategy_stage.put(event)
+        finally:
+            strategy_stage.put(_STOP)
+            for stage in self.stages:
+                stage.join()
+            self._running = False
+
+        return self.stats()
+
+    def stop(self):
+        """
+        Ask a running `run_forever` to stop after the current event.
+        """
+        self._stop.set()
+
+    def stats(self) -> dict:
+        return {stage.name: stage.stats() for stage in self.stages}
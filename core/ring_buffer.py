@@ -0,0 +1,194 @@
+# core/ring_buffer.py
+import threading
+
+
+class RingBufferClosed(Exception):
+    pass
+
+
+class RingBuffer:
+    """
+    Fixed-capacity event ring between producers and the Engine.
+
+    Disruptor-style: slots are preallocated once and reused. Producers
+    claim a range of sequence numbers, fill those slots and publish the
+    range; the consumer reads everything up to the published cursor as
+    one batch and then releases it. Memory stays flat no matter how long
+    the stream is, and processing starts with the first published event.
+
+    Sequences grow monotonically; slot index = sequence & mask.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._slots = [None] * capacity
+
+        self._claimed = -1      # last sequence handed to a producer
+        self._published = -1    # last sequence visible to the consumer
+        self._consumed = -1     # last sequence released by the consumer
+
+        self._closed = False
+        self._cond = threading.Condition()
+
+    # ------------------------------------------------------------
+    # ------------------- Producer side --------------------------
+    # ------------------------------------------------------------
+
+    def claim(self, n: int = 1) -> int:
+        """
+        Reserve `n` consecutive slots, waiting for the consumer if the ring
+        is full. Returns the first claimed sequence.
+        """
+        if n > self.capacity:
+            raise ValueError("cannot claim more slots than ring capacity")
+
+        with self._cond:
+            while self._claimed + n - self._consumed > self.capacity:
+                if self._closed:
+                    raise RingBufferClosed()
+                self._cond.wait()
+
+            if self._closed:
+                raise RingBufferClosed()
+
+            lo = self._claimed + 1
+            self._claimed += n
+            return lo
+
+    def set(self, sequence: int, event):
+        self._slots[sequence & self._mask] = event
+
+    def publish(self, lo: int, hi: int | None = None):
+        """
+        Make claimed sequences lo..hi visible to the consumer. Ranges are
+        published in claim order, so concurrent producers never expose gaps.
+        """
+        if hi is None:
+            hi = lo
+
+        with self._cond:
+            while self._published != lo - 1:
+                self._cond.wait()
+            self._published = hi
+            self._cond.notify_all()
+
+    def offer(self, event):
+        seq = self.claim(1)
+        self._slots[seq & self._mask] = event
+        self.publish(seq)
+
+    def offer_batch(self, events):
+        n = len(events)
+        if n == 0:
+            return
+
+        lo = self.claim(n)
+        slots, mask = self._slots, self._mask
+        for i, event in enumerate(events):
+            slots[(lo + i) & mask] = event
+        self.publish(lo, lo + n - 1)
+
+    def pump(self, source, batch_size: int = 256, close: bool = True) -> int:
+        """
+        Stream any iterable into the ring in claimed batches.
+        """
+        batch_size = min(batch_size, self.capacity)
+        batch = []
+        count = 0
+
+        try:
+            for event in source:
+                batch.append(event)
+                if len(batch) == batch_size:
+                    self.offer_batch(batch)
+                    count += len(batch)
+                    batch.clear()
+
+            if batch:
+                self.offer_batch(batch)
+                count += len(batch)
+        finally:
+            if close:
+                self.close()
+
+        return count
+
+    def close(self):
+        """
+        Signal end of stream; the consumer stops after draining.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------
+    # ------------------- Consumer side --------------------------
+    # ------------------------------------------------------------
+
+    def _next_batch(self, max_batch: int | None, timeout: float | None):
+        with self._cond:
+            while self._published == self._consumed:
+                if self._closed:
+                    return None
+                if not self._cond.wait(timeout):
+                    return self._consumed + 1, self._consumed
+
+            lo = self._consumed + 1
+            hi = self._published
+
+        if max_batch is not None and hi - lo + 1 > max_batch:
+            hi = lo + max_batch - 1
+        return lo, hi
+
+    def _release(self, hi: int):
+        with self._cond:
+            self._consumed = hi
+            self._cond.notify_all()
+
+    def drain(self, handler, max_batch: int | None = None, timeout: float | None = None) -> int:
+        """
+        Hand one published batch to `handler`, event by event.
+        Returns the batch size, 0 on timeout, -1 once closed and empty.
+        """
+        bounds = self._next_batch(max_batch, timeout)
+        if bounds is None:
+            return -1
+
+        lo, hi = bounds
+        slots, mask = self._slots, self._mask
+        try:
+            for seq in range(lo, hi + 1):
+                handler(slots[seq & mask])
+        finally:
+            if hi >= lo:
+                self._release(hi)
+
+        return hi - lo + 1
+
+    def __iter__(self):
+        slots, mask = self._slots, self._mask
+
+        while True:
+            bounds = self._next_batch(None, None)
+            if bounds is None:
+                return
+
+            lo, hi = bounds
+            for seq in range(lo, hi + 1):
+                yield slots[seq & mask]
+            self._release(hi)
+
+    # ------------------------------------------------------------
+    # ------------------- Introspection --------------------------
+    # ------------------------------------------------------------
+
+    def __len__(self):
+        return self._published - self._consumed
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
@@ -0,0 +1,224 @@
+# core/scheduler.py
+from collections import deque
+from heapq import heappop, heappush
+
+from core.events import (
+    FillEvent, MarketEvent, MarketEventBatch, OrderEvent, RiskEvent, SignalEvent,
+)
+
+
+PRIORITY_FILL = 0
+PRIORITY_RISK = 1
+PRIORITY_SIGNAL = 2
+PRIORITY_MARKET = 3
+
+DEFAULT_PRIORITIES = {
+    FillEvent: PRIORITY_FILL,
+    OrderEvent: PRIORITY_FILL,
+    RiskEvent: PRIORITY_RISK,
+    SignalEvent: PRIORITY_SIGNAL,
+    MarketEvent: PRIORITY_MARKET,
+    MarketEventBatch: PRIORITY_MARKET,
+}
+
+
+class PriorityScheduler:
+    """
+    Reorders an event stream by priority class:
+    fills / orders > risk > signals > market data.
+
+    Order per symbol is kept: an event only becomes eligible once every
+    earlier event of its symbol has gone out, so a higher class overtakes
+    other symbols' events, never an earlier event of its own symbol.
+    Events without a symbol (portfolio-wide risk, market batches) are not
+    held back. Among eligible events of one class arrival order wins.
+    Types are classified along their MRO (cached), unknown types go with
+    market data.
+
+    Fairness: a non-empty class that has been passed over `max_skips`
+    times in a row is served next, so a fill storm cannot starve market
+    data forever.
+    """
+
+    def __init__(self, max_skips: int = 64, window: int = 1024, priorities=None, read_ahead: bool = False):
+        self.max_skips = max_skips
+        self.window = window
+        self.read_ahead = read_ahead
+
+        self.priorities = dict(DEFAULT_PRIORITIES if priorities is None else priorities)
+        self._resolved = {}
+
+        self.n_classes = max(PRIORITY_MARKET, *self.priorities.values()) + 1
+        # per class: heap of (seq, event) of the eligible events
+        self._ready = [[] for _ in range(self.n_classes)]
+        # per symbol: (seq, class, event) waiting behind an earlier event
+        self._held = {}
+        self._skips = [0] * self.n_classes
+        self._seq = 0
+        self._size = 0
+
+        # ---- metrics ----
+        self.scheduled = 0
+        self.overtaken = 0
+        self.forced = 0
+        self.max_depth = 0
+
+    # ------------------------------------------------------------
+    # ------------------- Classification -------------------------
+    # ------------------------------------------------------------
+
+    def register(self, event_type, priority: int):
+        if not 0 <= priority < self.n_classes:
+            raise ValueError(f"priority must be in [0, {self.n_classes})")
+        self.priorities[event_type] = priority
+        self._resolved.clear()
+
+    def priority_of(self, event_type) -> int:
+        try:
+            return self._resolved[event_type]
+        except KeyError:
+            pass
+
+        priority = PRIORITY_MARKET
+        for klass in event_type.__mro__:
+            if klass in self.priorities:
+                priority = self.priorities[klass]
+                break
+
+        self._resolved[event_type] = priority
+        return priority
+
+    # ------------------------------------------------------------
+    # ------------------- Queue ----------------------------------
+    # ------------------------------------------------------------
+
+    def push(self, event):
+        cls = self.priority_of(type(event))
+        seq = self._seq = self._seq + 1
+        symbol = getattr(event, "symbol", None)
+
+        if symbol is None:
+            heappush(self._ready[cls], (seq, event))
+        else:
+            held = self._held.get(symbol)
+            if held is None:
+                # nothing earlier of this symbol pending: eligible right away
+                self._held[symbol] = deque()
+                heappush(self._ready[cls], (seq, event))
+            else:
+                held.append((seq, cls, event))
+
+        self._size += 1
+        if self._size > self.max_depth:
+            self.max_depth = self._size
+
+    def pop(self):
+        """
+        Next event by priority (with the starvation bound), None if empty.
+        """
+        if not self._size:
+            return None
+
+        ready, skips = self._ready, self._skips
+
+        chosen = None
+        for cls, q in enumerate(ready):
+            if q:
+                if chosen is None:
+                    chosen = cls
+                elif skips[cls] >= self.max_skips:
+                    chosen = cls
+                    self.forced += 1
+                    break
+
+        for cls in range(chosen + 1, self.n_classes):
+            if ready[cls]:
+                skips[cls] += 1
+                self.overtaken += 1
+        skips[chosen] = 0
+
+        _, event = heappop(ready[chosen])
+
+        symbol = getattr(event, "symbol", None)
+        if symbol is not None:
+            held = self._held[symbol]
+            if held:
+                seq, cls, nxt = held.popleft()
+                heappush(ready[cls], (seq, nxt))
+            else:
+                del self._held[symbol]
+
+        self._size -= 1
+        self.scheduled += 1
+        return event
+
+    def __len__(self):
+        return self._size
+
+    # ------------------------------------------------------------
+    # ------------------- Streams --------------------------------
+    # ------------------------------------------------------------
+
+    def schedule(self, source):
+        """
+        Yield the events of `source` in priority order, looking at most
+        `window` events ahead, and only at events that are already there:
+
+          - a RingBuffer is topped up without blocking while events are
+            buffered, so a fill published behind a burst of bars goes next
+            as soon as it is in the ring;
+          - an in-memory collection (anything with a length) is read ahead
+            up to `window` events;
+          - any other iterator may block for its next event, so events go
+            out one by one in arrival order, unless `read_ahead` is set
+            (replay of a finite stream, where reading ahead only costs
+            memory, not latency).
+        """
+        if hasattr(source, "drain"):
+            yield from self._schedule_ring(source)
+            return
+
+        push, pop = self.push, self.pop
+        window = self.window if self.read_ahead or hasattr(source, "__len__") else 1
+
+        for event in source:
+            push(event)
+            if self._size >= window:
+                yield pop()
+
+        while self._size:
+            yield pop()
+
+    def _schedule_ring(self, ring):
+        push, pop = self.push, self.pop
+        closed = False
+
+        while True:
+            room = self.window - self._size
+            if not closed and room > 0:
+                # block only when there is nothing buffered to work on
+                n = ring.drain(push, max_batch=room, timeout=None if not self._size else 0)
+                closed = n < 0
+
+            if not self._size:
+                if closed:
+                    return
+                continue
+
+            yield pop()
+
+    def metrics(self) -> dict:
+        depth = [len(q) for q in self._ready]
+        held = 0
+        for waiting in self._held.values():
+            held += len(waiting)
+            for _, cls, _ in waiting:
+                depth[cls] += 1
+        return {
+            "depth": depth,
+            "held": held,
+            "max_depth": self.max_depth,
+            "scheduled": self.scheduled,
+            "overtaken": self.overtaken,
+            "forced": self.forced,
+        }
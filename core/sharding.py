@@ -0,0 +1,350 @@
+# core/sharding.py
+import multiprocessing as mp
+import os
+import queue
+import traceback
+import zlib
+from dataclasses import dataclass, field
+from typing import Callable, Dict
+
+from core.events import EventCodec
+
+
+def shard_for(symbol, n_shards: int) -> int:
+    """
+    Stable symbol -> shard mapping (same in every process, unlike hash()).
+    """
+    if not symbol:
+        return 0
+    return zlib.crc32(str(symbol).encode("utf-8")) % n_shards
+
+
+class ShardError(RuntimeError):
+    """A shard worker failed (raised, or died without reporting)."""
+
+
+@dataclass
+class ShardAggregate:
+    shard: int
+    cash: float = 0.0
+    equity: float = 0.0
+    realized_pnl: float = 0.0
+    unrealized_pnl: float = 0.0
+    daily_realized_pnl: float = 0.0
+    gross_exposure: float = 0.0
+    processed: int = 0
+
+
+@dataclass
+class PortfolioAggregate:
+    """
+    Portfolio-wide view merged from all shards. Quacks like the context
+    RiskEngine.evaluate expects.
+    """
+    cash: float = 0.0
+    equity: float = 0.0
+    realized_pnl: float = 0.0
+    unrealized_pnl: float = 0.0
+    daily_realized_pnl: float = 0.0
+    gross_exposure: float = 0.0
+    drawdown: float = 0.0
+    # today's realized result vs equity without it (RiskEngine daily loss limit)
+    daily_drawdown: float = 0.0
+    processed: int = 0
+    positions: Dict = field(default_factory=dict)
+
+
+def snapshot_engine(shard: int, engine) -> ShardAggregate:
+    """
+    Portfolio numbers of one Engine slice.
+    """
+    portfolio = engine.portfolio_manager
+    positions = getattr(engine.position_manager, "positions", {}) or {}
+
+    market_value = 0.0
+    gross = 0.0
+    for pos in positions.values():
+        price = getattr(pos, "market_price", 0.0) or pos.avg_price
+        market_value += pos.qty * price
+        gross += abs(pos.qty) * price
+
+    cash = float(getattr(portfolio, "cash", 0.0))
+
+    return ShardAggregate(
+        shard=shard,
+        cash=cash,
+        equity=cash + market_value,
+        realized_pnl=float(getattr(portfolio, "realized_pnl", 0.0)),
+        unrealized_pnl=float(getattr(portfolio, "unrealized_pnl", 0.0)),
+        daily_realized_pnl=float(getattr(engine.position_manager, "daily_realized_pnl", 0.0)),
+        gross_exposure=gross,
+        processed=engine.processed,
+    )
+
+
+# ============================================================
+# WORKER
+# ============================================================
+
+def _worker_main(shard, engine_factory, inbox, outbox):
+    try:
+        _worker_loop(shard, engine_factory, inbox, outbox)
+    except BaseException as exc:
+        # the exception itself may not pickle: ship its text
+        detail = "".join(traceback.format_exception(exc))
+        outbox.put(("error", ShardError(f"shard {shard} failed:\n{detail}")))
+        raise SystemExit(1)
+
+
+def _worker_loop(shard, engine_factory, inbox, outbox):
+    engine = engine_factory(shard)
+    dispatch = engine.dispatch
+    codec = EventCodec()
+
+    while True:
+        kind, payload = inbox.get()
+
+        if kind == "events":
+            for event in codec.iter_decode(payload):
+                dispatch(event)
+            outbox.put(("aggregate", snapshot_engine(shard, engine)))
+
+        elif kind == "freeze":
+            if engine.risk_engine is not None:
+                engine.risk_engine.freeze()
+
+        elif kind == "unfreeze":
+            if engine.risk_engine is not None:
+                engine.risk_engine.unfreeze()
+
+        elif kind == "stop":
+            outbox.put(("done", snapshot_engine(shard, engine)))
+            return
+
+
+# ============================================================
+# COORDINATOR
+# ============================================================
+
+class ShardedEngine:
+    """
+    Runs N Engine slices in worker processes, routed by event.symbol.
+
+    `engine_factory(shard)` builds a full Engine (own OMS / PositionManager /
+    RiskEngine) inside the worker; it must be a picklable top-level function
+    when the spawn start method is used.
+
+    The coordinator merges per-shard equity / exposure into one portfolio
+    view and runs the portfolio-wide limits on it with `risk_engine`. When
+    that engine freezes, every shard's RiskEngine is frozen as well; when
+    its freeze is lifted (next day), the shards are unfrozen.
+
+    A worker that raises reports the error on the outbox; the coordinator
+    re-raises it as ShardError (also when a worker dies silently, checked
+    every `poll_interval` seconds while waiting) and stops the rest.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable,
+        n_shards: int | None = None,
+        risk_engine=None,
+        batch_size: int = 256,
+        start_method: str | None = None,
+        poll_interval: float = 1.0,
+    ):
+        self.engine_factory = engine_factory
+        self.n_shards = n_shards or os.cpu_count() or 1
+        self.risk_engine = risk_engine
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+
+        self._ctx = mp.get_context(start_method)
+        self._workers = []
+        self._inboxes = []
+        self._outbox = None
+        self._buffers = [[] for _ in range(self.n_shards)]
+        # one binary stream per shard inbox (symbol ids announced per stream)
+        self._codecs = [EventCodec() for _ in range(self.n_shards)]
+        self._routes = {}
+
+        self.aggregates = {i: ShardAggregate(shard=i) for i in range(self.n_shards)}
+        self.portfolio = PortfolioAggregate()
+        self._peak_equity = None
+        # freeze date broadcast to the shards, None when they run unfrozen
+        self._freeze_sent = None
+
+    # ------------------------------------------------------------
+    # ------------------- Lifecycle ------------------------------
+    # ------------------------------------------------------------
+
+    def start(self):
+        if self._workers:
+            return
+
+        self._outbox = self._ctx.Queue()
+        for shard in range(self.n_shards):
+            inbox = self._ctx.Queue()
+            proc = self._ctx.Process(
+                target=_worker_main,
+                args=(shard, self.engine_factory, inbox, self._outbox),
+                daemon=True,
+            )
+            proc.start()
+            self._inboxes.append(inbox)
+            self._workers.append(proc)
+
+    def stop(self):
+        if not self._workers:
+            return
+
+        try:
+            self.flush()
+            for inbox in self._inboxes:
+                inbox.put(("stop", None))
+
+            pending = set(range(self.n_shards))
+            while pending:
+                kind, agg = self._next_report(pending)
+                self._apply(agg)
+                if kind == "done":
+                    pending.discard(agg.shard)
+
+            for proc in self._workers:
+                proc.join()
+        finally:
+            self._shutdown()
+
+    def _shutdown(self):
+        for proc in self._workers:
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+        self._workers = []
+        self._inboxes = []
+
+    def _next_report(self, pending):
+        """
+        Next shard report; re-raises a worker's error, and fails instead
+        of waiting forever when a shard in `pending` died without one.
+        """
+        while True:
+            try:
+                kind, payload = self._outbox.get(timeout=self.poll_interval)
+            except queue.Empty:
+                for shard in pending:
+                    proc = self._workers[shard]
+                    if not proc.is_alive():
+                        raise ShardError(f"shard {shard} died (exitcode {proc.exitcode})")
+                continue
+
+            if kind == "error":
+                raise payload
+            return kind, payload
+
+    # ------------------------------------------------------------
+    # ------------------- Routing --------------------------------
+    # ------------------------------------------------------------
+
+    def route(self, symbol) -> int:
+        shard = self._routes.get(symbol)
+        if shard is None:
+            shard = self._routes[symbol] = shard_for(symbol, self.n_shards)
+        return shard
+
+    def submit(self, event):
+        shard = self.route(getattr(event, "symbol", None))
+        buf = self._buffers[shard]
+        buf.append(event)
+
+        if len(buf) >= self.batch_size:
+            self._send(shard)
+
+    def flush(self):
+        for shard in range(self.n_shards):
+            if self._buffers[shard]:
+                self._send(shard)
+
+    def _send(self, shard):
+        payload = self._codecs[shard].encode_many(self._buffers[shard])
+        self._inboxes[shard].put(("events", payload))
+        self._buffers[shard] = []
+        self.collect()
+
+    def run(self, source) -> int:
+        """
+        Route every event of `source` to its shard; returns events processed
+        across all shards.
+        """
+        self.start()
+        try:
+            for event in source:
+                self.submit(event)
+        except BaseException:
+            # a shard (or the source) failed: do not wait for the others
+            self._shutdown()
+            raise
+        self.stop()
+
+        return self.portfolio.processed
+
+    # ------------------------------------------------------------
+    # ------------------- Aggregation ----------------------------
+    # ------------------------------------------------------------
+
+    def collect(self):
+        """
+        Merge whatever shard reports have arrived, without blocking.
+        """
+        while True:
+            try:
+                kind, payload = self._outbox.get_nowait()
+            except queue.Empty:
+                return
+            if kind == "error":
+                raise payload
+            self._apply(payload)
+
+    def _apply(self, agg: ShardAggregate):
+        self.aggregates[agg.shard] = agg
+
+        aggs = self.aggregates.values()
+        p = self.portfolio
+        p.cash = sum(a.cash for a in aggs)
+        p.equity = sum(a.equity for a in aggs)
+        p.realized_pnl = sum(a.realized_pnl for a in aggs)
+        p.unrealized_pnl = sum(a.unrealized_pnl for a in aggs)
+        p.daily_realized_pnl = sum(a.daily_realized_pnl for a in aggs)
+        p.gross_exposure = sum(a.gross_exposure for a in aggs)
+        p.processed = sum(a.processed for a in aggs)
+
+        if self._peak_equity is None or p.equity > self._peak_equity:
+            self._peak_equity = p.equity
+        p.drawdown = (
+            (p.equity - self._peak_equity) / self._peak_equity
+            if self._peak_equity else 0.0
+        )
+        day_base = p.equity - p.daily_realized_pnl
+        p.daily_drawdown = p.daily_realized_pnl / day_base if day_base else 0.0
+
+        self._check_risk()
+
+    def _check_risk(self):
+        risk = self.risk_engine
+        if risk is None:
+            return
+
+        # also rolls the day: a freeze from an earlier day is lifted here
+        risk.evaluate(None, self.portfolio)
+
+        if risk.is_frozen:
+            if self._freeze_sent != risk.freeze_date:
+                self._freeze_sent = risk.freeze_date
+                self._broadcast(("freeze", risk.freeze_date))
+        elif self._freeze_sent is not None:
+            self._freeze_sent = None
+            self._broadcast(("unfreeze", None))
+
+    def _broadcast(self, message):
+        for inbox in self._inboxes:
+            inbox.put(message)
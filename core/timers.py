@@ -0,0 +1,232 @@
+# core/timers.py
+import itertools
+import threading
+from datetime import datetime, timedelta
+
+from core.events import MarketEvent, TimerEvent
+from core.events.market_batch import from_epoch_ns, to_epoch_ns
+
+
+class Timer:
+    __slots__ = ("timer_id", "name", "deadline", "interval", "payload", "cancelled", "tick")
+
+    def __init__(self, timer_id, name, deadline, interval, payload):
+        self.timer_id = timer_id
+        self.name = name
+        self.deadline = deadline  # epoch ns
+        self.interval = interval  # ns or None
+        self.payload = payload
+        self.cancelled = False
+        self.tick = None  # bucket the timer currently sits in
+
+    @property
+    def due(self) -> datetime:
+        return from_epoch_ns(self.deadline)
+
+
+class TimerWheel:
+    """
+    Timers bucketed by absolute tick (deadline // tick).
+
+    Schedule and cancel are O(1) dict operations; advancing by one tick
+    pops exactly one bucket, so the cost of a tick depends only on the
+    timers expiring in it, never on how many are registered. A long jump
+    in time (virtual clock over a weekend) visits only the non-empty
+    buckets instead of every tick in between.
+    """
+
+    def __init__(self, tick: timedelta = timedelta(seconds=1)):
+        self.tick_ns = int(tick / timedelta(microseconds=1)) * 1000
+        if self.tick_ns <= 0:
+            raise ValueError("tick must be positive")
+
+        self._buckets = {}
+        self._timers = {}
+        self._ids = itertools.count(1)
+        self._current = None  # last processed tick
+
+    def __len__(self):
+        return len(self._timers)
+
+    def schedule(self, name, deadline_ns: int, interval_ns: int | None = None, payload=None) -> Timer:
+        timer = Timer(next(self._ids), name, deadline_ns, interval_ns, payload)
+        self._timers[timer.timer_id] = timer
+        self._insert(timer)
+        return timer
+
+    def _insert(self, timer):
+        tick = -(-timer.deadline // self.tick_ns)  # ceil: never fire early
+        if self._current is not None and tick <= self._current:
+            tick = self._current + 1
+        bucket = self._buckets.get(tick)
+        if bucket is None:
+            bucket = self._buckets[tick] = {}
+        bucket[timer.timer_id] = timer
+        timer.tick = tick
+
+    def cancel(self, timer) -> bool:
+        timer = self._timers.pop(getattr(timer, "timer_id", timer), None)
+        if timer is None:
+            return False
+        timer.cancelled = True
+        bucket = self._buckets.get(timer.tick)
+        if bucket is not None:
+            bucket.pop(timer.timer_id, None)
+            if not bucket:
+                del self._buckets[timer.tick]
+        return True
+
+    def advance(self, now_ns: int) -> list:
+        """
+        Move to `now_ns`; returns the timers that expired, in deadline
+        order. Periodic timers are re-armed.
+        """
+        target = now_ns // self.tick_ns
+        buckets = self._buckets
+
+        if self._current is None:
+            # first call: timers scheduled in the past are due right away
+            start = min(min(buckets, default=target), target)
+        else:
+            start = self._current + 1
+        if target < start:
+            return []
+
+        if target - start + 1 <= len(buckets):
+            ticks = range(start, target + 1)
+        else:
+            ticks = sorted(t for t in buckets if start <= t <= target)
+
+        self._current = target
+
+        expired = []
+        for t in ticks:
+            bucket = buckets.pop(t, None)
+            if bucket:
+                expired.extend(bucket.values())
+
+        expired.sort(key=lambda timer: (timer.deadline, timer.timer_id))
+
+        fired = []
+        for timer in expired:
+            fired.append((timer, timer.deadline))
+            if timer.interval:
+                # catch up on missed periods in one step, fire once
+                missed = max(0, (now_ns - timer.deadline) // timer.interval)
+                timer.deadline += (missed + 1) * timer.interval
+                self._insert(timer)
+            else:
+                self._timers.pop(timer.timer_id, None)
+        return fired
+
+
+class TimerService:
+    """
+    Timer wheel that publishes TimerEvent on the bus.
+
+    Time comes from `clock` (WallClock live, VirtualClock in replay).
+    `advance()` fires everything due up to clock.now(); it is called by
+    ReplayRunner before each event, by `attach(bus)` on every market
+    event, or by the `start()` thread for wall time with no traffic.
+    """
+
+    def __init__(self, bus, clock, tick: timedelta = timedelta(seconds=1)):
+        self.bus = bus
+        self.clock = clock
+        self.wheel = TimerWheel(tick)
+
+        self._lock = threading.RLock()
+        self._thread = None
+        self._stop = threading.Event()
+
+        # ---- metrics ----
+        self.fired = 0
+
+    # ------------------------------------------------------------
+    # ------------------- Scheduling -----------------------------
+    # ------------------------------------------------------------
+
+    def schedule(
+        self,
+        name: str,
+        *,
+        at: datetime | None = None,
+        after: timedelta | None = None,
+        every: timedelta | None = None,
+        payload=None,
+    ) -> Timer:
+        """
+        One-shot at `at` / after `after`, repeating with `every` (first
+        run at `at`, else one period from now).
+        """
+        if at is None:
+            delay = after if after is not None else every
+            if delay is None:
+                raise ValueError("schedule needs at=, after= or every=")
+            at = self.clock.now() + delay
+
+        interval = None
+        if every is not None:
+            interval = int(every / timedelta(microseconds=1)) * 1000
+            if interval <= 0:
+                raise ValueError("every must be positive")
+
+        with self._lock:
+            return self.wheel.schedule(name, to_epoch_ns(at), interval, payload)
+
+    def cancel(self, timer) -> bool:
+        with self._lock:
+            return self.wheel.cancel(timer)
+
+    # ------------------------------------------------------------
+    # ------------------- Firing ---------------------------------
+    # ------------------------------------------------------------
+
+    def advance(self, now: datetime | None = None) -> int:
+        now = now or self.clock.now()
+
+        with self._lock:
+            fired = self.wheel.advance(to_epoch_ns(now))
+
+        publish = self.bus.publish
+        for timer, deadline in fired:
+            publish(TimerEvent(
+                event_id=f"timer:{timer.timer_id}:{deadline}",
+                timestamp=from_epoch_ns(deadline),
+                name=timer.name,
+                timer_id=timer.timer_id,
+                payload=timer.payload,
+            ))
+        self.fired += len(fired)
+        return len(fired)
+
+    def attach(self, bus, *event_types):
+        """
+        Poll on every event of `event_types` (default: MarketEvent) that
+        goes through `bus`.
+        """
+        for event_type in event_types or (MarketEvent,):
+            bus.subscribe(event_type, lambda event: self.advance())
+
+    def start(self, interval: float = 0.1):
+        """
+        Background polling thread (wall time without event traffic).
+        Timer events are then published from that thread.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop():
+            while not self._stop.wait(interval):
+                self.advance()
+
+        self._thread = threading.Thread(target=loop, name="timer-service", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+from core.metrics import LatencyHistogram
+
+
+class _NullSpan:
+    """
+    Shared no-op context manager handed out while tracing is disabled.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "stage", "start")
+
+    def __init__(self, tracer, stage):
+        self.tracer = tracer
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer._finish(self.stage, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _Trace:
+    __slots__ = ("tracer", "correlation_id", "spans", "start", "outer")
+
+    def __init__(self, tracer, correlation_id):
+        self.tracer = tracer
+        self.correlation_id = correlation_id
+        self.spans = []
+
+    def __enter__(self):
+        local = self.tracer._local
+        self.outer = getattr(local, "trace", None)
+        local.trace = self
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter_ns() - self.start
+        tracer = self.tracer
+        tracer._local.trace = self.outer
+        tracer._stage(Tracer.TOTAL).record(elapsed)
+        tracer.traces.append((self.correlation_id, tuple(self.spans), elapsed))
+        return False
+
+
+class Tracer:
+    """
+    Stage spans for the signal -> order -> fill -> risk path.
+
+    `trace(correlation_id)` opens one trace per signal; `span(stage)` inside
+    it times a stage and tags it with that correlation id. Per-stage
+    latencies go into LatencyHistograms (`breakdown()` -> p50 / p99), the
+    last `history` traces are kept in `traces` as
+    (correlation_id, ((stage, ns), ...), total_ns).
+
+    Switch with `enable()` / `disable()` at any time; disabled, both calls
+    return a shared no-op context manager.
+    """
+
+    TOTAL = "total"
+
+    def __init__(self, enabled: bool = False, history: int = 1000):
+        self.enabled = enabled
+        self.traces = deque(maxlen=history)
+        self._stages = {}
+        self._local = threading.local()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    # ------------------------------------------------------------
+    # ------------------- Spans ----------------------------------
+    # ------------------------------------------------------------
+
+    def trace(self, correlation_id):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Trace(self, correlation_id)
+
+    def span(self, stage: str):
+        if not self.enabled:
+            return NULL_SPAN
+        return _Span(self, stage)
+
+    def _stage(self, stage) -> LatencyHistogram:
+        hist = self._stages.get(stage)
+        if hist is None:
+            hist = self._stages[stage] = LatencyHistogram()
+        return hist
+
+    def _finish(self, stage, elapsed_ns):
+        self._stage(stage).record(elapsed_ns)
+        current = getattr(self._local, "trace", None)
+        if current is not None:
+            current.spans.append((stage, elapsed_ns))
+
+    # ------------------------------------------------------------
+    # ------------------- Export ---------------------------------
+    # ------------------------------------------------------------
+
+    def breakdown(self) -> dict:
+        """
+        {stage: {count, p50_us, p99_us, max_us, mean_us}}
+        """
+        return {
+            stage: {
+                "count": h.count,
+                "p50_us": h.percentile(50) / 1e3,
+                "p99_us": h.percentile(99) / 1e3,
+                "max_us": h.max / 1e3,
+                "mean_us": h.mean / 1e3,
+            }
+            for stage, h in self._stages.items()
+        }
+
+    def trace_of(self, correlation_id):
+        for trace in reversed(self.traces):
+            if trace[0] == correlation_id:
+                return trace
+        return None
+
+    def metric_rows(self, ts=None, prefix: str = "engine.span") -> list:
+        """
+        (metric_name, metric_value, ts) rows in the engine_metrics layout.
+        """
+        ts = ts or datetime.now(timezone.utc)
+        return [
+            (f"{prefix}.{stage}.{key}", float(value), ts)
+            for stage, summary in self.breakdown().items()
+            for key, value in summary.items()
+        ]
+
+    def reset(self):
+        self._stages = {}
+        self.traces.clear()
@@ -0,0 +1,246 @@
+# data/bar_store.py
+import mmap
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from core.bars import COLUMNS, DTYPES, Bars
+from core.events.market_batch import from_epoch_ns, to_epoch_ns
+
+_DAY_NS = 86_400 * 1_000_000_000
+
+
+def _to_ns(value) -> int | None:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return to_epoch_ns(value)
+    return int(value)
+
+
+def _map(path: Path, dtype, length: int):
+    """Read-only zero-copy array over the first `length` items of a file."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        mm = mmap.mmap(fd, length * dtype.itemsize, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+    return np.frombuffer(mm, dtype=dtype)
+
+
+def _day(ns: int) -> str:
+    return datetime.fromtimestamp(ns // _DAY_NS * 86_400, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+class BarStore:
+    """
+    On-disk bar store: <root>/<symbol>/<timeframe>/<YYYY-MM-DD>/<column>,
+    one raw little-endian array per column, opened with np.memmap.
+
+    Partitions are append-only: bars older than (or equal to) the last
+    stored ts of their day are skipped. `ts` is written last, so its
+    length is the committed length of a partition and a torn append is
+    ignored (and overwritten by the next one).
+
+    `partition()` and a single-day `read()` return slices of read-only
+    mmaps: no copy, the OS pages in what is touched. Multi-day reads
+    concatenate the per-day views once; pass `columns` to map only what
+    is used (ts is always included).
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self._open = {}  # (partition dir, column) -> (length, array)
+
+        # ---- metrics ----
+        self.appended = 0
+        self.skipped = 0
+
+    # ------------------------------------------------------------
+    # ------------------- Layout ---------------------------------
+    # ------------------------------------------------------------
+
+    def _series_dir(self, symbol, timeframe) -> Path:
+        return self.root / symbol.replace("/", "_") / timeframe
+
+    def days(self, symbol, timeframe) -> list:
+        try:
+            return sorted(os.listdir(self._series_dir(symbol, timeframe)))
+        except FileNotFoundError:
+            return []
+
+    @staticmethod
+    def _length(path: Path) -> int:
+        try:
+            return os.path.getsize(path / "ts") // DTYPES["ts"].itemsize
+        except FileNotFoundError:
+            return 0
+
+    # ------------------------------------------------------------
+    # ------------------- Reads ----------------------------------
+    # ------------------------------------------------------------
+
+    def partition(self, symbol, timeframe, day: str, columns=COLUMNS) -> Bars:
+        path = self._series_dir(symbol, timeframe) / day
+        length = self._length(path)
+        if not length:
+            return Bars.empty()
+
+        arrays = []
+        for c in COLUMNS:
+            if c != "ts" and c not in columns:
+                arrays.append(None)
+                continue
+            key = (path, c)
+            cached = self._open.get(key)
+            if cached is None or cached[0] != length:
+                cached = self._open[key] = (length, _map(path / c, DTYPES[c], length))
+            arrays.append(cached[1])
+        return Bars(*arrays)
+
+    def iter_range(self, symbol, timeframe, start=None, end=None, columns=COLUMNS):
+        """Per-day views of the bars with start <= ts < end."""
+        start, end = _to_ns(start), _to_ns(end)
+        first = None if start is None else _day(start)
+        last = None if end is None else _day(end - 1)
+
+        for day in self.days(symbol, timeframe):
+            if (first is not None and day < first) or (last is not None and day > last):
+                continue
+
+            bars = self.partition(symbol, timeframe, day, columns)
+            lo = 0 if start is None else int(np.searchsorted(bars.ts, start, "left"))
+            hi = len(bars) if end is None else int(np.searchsorted(bars.ts, end, "left"))
+            if hi > lo:
+                yield bars if (lo, hi) == (0, len(bars)) else bars[lo:hi]
+
+    def read(self, symbol, timeframe, start=None, end=None, columns=COLUMNS) -> Bars:
+        return Bars.concat(self.iter_range(symbol, timeframe, start, end, columns))
+
+    def last_ts(self, symbol, timeframe) -> int | None:
+        for day in reversed(self.days(symbol, timeframe)):
+            bars = self.partition(symbol, timeframe, day, columns=("ts",))
+            if len(bars):
+                return int(bars.ts[-1])
+        return None
+
+    # ------------------------------------------------------------
+    # ------------------- Ingest ---------------------------------
+    # ------------------------------------------------------------
+
+    def append(self, symbol, timeframe, ts, close, open=None, high=None, low=None, volume=None) -> int:
+        """
+        Append bars given as arrays (ts: epoch ns). Returns the number of
+        bars stored.
+        """
+        ts = np.asarray(ts, dtype=np.int64)
+        n = len(ts)
+
+        def column(values, fill):
+            if values is None:
+                return np.full(n, fill, dtype=np.float64)
+            return np.asarray(values, dtype=np.float64)
+
+        cols = {
+            "ts": ts,
+            "open": column(open, np.nan),
+            "high": column(high, np.nan),
+            "low": column(low, np.nan),
+            "close": column(close, np.nan),
+            "volume": column(volume, 0.0),
+        }
+        if not n:
+            return 0
+
+        # time order, last bar wins on duplicate ts
+        order = np.argsort(ts, kind="stable")
+        ts = ts[order]
+        keep = np.append(ts[1:] != ts[:-1], True)
+        cols = {c: v[order][keep] for c, v in cols.items()}
+        ts = cols["ts"]
+
+        stored = 0
+        day_ids = ts // _DAY_NS
+        bounds = np.flatnonzero(np.diff(day_ids)) + 1
+        for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, len(ts)]):
+            stored += self._append_day(symbol, timeframe, {c: v[lo:hi] for c, v in cols.items()})
+
+        self.appended += stored
+        self.skipped += len(ts) - stored
+        return stored
+
+    def _append_day(self, symbol, timeframe, cols) -> int:
+        day = _day(int(cols["ts"][0]))
+        path = self._series_dir(symbol, timeframe) / day
+        path.mkdir(parents=True, exist_ok=True)
+
+        length = self._length(path)
+        if length:
+            current = self.partition(symbol, timeframe, day, columns=("ts",))
+            newer = cols["ts"] > current.ts[-1]
+            if not newer.all():
+                cols = {c: v[newer] for c, v in cols.items()}
+        if not len(cols["ts"]):
+            return 0
+
+        # data columns first (cut back to the committed length), ts last
+        for c in COLUMNS[1:] + ("ts",):
+            with open(path / c, "ab") as f:
+                f.truncate(length * DTYPES[c].itemsize)
+                f.seek(0, os.SEEK_END)
+                f.write(np.ascontiguousarray(cols[c], dtype=DTYPES[c]).tobytes())
+
+        return len(cols["ts"])
+
+    def append_rows(self, symbol, timeframe, rows) -> int:
+        """
+        Append (ts, open, high, low, close, volume) rows, as yielded by
+        PostgresStorage.iter_market_data.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        def floats(i):
+            return np.array([np.nan if r[i] is None else r[i] for r in rows], dtype=np.float64)
+
+        return self.append(
+            symbol,
+            timeframe,
+            ts=np.fromiter((to_epoch_ns(r[0]) for r in rows), dtype=np.int64, count=len(rows)),
+            open=floats(1),
+            high=floats(2),
+            low=floats(3),
+            close=floats(4),
+            volume=np.nan_to_num(floats(5)),
+        )
+
+    def ingest(self, storage, symbol, timeframe, start=None, end=None, chunk_size: int = 100_000) -> int:
+        """
+        Copy market_data bars into the store, chunk by chunk through
+        PostgresStorage.iter_market_data_chunks (ranges larger than RAM
+        are fine). Resumes after the last stored bar unless `start` is
+        given.
+        """
+        if start is None:
+            last = self.last_ts(symbol, timeframe)
+            if last is not None:
+                start = from_epoch_ns(last)
+
+        stored = 0
+        for bars in storage.iter_market_data_chunks(
+            symbol, start=start, end=end, timeframe=timeframe, chunk_size=chunk_size
+        ):
+            stored += self.append(
+                symbol,
+                timeframe,
+                ts=bars.ts,
+                open=bars.open,
+                high=bars.high,
+                low=bars.low,
+                close=bars.close,
+                volume=bars.volume,
+            )
+        return stored
@@ -1,13 +1,33 @@
+import time
 from datetime import datetime, timedelta, timezone
 from storage.postgres import PostgresStorage
 from data.finam_history_client import FinamHistoryClient
 
 
+# Finam interval -> market_data.timeframe
+TIMEFRAMES = {
+    "M1": "1m",
+    "M5": "5m",
+    "M15": "15m",
+    "H1": "1h",
+    "D1": "1d",
+}
+
+# market_data.timeframe -> bar period, seconds
+PERIODS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "1h": 3600,
+    "1d": 86400,
+}
+
+
 class HistoryLoader:
 
-    def __init__(self):
-        self.storage = PostgresStorage()
-        self.client = FinamHistoryClient()
+    def __init__(self, storage=None, client=None):
+        self.storage = storage or PostgresStorage()
+        self.client = client or FinamHistoryClient()
 
     def load(self, symbol, days=365, interval="M5"):
 
@@ -21,12 +41,23 @@ class HistoryLoader:
             end=end
         )
 
-        for c in candles:
-            self.storage.log_market_price(
+        timeframe = TIMEFRAMES.get(interval, interval)
+        rows = (
+            PostgresStorage.market_data_row(
                 symbol=symbol,
+                timeframe=timeframe,
                 timestamp=c["timestamp"],
                 close_price=c["close"],
                 volume=c["volume"]
             )
+            for c in candles
+        )
+
+        # one COPY + one upsert instead of a commit per candle
+        t0 = time.perf_counter()
+        count = self.storage.copy_market_data(rows)
+        elapsed = time.perf_counter() - t0
 
-        print(f"Loaded {len(candles)} candles")
\ No newline at end of file
+        rate = count / elapsed if elapsed > 0 else float("inf")
+        print(f"Loaded {count} candles in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+        return {"rows": count, "seconds": elapsed, "rows_per_sec": rate}
@@ -1,5 +1,7 @@
 import random
-from datetime import datetime, timezone
+from uuid import UUID
+
+from core.clock import WallClock
 from core.events import MarketEvent
 
 
@@ -9,12 +11,18 @@ class DummyMarketData:
     Публикует 3 цены и завершает поток.
     """
 
-    def __init__(self, event_bus, symbol="NGH6@RTSX"):
+    def __init__(self, event_bus, symbol="NGH6@RTSX", clock=None, seed=None):
         self.event_bus = event_bus
         self.symbol = symbol
+        self.clock = clock or WallClock()
+        self._rng = random.Random(seed)
         self._i = 0
         self._prices = [3.10, 3.12, 3.18]
 
+    def _new_id(self) -> str:
+        # from the seeded rng, so a seeded run repeats its event ids too
+        return str(UUID(int=self._rng.getrandbits(128), version=4))
+
     def stream_step(self):
         if self._i >= len(self._prices):
             return False
@@ -24,10 +32,11 @@ class DummyMarketData:
 
         self.event_bus.publish(
             MarketEvent(
+                event_id=self._new_id(),
                 symbol=self.symbol,
                 price=price,
                 volume=1.0,
-                timestamp=datetime.now(timezone.utc)
+                timestamp=self.clock.now(),
             )
         )
         return True
@@ -38,13 +47,14 @@ class DummyMarketData:
         price = 100.0
 
         for _ in range(60):
-            price += random.uniform(-1, 1)
+            price += self._rng.uniform(-1, 1)
 
             self.event_bus.publish(
                 MarketEvent(
+                    event_id=self._new_id(),
                     symbol="NGH6@RTSX",
                     price=price,
                     volume=1.0,
-                    timestamp=datetime.now(timezone.utc),
+                    timestamp=self.clock.now(),
                 )
             )
\ No newline at end of file
@@ -0,0 +1,125 @@
+from datetime import timedelta
+
+from core.clock import WallClock
+from core.events import MarketEvent, QuoteEvent
+
+
+class Quote:
+    __slots__ = ("symbol", "bid", "ask", "last", "ts", "source")
+
+    def __init__(self, symbol, bid=None, ask=None, last=None, ts=None, source="bus"):
+        self.symbol = symbol
+        self.bid = bid
+        self.ask = ask
+        self.last = last
+        self.ts = ts          # event time of the last update, None if loaded from the DB
+        self.source = source  # "bus" or "db"
+
+    @property
+    def mid(self) -> float | None:
+        if self.bid is None or self.ask is None:
+            return None
+        return (self.bid + self.ask) / 2.0
+
+
+class QuoteCache:
+    """
+    Last trade and top of book per symbol, kept current from the bus.
+
+    `attach(bus)` subscribes to MarketEvent (last) and QuoteEvent
+    (bid / ask); every update stamps the symbol with the event time, so
+    `age()` / `is_stale()` tell how old a price is (on the VirtualClock in
+    replay). `last_price` is a drop-in `price_resolver`: it reads memory,
+    and calls `fallback` (e.g. storage.last_price) only on a cold miss,
+    caching what it returns.
+    """
+
+    def __init__(self, fallback=None, clock=None):
+        self.fallback = fallback
+        self.clock = clock or WallClock()
+        self._quotes = {}
+
+        # ---- metrics ----
+        self.hits = 0
+        self.misses = 0
+
+    def attach(self, bus):
+        bus.subscribe(MarketEvent, self.on_market)
+        bus.subscribe(QuoteEvent, self.on_quote)
+        return self
+
+    # ------------------------------------------------------------
+    # ------------------- Updates --------------------------------
+    # ------------------------------------------------------------
+
+    def on_market(self, event):
+        quote = self._quotes.get(event.symbol)
+        if quote is None:
+            self._quotes[event.symbol] = Quote(event.symbol, last=event.price, ts=event.timestamp)
+            return
+        quote.last = event.price
+        quote.ts = event.timestamp
+        quote.source = "bus"
+
+    def on_quote(self, event):
+        quote = self._quotes.get(event.symbol)
+        if quote is None:
+            quote = self._quotes[event.symbol] = Quote(event.symbol)
+        quote.bid = event.bid
+        quote.ask = event.ask
+        quote.ts = event.timestamp
+        quote.source = "bus"
+
+    # ------------------------------------------------------------
+    # ------------------- Reads ----------------------------------
+    # ------------------------------------------------------------
+
+    def quote(self, symbol) -> Quote | None:
+        return self._quotes.get(symbol)
+
+    def last_price(self, symbol: str) -> float:
+        quote = self._quotes.get(symbol)
+        if quote is not None and quote.last is not None:
+            self.hits += 1
+            return quote.last
+
+        self.misses += 1
+        if self.fallback is None:
+            return 0.0
+
+        price = self.fallback(symbol)
+        if not price:
+            # nothing known yet: do not cache, the next tick fills it
+            return 0.0
+
+        if quote is None:
+            self._quotes[symbol] = Quote(symbol, last=float(price), source="db")
+        else:
+            quote.last = float(price)
+        return float(price)
+
+    def bid(self, symbol: str) -> float | None:
+        quote = self._quotes.get(symbol)
+        return None if quote is None else quote.bid
+
+    def ask(self, symbol: str) -> float | None:
+        quote = self._quotes.get(symbol)
+        return None if quote is None else quote.ask
+
+    def age(self, symbol: str) -> timedelta | None:
+        """Time since the last bus update of `symbol`; None if never updated."""
+        quote = self._quotes.get(symbol)
+        if quote is None or quote.ts is None:
+            return None
+        return self.clock.now() - quote.ts
+
+    def is_stale(self, symbol: str, max_age: timedelta) -> bool:
+        age = self.age(symbol)
+        return age is None or age > max_age
+
+    def metrics(self) -> dict:
+        return {
+            "symbols": len(self._quotes),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -1,14 +1,4 @@
-from dataclasses import dataclass
-from datetime import datetime
+# Canonical FillEvent lives in core.events; kept here for old imports.
+from core.events.fill_event import FillEvent
 
-
-@dataclass
-class FillEvent:
-    fill_id: str
-    order_id: str
-    symbol: str
-    side: str
-    qty: float
-    price: float
-    commission: float
-    timestamp: datetime
\ No newline at end of file
+__all__ = ["FillEvent"]
@@ -6,7 +6,7 @@ from typing import List, Optional
 from uuid import uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
 
     # --- Core identity ---
@@ -1,58 +1,87 @@
 # market/sim_feed.py
 
 import random
-from datetime import datetime, timezone
-from uuid import uuid4
+from datetime import timedelta
+from uuid import UUID
 
+from core.clock import WallClock
 from core.events import MarketEvent, SignalEvent
 
 
 class SimMarketFeed:
+    """
+    Random-walk feed. With a `seed` and a VirtualClock the stream is fully
+    reproducible: prices, ids and timestamps (the feed advances the virtual
+    clock by `bar_interval` per step).
+    """
 
-    def __init__(self, symbol="TEST", start_price=100.0):
+    def __init__(
+        self,
+        symbol="TEST",
+        start_price=100.0,
+        clock=None,
+        seed=None,
+        bar_interval=timedelta(minutes=1),
+    ):
         self.symbol = symbol
         self.price = start_price
+        self.clock = clock or WallClock()
+        self.bar_interval = bar_interval
+        self._rng = random.Random(seed)
+
+    def _new_id(self) -> str:
+        return str(UUID(int=self._rng.getrandbits(128), version=4))
 
     def generate(self, steps=20):
+        return list(self.stream(steps))
+
+    def stream(self, steps=20):
+        """
+        Yield events one by one instead of building the whole list;
+        steps=None streams forever.
+        """
 
-        events = []
+        n = 0
 
-        for _ in range(steps):
+        while steps is None or n < steps:
+            n += 1
 
-            change = random.uniform(-1, 1)
+            change = self._rng.uniform(-1, 1)
             self.price += change
 
-            ts = datetime.now(timezone.utc)
+            advance = getattr(self.clock, "advance", None)
+            if advance is not None:
+                advance(self.bar_interval)
+            ts = self.clock.now()
 
             market_event = MarketEvent(
+                event_id=self._new_id(),
                 symbol=self.symbol,
                 price=self.price,
                 volume=100.0,
                 timestamp=ts,
             )
 
-            events.append(market_event)
+            yield market_event
 
             if change > 0.5:
                 signal = SignalEvent(
-                    event_id=str(uuid4()),
+                    event_id=self._new_id(),
                     symbol=self.symbol,
                     signal_type="BUY",
                     strength=1.0,
                     features={},
                     timestamp=ts,
                 )
-                events.append(signal)
+                yield signal
 
             elif change < -0.5:
                 signal = SignalEvent(
-                    event_id=str(uuid4()),
+                    event_id=self._new_id(),
                     symbol=self.symbol,
                     signal_type="SELL",
                     strength=1.0,
                     features={},
                     timestamp=ts,
                 )
-                events.append(signal)
-
-        return events
\ No newline at end of file
+                yield signal
\ No newline at end of file
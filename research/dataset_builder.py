@@ -11,11 +11,17 @@ class DatasetBuilder:
     Builds X (features) and y (labels).
     """
 
-    def __init__(self, storage, window=10, horizon=5):
+    def __init__(self, storage, window=10, horizon=5, bar_store=None, *, timeframe):
         self.storage = storage
         self.window = window
         self.horizon = horizon
 
+        # local BarStore (data/bar_store.py) instead of Postgres, if given
+        self.bar_store = bar_store
+        # market_data.timeframe the bars were loaded as (e.g. "5m"): the
+        # table holds several, and ticks must not be mixed into candles
+        self.timeframe = timeframe
+
         self.feature_engine = FeatureEngine(window=window)
         self.label_engine = LabelEngine(horizon=horizon)
 
@@ -24,23 +30,16 @@ class DatasetBuilder:
     # ---------------------------------------------------
 
     def load_prices(self, symbol):
-        with self.storage.conn.cursor() as cur:
-            cur.execute("""
-                SELECT ts, close
-                FROM historical_prices
-                WHERE symbol = %s
-                ORDER BY ts ASC
-            """, (symbol,))
-
-            rows = cur.fetchall()
+        if self.bar_store is not None:
+            bars = self.bar_store.read(symbol, self.timeframe, columns=("close",))
+        else:
+            # streamed from market_data into preallocated arrays
+            bars = self.storage.load_market_data(symbol, timeframe=self.timeframe, columns=("close",))
 
-        if not rows:
+        if not len(bars):
             return None, None
 
-        timestamps = [r[0] for r in rows]
-        prices = np.array([r[1] for r in rows])
-
-        return timestamps, prices
+        return pd.to_datetime(bars.ts, utc=True), np.asarray(bars.close)
 
     # ---------------------------------------------------
     # BUILD DATASET
@@ -1,3 +1,7 @@
+from core.clock import WALL_CLOCK
+from core.events import TIMER_SESSION_ROLL
+
+
 class RiskEngine:
     """
     RiskEngine 2.1
@@ -15,6 +19,7 @@ class RiskEngine:
         rules=None,
         max_drawdown_pct: float | None = None,
         max_daily_loss_pct: float | None = None,
+        clock=None,
         **kwargs,
     ):
         self.position_manager = position_manager
@@ -26,8 +31,11 @@ class RiskEngine:
         self.correlation_matrix = correlation_matrix or {}
         self.max_daily_loss_pct = max_daily_loss_pct
         self.rules = rules or []
+        self.clock = clock
         self.is_frozen = False
         self.freeze_date = None
+        # symbol -> freeze date; trading in other symbols goes on
+        self.frozen_symbols = {}
         self.base_risk_multiplier = 1.0
         self.current_risk_multiplier = 1.0
         # ---------------------------------
@@ -36,16 +44,63 @@ class RiskEngine:
         self.equity_high_watermark = None
         self.current_drawdown = 0.0
 
+    def _today(self):
+        return (self.clock or WALL_CLOCK).now().date()
+
+    def freeze(self, symbol=None):
+        """
+        Stop trading until the end of the day (same as a limit breach);
+        with `symbol`, only in that symbol.
+        """
+        if symbol is not None:
+            self.frozen_symbols[symbol] = self._today()
+            return
+        self.is_frozen = True
+        self.freeze_date = self._today()
+
+    def unfreeze(self, symbol=None):
+        """
+        Lift the freeze of `symbol`, or every freeze when symbol is None.
+        """
+        if symbol is not None:
+            self.frozen_symbols.pop(symbol, None)
+            return
+        self.is_frozen = False
+        self.freeze_date = None
+        self.frozen_symbols.clear()
+
+    def is_symbol_frozen(self, symbol) -> bool:
+        """
+        Checked before every signal: freezes from an earlier day are
+        lifted first, so a day's freeze ends with the day even when no
+        fill (evaluate) or session-roll timer comes in between.
+        """
+        self._roll_day(self._today())
+        return self.is_frozen or symbol in self.frozen_symbols
+
+    def _roll_day(self, today):
+        if self.freeze_date and self.freeze_date != today:
+            self.is_frozen = False
+            self.freeze_date = None
+        if self.frozen_symbols:
+            self.frozen_symbols = {s: d for s, d in self.frozen_symbols.items() if d == today}
+
+    def on_timer(self, event):
+        """
+        Session roll: lift a freeze from an earlier day right at the
+        rollover, without waiting for the next evaluate().
+        """
+        if event.name != TIMER_SESSION_ROLL:
+            return
+        self._roll_day(self._today())
+
     def evaluate(self, signal=None, context=None):
-        from datetime import datetime
 
         # ---------------------------------
         # Daily reset logic
         # ---------------------------------
-        today = datetime.utcnow().date()
-        if self.freeze_date and self.freeze_date != today:
-            self.is_frozen = False
-            self.freeze_date = None
+        today = self._today()
+        self._roll_day(today)
 
         # ---------------------------------
         # Internal High-Water Mark tracking
@@ -75,6 +130,8 @@ class RiskEngine:
         # ---------------------------------
         if self.is_frozen:
             return None
+        if signal is not None and getattr(signal, "symbol", None) in self.frozen_symbols:
+            return None
 
         # ---------------------------------
         # Daily loss guard
@@ -83,8 +140,7 @@ class RiskEngine:
             daily_dd = getattr(context, "daily_drawdown", None)
             if daily_dd is not None and daily_dd <= -abs(self.max_daily_loss_pct):
                 self.is_frozen = True
-                from datetime import datetime
-                self.freeze_date = datetime.utcnow().date()
+                self.freeze_date = today
                 return None
 
         # ---------------------------------
@@ -105,8 +161,7 @@ class RiskEngine:
                     self.current_risk_multiplier = 1.0
             if dd is not None and dd <= -abs(self.max_drawdown_pct):
                 self.is_frozen = True
-                from datetime import datetime
-                self.freeze_date = datetime.utcnow().date()
+                self.freeze_date = today
                 return None
 
         # ---------------------------------
@@ -0,0 +1,76 @@
+# Serialization benchmark: EventCodec binary frames vs pickle.
+#
+#   python scripts/bench_codec.py [N]
+
+import pickle
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.events import EventCodec, FillEvent, MarketEvent, SignalEvent
+
+
+T0 = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def make(n):
+    events = []
+    for i in range(n):
+        ts = T0 + timedelta(seconds=i)
+        kind = i % 3
+        if kind == 0:
+            events.append(MarketEvent(
+                event_id=str(uuid4()), timestamp=ts, symbol="NGH6@RTSX",
+                price=3.1 + i * 1e-4, volume=10.0,
+            ))
+        elif kind == 1:
+            events.append(SignalEvent(
+                event_id=str(uuid4()), timestamp=ts, symbol="NGH6@RTSX",
+                signal_type="LONG", strength=0.7,
+                features={"ret_1": 0.001, "ret_5": 0.004, "vol": 0.02, "ma_ratio": 1.01},
+            ))
+        else:
+            events.append(FillEvent(
+                event_id=str(uuid4()), timestamp=ts, fill_id=str(uuid4()),
+                order_id=str(uuid4()), symbol="NGH6@RTSX", side="BUY",
+                qty=1.0, price=3.1, commission=0.0,
+            ))
+    return events
+
+
+def bench(name, encode, decode, events):
+    payload = encode(events)
+    enc = min(timeit.repeat(lambda: encode(events), number=1, repeat=3))
+    dec = min(timeit.repeat(lambda: decode(payload), number=1, repeat=3))
+    n = len(events)
+    print(f"{name:<10}{len(payload) / n:>12.1f}{n / enc:>14,.0f}{n / dec:>14,.0f}")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    events = make(n)
+
+    print(f"N={n} (market / signal / fill mix)")
+    print(f"{'format':<10}{'bytes/evt':>12}{'encode ev/s':>14}{'decode ev/s':>14}")
+
+    bench(
+        "pickle",
+        lambda evs: pickle.dumps(evs, protocol=pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+        events,
+    )
+    # fresh codecs per run: the symbol announcement is part of the cost
+    bench(
+        "codec",
+        lambda evs: EventCodec().encode_many(evs),
+        lambda data: EventCodec().decode(data),
+        events,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Memory / allocation benchmark: slotted core.events vs the old __dict__ dataclasses.
+#
+#   python scripts/bench_events.py [N]
+
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core.events import FillEvent
+
+
+# ---- previous layout (plain @dataclass, one str object per symbol) ----
+
+@dataclass
+class LegacyBaseEvent:
+    event_id: str
+    timestamp: datetime
+
+
+@dataclass
+class LegacyFillEvent(LegacyBaseEvent):
+    fill_id: str
+    order_id: str
+    symbol: str
+    side: str
+    qty: float
+    price: float
+    commission: float
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def make(cls, n):
+    # "".join: a fresh symbol str per fill, like strings decoded from DB rows / gRPC
+    return [
+        cls(
+            event_id=f"e{i}",
+            timestamp=TS,
+            fill_id=f"f{i}",
+            order_id=f"o{i}",
+            symbol="".join(("NGH6", "@RTSX")),
+            side="BUY",
+            qty=1.0,
+            price=3.1,
+            commission=0.0,
+        )
+        for i in range(n)
+    ]
+
+
+def measure(cls, n):
+    tracemalloc.start()
+    objs = make(cls, n)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    seconds = min(timeit.repeat(lambda: make(cls, n), number=1, repeat=3))
+    del objs
+    return current, peak, seconds
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    print(f"N={n}")
+    print(f"{'class':<18}{'bytes/obj':>12}{'peak MB':>10}{'build s':>10}")
+    for name, cls in (("legacy dataclass", LegacyFillEvent), ("slotted", FillEvent)):
+        current, peak, seconds = measure(cls, n)
+        print(f"{name:<18}{current / n:>12.1f}{peak / 1e6:>10.1f}{seconds:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import psycopg2
+
+from core.metrics import LatencyHistogram
+from storage.postgres import PostgresStorage
+
+
+class PoolTimeout(RuntimeError):
+    pass
+
+
+class ConnectionPool:
+    """
+    Bounded pool of psycopg2 connections.
+
+    At most `maxconn` connections are open; connections are opened lazily
+    and reused LIFO. `session()` binds one connection to the calling
+    thread / asyncio task (a ContextVar) for the duration of the block;
+    nested sessions reuse it. Waiting for a free connection is measured
+    (wait_histogram, ns) and bounded by `timeout` seconds.
+    """
+
+    def __init__(self, dsn: str, maxconn: int = 8, timeout: float | None = 30.0, connect=None):
+        if maxconn < 1:
+            raise ValueError("maxconn must be >= 1")
+
+        self.dsn = dsn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self._connect = connect or psycopg2.connect
+
+        self._cond = threading.Condition()
+        self._idle = []
+        self._opened = 0
+        self._closed = False
+        self._current = ContextVar(f"pool_session_{id(self)}", default=None)
+
+        # ---- metrics ----
+        self.wait_histogram = LatencyHistogram()
+        self.acquired = 0
+        self.waited = 0
+        self.timeouts = 0
+        self.in_use = 0
+        self.max_in_use = 0
+
+    # ------------------------------------------------------------
+    # ------------------- Checkout -------------------------------
+    # ------------------------------------------------------------
+
+    def acquire(self, block: bool = True):
+        """
+        Check out a connection; with block=False, None instead of waiting
+        when every connection is in use.
+        """
+        start = time.perf_counter_ns()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("connection pool is closed")
+
+            if not self._idle and self._opened >= self.maxconn:
+                if not block:
+                    return None
+                self.waited += 1
+                ok = self._cond.wait_for(
+                    lambda: self._idle or self._opened < self.maxconn or self._closed,
+                    self.timeout,
+                )
+                if not ok:
+                    self.timeouts += 1
+                    raise PoolTimeout(f"no connection free within {self.timeout}s (maxconn={self.maxconn})")
+                if self._closed:
+                    raise RuntimeError("connection pool is closed")
+
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._opened += 1
+
+            self.acquired += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            self.wait_histogram.record(time.perf_counter_ns() - start)
+
+        if conn is None:
+            try:
+                conn = self._connect(self.dsn)
+                conn.autocommit = False
+            except Exception:
+                self._discard()
+                raise
+        return conn
+
+    def release(self, conn):
+        # never hand a half-done transaction to the next session
+        try:
+            if not conn.closed:
+                conn.rollback()
+        except Exception:
+            pass
+
+        if conn.closed:
+            self._discard()
+            return
+
+        with self._cond:
+            self.in_use -= 1
+            if self._closed:
+                self._opened -= 1
+                conn.close()
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+    def _discard(self):
+        with self._cond:
+            self._opened -= 1
+            self.in_use -= 1
+            self._cond.notify()
+
+    # ------------------------------------------------------------
+    # ------------------- Sessions -------------------------------
+    # ------------------------------------------------------------
+
+    def current(self):
+        """Connection of the active session in this thread / task, or None."""
+        return self._current.get()
+
+    @contextmanager
+    def session(self):
+        conn = self._current.get()
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self.acquire()
+        token = self._current.set(conn)
+        try:
+            yield conn
+        finally:
+            try:
+                self._current.reset(token)
+            except ValueError:
+                # generator session finalized from another context
+                self._current.set(None)
+            self.release(conn)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            conn.close()
+
+    def metrics(self) -> dict:
+        h = self.wait_histogram
+        return {
+            "maxconn": self.maxconn,
+            "opened": self._opened,
+            "in_use": self.in_use,
+            "max_in_use": self.max_in_use,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "timeouts": self.timeouts,
+            "wait_p50_us": h.percentile(50) / 1e3,
+            "wait_p99_us": h.percentile(99) / 1e3,
+            "wait_max_us": h.max / 1e3,
+        }
+
+
+def _in_session(method):
+    if inspect.isgeneratorfunction(method):
+        @functools.wraps(method)
+        def gen_wrapper(self, *args, **kwargs):
+            # the connection stays checked out while the caller iterates
+            with self.pool.session():
+                yield from method(self, *args, **kwargs)
+        return gen_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.pool.session():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class PooledStorage(PostgresStorage):
+    """
+    PostgresStorage on a shared ConnectionPool.
+
+    Every public storage method runs in a pool session, so one instance
+    can be shared by the Engine, OMS, strategies and the model loader
+    across threads. `conn` is the connection of the current session; code
+    that uses it directly wraps the work in `with storage.session():`.
+    """
+
+    def __init__(self, pool: ConnectionPool, feature_batch_size: int = 1):
+        self.pool = pool
+        self._init_feature_buffer(feature_batch_size)
+
+    @property
+    def conn(self):
+        conn = self.pool.current()
+        if conn is None:
+            raise RuntimeError("PooledStorage.conn outside a session: use `with storage.session():`")
+        return conn
+
+    def session(self):
+        return self.pool.session()
+
+    @contextmanager
+    def _reader(self):
+        # a second pool connection; none free -> stream on the session's
+        conn = self.pool.acquire(block=False)
+        if conn is None:
+            yield None
+            return
+
+        try:
+            yield conn
+        finally:
+            self.pool.release(conn)
+
+    def close(self):
+        self.flush_features()
+        self.pool.close()
+
+
+for _name, _attr in list(vars(PostgresStorage).items()):
+    if inspect.isfunction(_attr) and not _name.startswith("_") and _name not in vars(PooledStorage):
+        setattr(PooledStorage, _name, _in_session(_attr))
+del _name, _attr
@@ -1,7 +1,13 @@
 import psycopg2
+from psycopg2.extras import execute_values
 import numpy as np
+import threading
+import weakref
+from contextlib import closing, contextmanager
 from pathlib import Path
 
+from core.bars import Bars, COLUMNS as BAR_COLUMNS, DTYPES as BAR_DTYPES
+
 
 def _normalize(value):
     if isinstance(value, np.generic):
@@ -9,15 +15,108 @@ def _normalize(value):
     return value
 
 
+# Per-connection state: resolved schema details and the names of the
+# statements PREPAREd on that connection. Both live as long as the
+# connection, whichever storage (or pool session) is using it.
+_CONN_STATE = weakref.WeakKeyDictionary()
+
+
+def _conn_state(conn) -> dict:
+    state = _CONN_STATE.get(conn)
+    if state is None:
+        state = _CONN_STATE[conn] = {"prepared": set()}
+    return state
+
+
+def _numbered(params: str) -> str:
+    """'(%s, %s::int)' -> '($1, $2::int)'."""
+    parts = params.split("%s")
+    return "".join(
+        part + (f"${i}" if i < len(parts) else "")
+        for i, part in enumerate(parts, 1)
+    )
+
+
+def _copy_value(value) -> str:
+    """One field in COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return (
+            value.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(_normalize(value))
+
+
+class _CopyStream:
+    """
+    File-like reader over an iterable of row tuples, for `copy_expert`.
+
+    Rows are rendered to COPY text lazily, a chunk at a time, so an
+    arbitrarily long candle stream never sits in memory as one string.
+    """
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buf = ""
+        self.count = 0
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = 1 << 16
+
+        parts, length = [self._buf], len(self._buf)
+        for row in self._rows:
+            line = "\t".join(map(_copy_value, row)) + "\n"
+            parts.append(line)
+            length += len(line)
+            self.count += 1
+            if length >= size:
+                break
+
+        data = "".join(parts)
+        out, self._buf = data[:size], data[size:]
+        return out
+
+
+# Logical row groups of the write path, in foreign-key order: signals
+# before the orders that reference them, orders before fills / updates.
+WRITE_ORDER = (
+    "signals",
+    "signal_stubs",
+    "orders",
+    "order_updates",
+    "fills",
+    "market_data",
+    "signal_features",
+    "engine_metrics",
+)
+
+
 class PostgresStorage:
 
+    # opens the dedicated connections long reads stream on (see _reader)
+    dsn = None
+
     def _signals_id_col(self) -> str:
         """Return the column name used to identify a signal row.
 
         Current DB schema uses `signal_id` (v1). Older experiments used `event_id`
-        or `id`. We detect the best available column at runtime to avoid schema
-        drift breaking the runtime.
+        or `id`. We detect the best available column once per connection to
+        avoid schema drift breaking the runtime.
         """
+        state = _conn_state(self.conn)
+        sid = state.get("signals_id_col")
+        if sid is None:
+            sid = state["signals_id_col"] = self._query_signals_id_col()
+        return sid
+
+    def _query_signals_id_col(self) -> str:
         try:
             with self.conn.cursor() as cur:
                 cur.execute(
@@ -41,9 +140,11 @@ class PostgresStorage:
         except Exception:
             return 'signal_id'
 
-    def __init__(self, dsn: str):
+    def __init__(self, dsn: str, feature_batch_size: int = 1):
+        self.dsn = dsn
         self.conn = psycopg2.connect(dsn)
         self.conn.autocommit = False
+        self._init_feature_buffer(feature_batch_size)
 
     # ---------------- MIGRATIONS ----------------
 
@@ -62,6 +163,10 @@ class PostgresStorage:
     # ---------------- SIGNALS ----------------
 
     def log_signal(self, event):
+        self._write_now("signals", [self.signal_row(event)])
+
+    @staticmethod
+    def signal_row(event) -> tuple:
         from uuid import uuid4
 
         # Robust ID resolution across different SignalEvent versions
@@ -76,40 +181,45 @@ class PostgresStorage:
         if strength is None:
             strength = 1.0
 
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO signals (signal_id,
-                                     correlation_id,
-                                     strategy,
-                                     symbol,
-                                     signal_type,
-                                     strength,
-                                     ts,
-                                     processed)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (signal_id) DO UPDATE
-                SET
-                    correlation_id = EXCLUDED.correlation_id,
-                    strategy       = EXCLUDED.strategy,
-                    symbol         = EXCLUDED.symbol,
-                    signal_type    = EXCLUDED.signal_type,
-                    strength       = EXCLUDED.strength,
-                    ts             = EXCLUDED.ts
-                """,
-                (
-                    signal_id,
-                    correlation_id,
-                    strategy,
-                    symbol,
-                    signal_type,
-                    float(strength),
-                    timestamp,
-                    False,
-                ),
-            )
+        return (
+            signal_id,
+            correlation_id,
+            strategy,
+            symbol,
+            signal_type,
+            float(strength),
+            timestamp,
+            False,
+        )
+
+    def _write_signals(self, cur, rows):
+        # one row per signal_id: ON CONFLICT DO UPDATE may not hit a row twice
+        rows = list({row[0]: row for row in rows}.values())
+        self._write_values(
+            cur,
+            "ins_signals",
+            """
+            INSERT INTO signals (signal_id,
+                                 correlation_id,
+                                 strategy,
+                                 symbol,
+                                 signal_type,
+                                 strength,
+                                 ts,
+                                 processed)
+            VALUES %s
+            ON CONFLICT (signal_id) DO UPDATE
+            SET
+                correlation_id = EXCLUDED.correlation_id,
+                strategy       = EXCLUDED.strategy,
+                symbol         = EXCLUDED.symbol,
+                signal_type    = EXCLUDED.signal_type,
+                strength       = EXCLUDED.strength,
+                ts             = EXCLUDED.ts
+            """,
+            rows,
+        )
 
-        self.conn.commit()
     def log_fill(self, event):
         with self.conn.cursor() as cur:
             cur.execute(
@@ -146,15 +256,21 @@ class PostgresStorage:
 
     # ---------------- CLOSE ----------------
 
+    @contextmanager
+    def session(self):
+        """Connection to run several statements on (see PooledStorage)."""
+        yield self.conn
+
     def close(self):
         if self.conn:
+            self.flush_features()
             self.conn.close()
 
     def last_price(self, symbol: str) -> float:
         with self.conn.cursor() as cur:
             cur.execute(
                 """
-                SELECT price
+                SELECT close_price
                 FROM market_data
                 WHERE symbol = %s
                 ORDER BY ts DESC LIMIT 1
@@ -168,8 +284,170 @@ class PostgresStorage:
 
         return 0.0
 
-    def log_market_price(
+    # ---------------- MARKET DATA READS ----------------
+
+    @staticmethod
+    def _market_data_where(symbol, start, end, timeframe) -> tuple:
+        sql = " WHERE symbol = %s"
+        params = [symbol]
+        if timeframe is not None:
+            sql += " AND timeframe = %s"
+            params.append(timeframe)
+        if start is not None:
+            sql += " AND ts >= %s"
+            params.append(start)
+        if end is not None:
+            sql += " AND ts < %s"
+            params.append(end)
+        return sql, params
+
+    @contextmanager
+    def _reader(self):
+        """
+        A connection of its own for one long read, or None when there is
+        none to open (no DSN).
+        """
+        if self.dsn is None:
+            yield None
+            return
+
+        conn = psycopg2.connect(self.dsn)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _stream(self, sql, params, chunk_size):
+        """
+        Yield lists of at most `chunk_size` rows from a named (server-side)
+        cursor: the result set stays in Postgres, only one chunk at a time
+        is held here.
+
+        The cursor runs on a connection of its own (`_reader`), in one
+        read transaction nothing else commits. Without one, it falls back
+        to `self.conn` and is declared WITH HOLD, since writes on that
+        connection (the Engine logging while a replay streams) commit
+        between chunks and a plain named cursor dies with its
+        transaction; a held cursor survives, but Postgres materializes
+        the rest of its result at the first commit.
+        """
+        from uuid import uuid4
+
+        with self._reader() as conn:
+            held = conn is None
+            if held:
+                conn = self.conn
+
+            cur = conn.cursor(name=f"stream_{uuid4().hex}", withhold=held)
+            cur.itersize = chunk_size
+            try:
+                cur.execute(sql, params)
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                cur.close()
+                # end the read transaction the cursor was declared in (if still open)
+                conn.commit()
+
+    def iter_market_data(
+            self,
+            symbol: str,
+            start=None,
+            end=None,
+            timeframe: str | None = None,
+            chunk_size: int = 10_000,
+    ):
+        """Yield (ts, open, high, low, close_price, volume) rows in time order."""
+        where, params = self._market_data_where(symbol, start, end, timeframe)
+        sql = "SELECT ts, open, high, low, close_price, volume FROM market_data" + where + " ORDER BY ts ASC"
+
+        for rows in self._stream(sql, params, chunk_size):
+            yield from rows
+
+    def _bar_select(self, columns) -> tuple:
+        # ts as int64 epoch ns and NaN for missing prices, so rows map
+        # straight onto a fixed-width NumPy record
+        exprs = {
+            "ts": "(EXTRACT(EPOCH FROM ts) * 1000000)::bigint * 1000",
+            "open": "COALESCE(open, 'NaN')",
+            "high": "COALESCE(high, 'NaN')",
+            "low": "COALESCE(low, 'NaN')",
+            "close": "close_price",
+            "volume": "COALESCE(volume, 0)",
+        }
+        names = ["ts"] + [c for c in BAR_COLUMNS[1:] if c in columns]
+        dtype = np.dtype([(c, BAR_DTYPES[c]) for c in names])
+        return "SELECT " + ", ".join(exprs[c] for c in names) + " FROM market_data", dtype
+
+    def iter_market_data_chunks(
+            self,
+            symbol: str,
+            start=None,
+            end=None,
+            timeframe: str | None = None,
+            chunk_size: int = 100_000,
+            columns=BAR_COLUMNS,
+    ):
+        """
+        Yield Bars (see core/bars.py) of at most `chunk_size` bars in
+        time order, streamed through a server-side cursor. Columns not in
+        `columns` are None; ts is always there.
+        """
+        select, dtype = self._bar_select(columns)
+        where, params = self._market_data_where(symbol, start, end, timeframe)
+
+        for rows in self._stream(select + where + " ORDER BY ts ASC", params, chunk_size):
+            records = np.fromiter(rows, dtype=dtype, count=len(rows))
+            yield Bars(*(
+                np.ascontiguousarray(records[c]) if c in dtype.names else None
+                for c in BAR_COLUMNS
+            ))
+
+    def load_market_data(
             self,
+            symbol: str,
+            start=None,
+            end=None,
+            timeframe: str | None = None,
+            chunk_size: int = 100_000,
+            columns=BAR_COLUMNS,
+    ):
+        """
+        Bars of a range in arrays sized up front (one COUNT, then the
+        server-side cursor fills them chunk by chunk): no list of row
+        tuples is ever built for the whole range.
+        """
+        select, dtype = self._bar_select(columns)
+        where, params = self._market_data_where(symbol, start, end, timeframe)
+
+        with self.conn.cursor() as cur:
+            cur.execute("SELECT count(*) FROM market_data" + where, params)
+            total = cur.fetchone()[0]
+
+        out = {c: np.empty(total, dtype=dtype[c]) for c in dtype.names}
+        pos = 0
+        with closing(self._stream(select + where + " ORDER BY ts ASC", params, chunk_size)) as chunks:
+            for rows in chunks:
+                # rows committed after the COUNT are left out
+                rows = rows[:total - pos]
+                records = np.fromiter(rows, dtype=dtype, count=len(rows))
+                for c in dtype.names:
+                    out[c][pos:pos + len(rows)] = records[c]
+                pos += len(rows)
+                if pos >= total:
+                    break
+
+        return Bars(*(out[c][:pos] if c in out else None for c in BAR_COLUMNS))
+
+    def log_market_price(self, **kwargs):
+        """Persist a bar/price point (see `market_data_row` for the kwargs)."""
+        self._write_now("market_data", [self.market_data_row(**kwargs)])
+
+    @staticmethod
+    def market_data_row(
             *,
             symbol: str,
             timestamp=None,
@@ -181,8 +459,8 @@ class PostgresStorage:
             high=None,
             low=None,
             volume: float = 0.0,
-    ):
-        """Persist a bar/price point.
+    ) -> tuple:
+        """market_data row for a bar/price point.
 
         Normalizes caller kwargs to DB schema:
           market_data(symbol, timeframe, open, high, low, close_price, volume, ts)
@@ -220,7 +498,68 @@ class PostgresStorage:
         c = _f(close_price)
         v = float(volume) if volume is not None else 0.0
 
+        return (symbol, timeframe, o, h, l, c, v, ts)
+
+    def _write_market_data(self, cur, rows):
+        rows = list({(row[0], row[1], row[7]): row for row in rows}.values())
+        self._write_values(
+            cur,
+            "ups_market_data",
+            """
+            INSERT INTO market_data (symbol,
+                                     timeframe,
+                                     open,
+                                     high,
+                                     low,
+                                     close_price,
+                                     volume,
+                                     ts)
+            VALUES %s ON CONFLICT (symbol, timeframe, ts)
+            DO
+            UPDATE SET
+                open = EXCLUDED.open,
+                high = EXCLUDED.high,
+                low = EXCLUDED.low,
+                close_price = EXCLUDED.close_price,
+                volume = EXCLUDED.volume
+            """,
+            rows,
+        )
+
+    def copy_market_data(self, rows) -> int:
+        """
+        Bulk ingest of market_data rows (see `market_data_row`).
+
+        Rows are streamed with COPY into a temporary staging table and
+        merged into market_data with one INSERT ... ON CONFLICT (symbol,
+        timeframe, ts) DO UPDATE, so the upsert semantics match
+        `log_market_price`; duplicates within the stream keep the last row.
+        One transaction, one commit. Returns the number of rows streamed.
+        """
+        stream = _CopyStream(rows)
         with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                CREATE TEMP TABLE IF NOT EXISTS market_data_stage (
+                    seq BIGSERIAL,
+                    symbol TEXT,
+                    timeframe TEXT,
+                    open DOUBLE PRECISION,
+                    high DOUBLE PRECISION,
+                    low DOUBLE PRECISION,
+                    close_price DOUBLE PRECISION,
+                    volume DOUBLE PRECISION,
+                    ts TIMESTAMPTZ
+                ) ON COMMIT DELETE ROWS
+                """
+            )
+            cur.copy_expert(
+                """
+                COPY market_data_stage (symbol, timeframe, open, high, low, close_price, volume, ts)
+                FROM STDIN
+                """,
+                stream,
+            )
             cur.execute(
                 """
                 INSERT INTO market_data (symbol,
@@ -231,7 +570,11 @@ class PostgresStorage:
                                          close_price,
                                          volume,
                                          ts)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (symbol, timeframe, ts)
+                SELECT DISTINCT ON (symbol, timeframe, ts)
+                       symbol, timeframe, open, high, low, close_price, volume, ts
+                FROM market_data_stage
+                ORDER BY symbol, timeframe, ts, seq DESC
+                ON CONFLICT (symbol, timeframe, ts)
                 DO
                 UPDATE SET
                     open = EXCLUDED.open,
@@ -239,58 +582,159 @@ class PostgresStorage:
                     low = EXCLUDED.low,
                     close_price = EXCLUDED.close_price,
                     volume = EXCLUDED.volume
-                """,
-                (symbol, timeframe, o, h, l, c, v, ts),
+                """
             )
         self.conn.commit()
-    def log_features(self, symbol: str | None = None, features: dict | None = None, timestamp=None, **kwargs):
+        return stream.count
+
+    def relabel_market_data(
+            self,
+            symbol: str,
+            timeframe: str,
+            period: int,
+            from_timeframe: str = "1m",
+            start=None,
+            end=None,
+    ) -> int:
         """
-        Log features for a symbol at a given timestamp.
+        Backfill for history loaded before candles kept their interval:
+        move `symbol` rows stored as `from_timeframe` to `timeframe`.
+
+        Only rows on the `period`-second candle grid move (live ticks
+        logged under the default 1m in between stay where they are), and
+        only where `timeframe` has no row at that ts yet. One statement,
+        one commit. Returns the number of rows moved.
+        """
+        where, params = self._market_data_where(symbol, start, end, from_timeframe)
+        with self.conn.cursor() as cur:
+            cur.execute(
+                "UPDATE market_data m SET timeframe = %s"
+                + where
+                + """
+                  AND EXTRACT(EPOCH FROM ts)::bigint %% %s = 0
+                  AND NOT EXISTS (
+                      SELECT 1 FROM market_data t
+                      WHERE t.symbol = m.symbol AND t.timeframe = %s AND t.ts = m.ts
+                  )
+                """,
+                [timeframe, *params, period, timeframe],
+            )
+            moved = cur.rowcount
+        self.conn.commit()
+        return moved
 
-        Backward/forward compatible:
-        - symbol may be passed explicitly
-        - or embedded inside an `event`
-        - extra kwargs (e.g. event_id) are ignored
+    def log_features(self, *args, **kwargs):
+        """
+        Log the features of a signal (see `feature_rows`): one multi-row
+        statement per signal, or, with `feature_batch_size` > 1, one for
+        that many signals (pending rows are written by `flush_features`
+        and on close).
         """
-        # Resolve symbol
-        if symbol is None:
-            event = kwargs.get("event")
-            if event is not None:
-                symbol = getattr(event, "symbol", None)
-        if symbol is None:
-            # In SIM / backward-compat flows we may receive feature logs
-            # without explicit symbol. In that case we skip persistence
-            # instead of breaking the pipeline.
+        rows = self.feature_rows(*args, **kwargs)
+        if not rows:
+            return
+
+        if self.feature_batch_size <= 1:
+            self._write_now("signal_features", rows)
             return
 
+        with self._feature_lock:
+            self._feature_buffer.extend(rows)
+            self._feature_signals += 1
+            if self._feature_signals < self.feature_batch_size:
+                return
+            rows, self._feature_buffer, self._feature_signals = self._feature_buffer, [], 0
+        self._write_now("signal_features", rows)
+
+    def flush_features(self):
+        with self._feature_lock:
+            rows, self._feature_buffer, self._feature_signals = self._feature_buffer, [], 0
+        if rows:
+            self._write_now("signal_features", rows)
+
+    def _init_feature_buffer(self, feature_batch_size: int):
+        self.feature_batch_size = feature_batch_size
+        self._feature_lock = threading.Lock()
+        self._feature_buffer = []
+        self._feature_signals = 0
+
+    @staticmethod
+    def feature_rows(signal_id: str | None = None, features: dict | None = None, timestamp=None, **kwargs) -> list:
+        """
+        signal_features rows (signal_id, feature_name, feature_value, ts).
+
+        The signal is identified as in `signal_row`: `signal_id`, else the
+        `event_id` kwarg, else the `event` kwarg. Without one the features
+        are skipped instead of breaking the pipeline. Extra kwargs are
+        ignored.
+        """
+        event = kwargs.get("event")
+
+        # Resolve signal id
+        if signal_id is None:
+            signal_id = kwargs.get("event_id")
+        if signal_id is None and event is not None:
+            signal_id = getattr(event, "signal_id", None) or getattr(event, "event_id", None)
+        if signal_id is None:
+            return []
+
         # Resolve features
-        if features is None:
-            features = kwargs.get("features")
+        if features is None and event is not None:
+            features = getattr(event, "features", None)
         if not features:
-            return
+            return []
 
         # Resolve timestamp
         if timestamp is None:
-            timestamp = kwargs.get("timestamp") or kwargs.get("ts")
-            event = kwargs.get("event")
+            timestamp = kwargs.get("ts")
             if timestamp is None and event is not None:
                 timestamp = getattr(event, "timestamp", None)
 
-        with self.conn.cursor() as cur:
-            for name, value in features.items():
-                cur.execute(
-                    """
-                    INSERT INTO signal_features (symbol, feature_name, feature_value, ts)
-                    VALUES (%s, %s, %s, %s)
-                    """,
-                    (
-                        symbol,
-                        name,
-                        float(value),
-                        timestamp,
-                    ),
-                )
-        self.conn.commit()
+        return [
+            (signal_id, name, None if value is None else float(value), timestamp)
+            for name, value in features.items()
+        ]
+
+    def _write_signal_features(self, cur, rows):
+        # one row per (signal_id, feature_name): the last value wins
+        rows = list({(row[0], row[1]): row for row in rows}.values())
+        self._write_values(
+            cur,
+            "ups_signal_features",
+            """
+            INSERT INTO signal_features (signal_id, feature_name, feature_value, ts)
+            VALUES %s
+            ON CONFLICT (signal_id, feature_name) DO UPDATE
+            SET feature_value = EXCLUDED.feature_value,
+                ts            = EXCLUDED.ts
+            """,
+            rows,
+        )
+
+    # ---------------- ENGINE METRICS ----------------
+
+    def log_engine_metrics(self, rows):
+        """
+        Bulk insert of (metric_name, metric_value, ts) rows.
+        """
+        rows = self.engine_metric_rows(rows)
+        if rows:
+            self._write_now("engine_metrics", rows)
+
+    @staticmethod
+    def engine_metric_rows(rows) -> list:
+        return [(name, _normalize(value), ts) for name, value, ts in rows]
+
+    def _write_engine_metrics(self, cur, rows):
+        self._write_values(
+            cur,
+            "ins_engine_metrics",
+            """
+            INSERT INTO engine_metrics (metric_name, metric_value, ts)
+            VALUES %s
+            """,
+            rows,
+        )
 
     # ------------------------------------------------------------
     # ------------------- Event Source Stub ----------------------
@@ -300,7 +744,7 @@ class PostgresStorage:
         from market.sim_feed import SimMarketFeed
 
         feed = SimMarketFeed()
-        return feed.generate(steps=30)
+        return feed.stream(steps=30)
 
     def save_order(self, order):
         """Persist Order.
@@ -314,6 +758,45 @@ class PostgresStorage:
         We defensively coalesce timestamps to avoid NOT NULL violations when upstream
         constructors forget to set `updated_ts`.
         """
+        stub, row = self.order_rows(order)
+        if stub is None:
+            self._write_now("orders", [row])
+            return
+
+        # stub + order in one statement: the FK is checked at the end of
+        # the statement, after the CTE has inserted the signal
+        sid = self._signals_id_col()
+        with self.conn.cursor() as cur:
+            self._execute_prepared(
+                cur,
+                "ins_order_with_stub",
+                f"""
+                WITH stub AS (
+                    INSERT INTO signals ({sid}, correlation_id, strategy, symbol, signal_type, strength, ts, processed)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                    ON CONFLICT ({sid}) DO NOTHING
+                )
+                INSERT INTO orders (order_id,
+                                    symbol,
+                                    side,
+                                    qty,
+                                    price,
+                                    status,
+                                    signal_event_id,
+                                    created_ts,
+                                    updated_ts,
+                                    filled_qty)
+                VALUES ($9, $10, $11, $12, $13, $14, $15, $16, $17, $18)
+                """,
+                stub + row,
+            )
+        self.conn.commit()
+
+    @staticmethod
+    def order_rows(order):
+        """
+        (signal stub row or None, orders row) for `order`.
+        """
         from datetime import datetime, timezone
 
         created_ts = getattr(order, "created_ts", None)
@@ -326,62 +809,67 @@ class PostgresStorage:
             updated_ts = created_ts
 
         # Ensure the referenced signal row exists to satisfy FK (orders.signal_event_id -> signals.signal_id)
+        stub = None
         signal_event_id = getattr(order, "signal_event_id", None)
         if signal_event_id:
-            sid = self._signals_id_col()
-            with self.conn.cursor() as cur:
-                cur.execute(f"SELECT 1 FROM signals WHERE {sid} = %s", (signal_event_id,))
-                exists = cur.fetchone() is not None
-                if not exists:
-                    # Minimal stub to preserve referential integrity in SIM/DEV runs
-                    cur.execute(
-                        f"""
-                        INSERT INTO signals ({sid}, correlation_id, strategy, symbol, signal_type, strength, ts, processed)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT ({sid}) DO NOTHING
-                        """,
-                        (
-                            signal_event_id,
-                            signal_event_id,
-                            "unknown",
-                            getattr(order, "symbol", None),
-                            getattr(order, "side", None),
-                            0.0,
-                            created_ts,
-                            False,
-                        ),
-                    )
-
-        with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO orders (order_id,
-                                    symbol,
-                                    side,
-                                    qty,
-                                    price,
-                                    status,
-                                    signal_event_id,
-                                    created_ts,
-                                    updated_ts,
-                                    filled_qty)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                (
-                    getattr(order, "order_id"),
-                    getattr(order, "symbol"),
-                    getattr(order, "side"),
-                    float(getattr(order, "qty")),
-                    float(getattr(order, "price")) if getattr(order, "price", None) is not None else None,
-                    getattr(order, "status"),
-                    getattr(order, "signal_event_id", None),
-                    created_ts,
-                    updated_ts,
-                    float(getattr(order, "filled_qty", 0.0) or 0.0),
-                ),
+            # Minimal stub to preserve referential integrity in SIM/DEV runs
+            stub = (
+                signal_event_id,
+                signal_event_id,
+                "unknown",
+                getattr(order, "symbol", None),
+                getattr(order, "side", None),
+                0.0,
+                created_ts,
+                False,
             )
 
-        self.conn.commit()
+        row = (
+            getattr(order, "order_id"),
+            getattr(order, "symbol"),
+            getattr(order, "side"),
+            float(getattr(order, "qty")),
+            float(getattr(order, "price")) if getattr(order, "price", None) is not None else None,
+            getattr(order, "status"),
+            getattr(order, "signal_event_id", None),
+            created_ts,
+            updated_ts,
+            float(getattr(order, "filled_qty", 0.0) or 0.0),
+        )
+        return stub, row
+
+    def _write_signal_stubs(self, cur, rows):
+        sid = self._signals_id_col()
+        self._write_values(
+            cur,
+            "ins_signal_stubs",
+            f"""
+            INSERT INTO signals ({sid}, correlation_id, strategy, symbol, signal_type, strength, ts, processed)
+            VALUES %s
+            ON CONFLICT ({sid}) DO NOTHING
+            """,
+            rows,
+        )
+
+    def _write_orders(self, cur, rows):
+        self._write_values(
+            cur,
+            "ins_orders",
+            """
+            INSERT INTO orders (order_id,
+                                symbol,
+                                side,
+                                qty,
+                                price,
+                                status,
+                                signal_event_id,
+                                created_ts,
+                                updated_ts,
+                                filled_qty)
+            VALUES %s
+            """,
+            rows,
+        )
 
     def update_order_status(
         self,
@@ -400,65 +888,116 @@ class PostgresStorage:
         compatibility but ignored at storage layer (v1 schema does not
         persist avg_fill_price).
         """
-        with self.conn.cursor() as cur:
-            if filled_qty is None:
-                cur.execute(
-                    """
-                    UPDATE orders
-                    SET status = %s,
-                        updated_ts = %s
-                    WHERE order_id = %s
-                    """,
-                    (
-                        status,
-                        ts,
-                        order_id,
-                    ),
-                )
-            else:
-                cur.execute(
-                    """
-                    UPDATE orders
-                    SET status = %s,
-                        updated_ts = %s,
-                        filled_qty = %s
-                    WHERE order_id = %s
-                    """,
-                    (
-                        status,
-                        ts,
-                        float(filled_qty),
-                        order_id,
-                    ),
-                )
-        self.conn.commit()
+        self._write_now(
+            "order_updates",
+            [self.order_update_row(order_id=order_id, status=status, ts=ts, filled_qty=filled_qty)],
+        )
+
+    @staticmethod
+    def order_update_row(*, order_id, status, ts, filled_qty=None, **_) -> tuple:
+        return (
+            order_id,
+            status,
+            ts,
+            None if filled_qty is None else float(filled_qty),
+        )
+
+    def _write_order_updates(self, cur, rows):
+        # last status per order; filled_qty only moves when given
+        merged = {}
+        for order_id, status, ts, filled_qty in rows:
+            prev = merged.get(order_id)
+            if filled_qty is None and prev is not None:
+                filled_qty = prev[3]
+            merged[order_id] = (order_id, status, ts, filled_qty)
+
+        self._write_values(
+            cur,
+            "upd_orders",
+            """
+            UPDATE orders AS o
+            SET status = v.status,
+                updated_ts = v.ts,
+                filled_qty = COALESCE(v.filled_qty, o.filled_qty)
+            FROM (VALUES %s) AS v (order_id, status, ts, filled_qty)
+            WHERE o.order_id = v.order_id
+            """,
+            list(merged.values()),
+            template="(%s, %s, %s::timestamptz, %s::double precision)",
+        )
 
     def save_fill(self, fill):
         """
         Persist FillEvent(fill_id, order_id, symbol, side, qty, price, commission, timestamp).
         """
+        self._write_now("fills", [self.fill_row(fill)])
+
+    @staticmethod
+    def fill_row(fill) -> tuple:
+        return (
+            fill.fill_id,
+            fill.order_id,
+            fill.symbol,
+            fill.side,
+            float(fill.qty),
+            float(fill.price),
+            float(fill.commission),
+            fill.timestamp,
+        )
+
+    def _write_fills(self, cur, rows):
+        self._write_values(
+            cur,
+            "ins_fills",
+            """
+            INSERT INTO fills (fill_id,
+                               order_id,
+                               symbol,
+                               side,
+                               qty,
+                               price,
+                               commission,
+                               ts)
+            VALUES %s ON CONFLICT (fill_id) DO NOTHING
+            """,
+            rows,
+        )
+
+    # ------------------------------------------------------------
+    # ------------------- Row writers ----------------------------
+    # ------------------------------------------------------------
+
+    def write_rows(self, batches):
+        """
+        Write {table: rows} in FK order (WRITE_ORDER) in one transaction,
+        one multi-row statement per table, one commit.
+        """
         with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO fills (fill_id,
-                                   order_id,
-                                   symbol,
-                                   side,
-                                   qty,
-                                   price,
-                                   commission,
-                                   ts)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (fill_id) DO NOTHING
-                """,
-                (
-                    fill.fill_id,
-                    fill.order_id,
-                    fill.symbol,
-                    fill.side,
-                    float(fill.qty),
-                    float(fill.price),
-                    float(fill.commission),
-                    fill.timestamp,
-                ),
-            )
-        self.conn.commit()
\ No newline at end of file
+            for table in WRITE_ORDER:
+                rows = batches.get(table)
+                if rows:
+                    getattr(self, f"_write_{table}")(cur, rows)
+        self.conn.commit()
+
+    def _write_values(self, cur, name, sql, rows, template=None):
+        """
+        Run `sql` (one `VALUES %s`) for `rows`. A single row, the
+        synchronous hot path, runs as the server-side prepared statement
+        `name`; several rows go as one multi-row statement.
+        """
+        if len(rows) != 1:
+            execute_values(cur, sql, rows, template=template)
+            return
+        params = template or "(" + ", ".join(["%s"] * len(rows[0])) + ")"
+        self._execute_prepared(cur, name, sql.replace("%s", _numbered(params)), rows[0])
+
+    def _execute_prepared(self, cur, name, sql, params):
+        # PREPARE once per connection; prepared statements outlive transactions
+        prepared = _conn_state(self.conn)["prepared"]
+        if name not in prepared:
+            cur.execute(f"PREPARE {name} AS {sql}")
+            prepared.add(name)
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+
+    def _write_now(self, table, rows):
+        self.write_rows({table: rows})
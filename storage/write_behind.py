@@ -0,0 +1,263 @@
+import threading
+import time
+from collections import defaultdict, deque
+
+from core.metrics import LatencyHistogram
+
+
+class WriteBehindStorage:
+    """
+    Write-behind front for PostgresStorage.
+
+    The write methods (log_signal, save_order, save_fill,
+    update_order_status, log_market_price, log_features,
+    log_engine_metrics) only build rows and buffer them per table. A
+    background thread writes the buffers with one multi-row statement per
+    table and a single commit, in FK order, once `max_rows` rows are
+    pending or the oldest pending row is `max_delay` seconds old.
+
+    The buffer is bounded: with `max_pending` rows waiting, writers block
+    until the writer thread has taken the batch (backpressure instead of
+    unbounded memory when Postgres stalls). Rows are built when the call
+    is made, so later changes to an Order do not leak into its row, and
+    each table keeps call order.
+
+    Write errors go to an error channel: `on_error(exc)` is called from
+    the writer thread, and `raise_errors()` re-raises them in the caller
+    (the Engine calls it after every event). `barrier()` blocks until
+    everything buffered before the call is committed (use it where a
+    write must be durable before going on); `close()` flushes, stops the
+    writer and closes the storage. Anything else (reads, migrations)
+    goes straight to the wrapped storage, under the same lock the writer
+    uses.
+    """
+
+    def __init__(
+        self,
+        storage,
+        max_rows: int = 500,
+        max_delay: float = 0.05,
+        max_pending: int | None = 100_000,
+        on_error=None,
+    ):
+        self.storage = storage
+        self.max_rows = max_rows
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.on_error = on_error
+
+        self._cond = threading.Condition()
+        self._db_lock = threading.Lock()
+        self._buffers = defaultdict(list)
+        self._pending = 0
+        self._oldest = None
+        self._enqueued = 0   # rows accepted (sequence of the last one)
+        self._committed = 0  # rows committed
+        self._closed = False
+        self._urgent = False  # a barrier or a blocked writer is waiting
+        self._errors = deque()
+
+        # ---- metrics ----
+        self.flushes = 0
+        self.rows_written = 0
+        self.errors = 0
+        self.stalls = 0
+        self.stall_histogram = LatencyHistogram()
+
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------
+    # ------------------- Write API ------------------------------
+    # ------------------------------------------------------------
+
+    def log_signal(self, event):
+        self._add("signals", [self.storage.signal_row(event)])
+
+    def save_order(self, order):
+        stub, row = self.storage.order_rows(order)
+        if stub is not None:
+            self._add("signal_stubs", [stub])
+        self._add("orders", [row])
+
+    def update_order_status(self, **kwargs):
+        self._add("order_updates", [self.storage.order_update_row(**kwargs)])
+
+    def save_fill(self, fill):
+        self._add("fills", [self.storage.fill_row(fill)])
+
+    def log_market_price(self, **kwargs):
+        self._add("market_data", [self.storage.market_data_row(**kwargs)])
+
+    def log_features(self, *args, **kwargs):
+        rows = self.storage.feature_rows(*args, **kwargs)
+        if rows:
+            self._add("signal_features", rows)
+
+    def log_engine_metrics(self, rows):
+        rows = self.storage.engine_metric_rows(rows)
+        if rows:
+            self._add("engine_metrics", rows)
+
+    def _add(self, table, rows):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("WriteBehindStorage is closed")
+            if self.max_pending is not None and self._pending >= self.max_pending:
+                self._wait_for_room()
+
+            self._buffers[table].extend(rows)
+            self._pending += len(rows)
+            self._enqueued += len(rows)
+            if self._oldest is None:
+                # first pending row: the writer starts its max_delay countdown
+                self._oldest = time.monotonic()
+                self._cond.notify_all()
+            elif self._pending >= self.max_rows:
+                self._cond.notify_all()
+
+    def _wait_for_room(self):
+        # called with self._cond held
+        start = time.perf_counter_ns()
+        self.stalls += 1
+        self._urgent = True
+        self._cond.notify_all()
+        self._cond.wait_for(lambda: self._pending < self.max_pending or self._closed)
+        self.stall_histogram.record(time.perf_counter_ns() - start)
+        if self._closed:
+            raise RuntimeError("WriteBehindStorage is closed")
+
+    # ------------------------------------------------------------
+    # ------------------- Errors ---------------------------------
+    # ------------------------------------------------------------
+
+    def raise_errors(self):
+        """
+        Re-raise the oldest write error not reported yet. Cheap when there
+        is none, so it can run after every event.
+        """
+        if not self._errors:
+            return
+        with self._cond:
+            error = self._errors.popleft() if self._errors else None
+        if error is not None:
+            raise error
+
+    # ------------------------------------------------------------
+    # ------------------- Durability -----------------------------
+    # ------------------------------------------------------------
+
+    def barrier(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every row buffered before this call is committed.
+        Returns False on timeout; re-raises the writer's error if a
+        flush failed.
+        """
+        with self._cond:
+            target = self._enqueued
+            if self._committed < target:
+                # do not wait out max_delay: flush right away
+                self._urgent = True
+                self._cond.notify_all()
+            ok = self._cond.wait_for(
+                lambda: self._committed >= target or self._errors,
+                timeout,
+            )
+        self.raise_errors()
+        return ok
+
+    flush = barrier
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+
+        self._thread.join()
+        self.storage.close()
+
+    # ------------------------------------------------------------
+    # ------------------- Writer thread --------------------------
+    # ------------------------------------------------------------
+
+    def _due(self) -> bool:
+        if not self._pending:
+            return False
+        if self._closed or self._urgent or self._pending >= self.max_rows:
+            return True
+        return time.monotonic() - self._oldest >= self.max_delay
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._due():
+                    if self._closed:
+                        return
+                    timeout = None
+                    if self._pending:
+                        timeout = max(0.0, self._oldest + self.max_delay - time.monotonic())
+                    self._cond.wait(timeout)
+
+                batches, self._buffers = self._buffers, defaultdict(list)
+                count, self._pending, self._oldest = self._pending, 0, None
+                self._urgent = False
+                # blocked writers can go on filling the next batch
+                self._cond.notify_all()
+
+            try:
+                with self._db_lock:
+                    self.storage.write_rows(batches)
+            except Exception as exc:
+                self.errors += 1
+                self._rollback()
+                with self._cond:
+                    self._errors.append(exc)
+                    self._committed += count
+                    self._cond.notify_all()
+                if self.on_error is not None:
+                    try:
+                        self.on_error(exc)
+                    except Exception:
+                        pass
+                continue
+
+            with self._cond:
+                self.flushes += 1
+                self.rows_written += count
+                self._committed += count
+                self._cond.notify_all()
+
+    def _rollback(self):
+        try:
+            self.storage.conn.rollback()
+        except Exception:
+            # no connection, or a pooled one already returned (and rolled back)
+            pass
+
+    # ------------------------------------------------------------
+    # ------------------- Pass-through ---------------------------
+    # ------------------------------------------------------------
+
+    def __getattr__(self, name):
+        attr = getattr(self.storage, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._db_lock:
+                return attr(*args, **kwargs)
+
+        return locked
+
+    def metrics(self) -> dict:
+        return {
+            "pending": self._pending,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "errors": self.errors,
+            "unreported_errors": len(self._errors),
+            "stalls": self.stalls,
+            "stall_p99_us": self.stall_histogram.percentile(99) / 1e3,
+        }
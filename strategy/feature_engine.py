@@ -19,6 +19,14 @@ class FeatureEngine:
     def update(self, price):
         self.prices.append(price)
 
+    def update_batch(self, prices):
+        """
+        Same as calling update() for every price, but only the last
+        `window` values are touched.
+        """
+        tail = np.asarray(prices, dtype=float)[-self.window:]
+        self.prices.extend(tail.tolist())
+
     def ready(self):
         return len(self.prices) >= self.window
 
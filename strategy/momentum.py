@@ -1,5 +1,4 @@
-from datetime import datetime, timezone
-
+from core.clock import WALL_CLOCK
 from core.events import SignalEvent
 from strategy.feature_engine import FeatureEngine
 
@@ -10,8 +9,10 @@ class MomentumStrategy:
     Generates LONG / SHORT signals based on z-score.
     """
 
-    def __init__(self, event_bus):
+    def __init__(self, event_bus, clock=None):
         self.event_bus = event_bus
+        # None until the Engine / ReplayRunner binds theirs (see core.clock.bind_clock)
+        self.clock = clock
         self.features = FeatureEngine(window=10)
 
     # ----------------------------------------
@@ -48,10 +49,12 @@ class MomentumStrategy:
         # 4️⃣ Публикуем сигнал
         self.event_bus.publish(
             SignalEvent(
+                # id выводим из market event: повторный replay даёт те же id
+                event_id=f"{event.event_id}:momentum",
                 symbol=event.symbol,
                 signal_type=signal_type,
                 strength=abs(z),
                 features=feature_dict,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=(self.clock or WALL_CLOCK).now(),
             )
         )
\ No newline at end of file
@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from core.event_bus import AsyncEventBus
+from core.events import MarketEvent, SignalEvent
+
+
+def make_market(symbol, price):
+    return MarketEvent(
+        event_id=f"{symbol}-{price}",
+        timestamp=datetime.now(timezone.utc),
+        symbol=symbol,
+        price=price,
+    )
+
+
+class EchoStrategy:
+    """Publishes a signal per market event, like MomentumStrategy does."""
+
+    def __init__(self, event_bus):
+        self.event_bus = event_bus
+
+    def on_market(self, event):
+        self.event_bus.publish(
+            SignalEvent(
+                event_id=event.event_id,
+                timestamp=event.timestamp,
+                symbol=event.symbol,
+                signal_type="LONG",
+                strength=event.price,
+            )
+        )
+
+
+def test_strategy_publishes_through_async_bus():
+    async def scenario():
+        bus = AsyncEventBus(maxsize=2)
+        signals = []
+
+        strategy = EchoStrategy(bus)
+        bus.subscribe(MarketEvent, strategy.on_market)
+        bus.subscribe(SignalEvent, signals.append)
+
+        await bus.start()
+        for price in range(10):
+            await bus.publish_async(make_market("NG", float(price)))
+        await bus.stop()
+
+        return bus, signals
+
+    bus, signals = asyncio.run(scenario())
+
+    assert [s.strength for s in signals] == [float(p) for p in range(10)]
+    for m in bus.metrics().values():
+        assert m["dropped"] == 0
+        assert m["depth"] == 0
+        assert m["max_depth"] <= 2
+
+
+def test_drop_oldest_and_conflate_policies():
+    async def scenario():
+        bus = AsyncEventBus(maxsize=2)
+        dropped, conflated = [], []
+
+        bus.subscribe(MarketEvent, dropped.append, policy="drop_oldest")
+        bus.subscribe(MarketEvent, conflated.append, policy="conflate")
+
+        # publish before the workers start: both queues fill up
+        for price in (1.0, 2.0, 3.0):
+            bus.publish(make_market("NG", price))
+        bus.publish(make_market("BR", 50.0))
+
+        await bus.start()
+        await bus.stop()
+
+        return bus, dropped, conflated
+
+    bus, dropped, conflated = asyncio.run(scenario())
+
+    assert [e.price for e in dropped] == [3.0, 50.0]
+    assert [(e.symbol, e.price) for e in conflated] == [("NG", 3.0), ("BR", 50.0)]
+
+    metrics = list(bus.metrics().values())
+    assert metrics[0]["dropped"] == 2
+    assert metrics[1]["conflated"] == 2
+    assert metrics[1]["dropped"] == 0
+
+
+def test_block_policy_parks_sync_publishes_in_a_bounded_overflow():
+    async def scenario():
+        bus = AsyncEventBus(maxsize=2)
+        received = []
+        bus.subscribe(MarketEvent, received.append)
+
+        # queue (2) + overflow (2) take four; the fifth has nowhere to go
+        for price in range(4):
+            bus.publish(make_market("NG", float(price)))
+        sub = bus.handlers_for(MarketEvent, "NG")[0]
+        assert sub.metrics()["overflow"] == 2
+        with pytest.raises(asyncio.QueueFull):
+            bus.publish(make_market("NG", 4.0))
+
+        await bus.start()
+        await bus.publish_async(make_market("NG", 5.0))
+        await bus.stop()
+        return received, sub
+
+    received, sub = asyncio.run(scenario())
+
+    assert [e.price for e in received] == [0.0, 1.0, 2.0, 3.0, 5.0]
+    assert sub._drainer is None and not sub._overflow
+
+
+def test_block_policy_without_running_loop_raises():
+    bus = AsyncEventBus(maxsize=1)
+    bus.subscribe(MarketEvent, lambda e: None)
+
+    bus.publish(make_market("NG", 1.0))
+    with pytest.raises(asyncio.QueueFull, match="no running event loop"):
+        bus.publish(make_market("NG", 2.0))
@@ -0,0 +1,120 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from core.events.market_batch import to_epoch_ns
+from data.bar_store import Bars, BarStore
+from research.dataset_builder import DatasetBuilder
+
+
+T0 = datetime(2026, 1, 5, 23, 50, tzinfo=timezone.utc)
+MIN = 60 * 1_000_000_000
+
+
+def minutes(start, n):
+    return to_epoch_ns(start) + np.arange(n, dtype=np.int64) * MIN
+
+
+def test_append_partitions_by_day_and_reads_ranges(tmp_path):
+    store = BarStore(tmp_path)
+    ts = minutes(T0, 20)  # 10 bars on the 5th, 10 on the 6th
+
+    assert store.append("NG", "1m", ts, close=np.arange(20.0)) == 20
+
+    assert store.days("NG", "1m") == ["2026-01-05", "2026-01-06"]
+    assert (tmp_path / "NG" / "1m" / "2026-01-06" / "close").stat().st_size == 10 * 8
+
+    bars = store.read("NG", "1m")
+    assert bars.ts.tolist() == ts.tolist()
+    assert bars.close.tolist() == list(range(20))
+    assert np.isnan(bars.open).all() and (bars.volume == 0).all()
+
+    window = store.read("NG", "1m", start=T0 + timedelta(minutes=12), end=T0 + timedelta(minutes=15))
+    assert window.close.tolist() == [12.0, 13.0, 14.0]
+    # single-day range: a view of the mapped file, not a copy
+    day = store.partition("NG", "1m", "2026-01-06")
+    assert np.shares_memory(window.close, day.close)
+
+
+def test_append_only_skips_old_bars_and_dedupes(tmp_path):
+    store = BarStore(tmp_path)
+    ts = minutes(T0, 5)
+    store.append("NG", "1m", ts, close=np.ones(5))
+
+    again = np.r_[ts[3:], ts[-1] + MIN, ts[-1] + MIN]
+    assert store.append("NG", "1m", again, close=np.array([9.0, 9.0, 2.0, 3.0])) == 1
+
+    bars = store.read("NG", "1m")
+    assert bars.close.tolist() == [1.0] * 5 + [3.0]
+    assert store.skipped == 2
+
+
+def test_torn_append_is_ignored_and_overwritten(tmp_path):
+    store = BarStore(tmp_path)
+    store.append("NG", "1m", minutes(T0, 3), close=np.ones(3))
+
+    # a crash after writing a data column but before ts
+    with open(tmp_path / "NG" / "1m" / "2026-01-05" / "close", "ab") as f:
+        f.write(np.array([99.0]).tobytes())
+    assert len(store.read("NG", "1m")) == 3
+
+    store.append("NG", "1m", minutes(T0 + timedelta(minutes=3), 1), close=[2.0])
+    assert store.read("NG", "1m").close.tolist() == [1.0, 1.0, 1.0, 2.0]
+
+
+class MarketDataStorage:
+    """iter_market_data_chunks over in-memory bars."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.starts = []
+
+    def iter_market_data_chunks(self, symbol, start=None, end=None, timeframe=None, chunk_size=100_000, columns=None):
+        self.starts.append(start)
+        rows = [r for r in self.rows if start is None or r[0] >= start]
+        for i in range(0, len(rows), chunk_size):
+            chunk = rows[i:i + chunk_size]
+            yield Bars(
+                np.array([to_epoch_ns(r[0]) for r in chunk], dtype=np.int64),
+                *(np.array([np.nan if r[k] is None else r[k] for r in chunk]) for k in range(1, 6)),
+            )
+
+
+def test_ingest_from_market_data_resumes_and_feeds_dataset_builder(tmp_path):
+    rows = [
+        (T0 + timedelta(minutes=i), None, None, None, 100.0 + i, 1.0)
+        for i in range(40)
+    ]
+    storage = MarketDataStorage(rows[:30])
+    store = BarStore(tmp_path)
+
+    assert store.ingest(storage, "NG", "1m", chunk_size=7) == 30
+    storage.rows = rows
+    assert store.ingest(storage, "NG", "1m") == 10
+    assert storage.starts[1] == T0 + timedelta(minutes=29)
+
+    builder = DatasetBuilder(storage=None, bar_store=store, timeframe="1m")
+    timestamps, prices = builder.load_prices("NG")
+    assert prices.tolist() == [100.0 + i for i in range(40)]
+    assert timestamps[0] == T0
+
+    batch = store.read("NG", "1m").to_batch("NG")
+    assert len(batch) == 40
+
+
+def test_dataset_builder_reads_only_its_timeframe(tmp_path):
+    class Storage:
+        def load_market_data(self, symbol, timeframe=None, columns=None):
+            self.timeframe = timeframe
+            return Bars(minutes(T0, 3), None, None, None, np.array([1.0, 2.0, 3.0]), None)
+
+    storage = Storage()
+    _, prices = DatasetBuilder(storage, timeframe="5m").load_prices("NG")
+    assert storage.timeframe == "5m" and prices.tolist() == [1.0, 2.0, 3.0]
+
+    # no implicit "every timeframe": "1m" ticks would mix into "5m" candles
+    with pytest.raises(TypeError):
+        DatasetBuilder(storage)
+    with pytest.raises(TypeError):
+        DatasetBuilder(storage=None, bar_store=BarStore(tmp_path))
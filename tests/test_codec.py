@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from core.events import (
+    EventCodec, FillEvent, MarketEvent, OrderEvent, SignalEvent, SymbolTable,
+)
+
+
+TS = datetime(2026, 1, 5, 10, 0, 0, 123456, tzinfo=timezone.utc)
+
+
+@dataclass(slots=True, kw_only=True)
+class TaggedMarket(MarketEvent):
+    venue: str = "RTSX"
+
+
+def sample_events():
+    return [
+        MarketEvent(event_id=str(uuid4()), timestamp=TS, symbol="NG", price=3.1, volume=12.0),
+        SignalEvent(
+            event_id="NG:1:momentum", timestamp=TS, symbol="NG", signal_type="LONG",
+            strength=0.5, features={"ret_1": 0.01, "vol": 0.2},
+        ),
+        SignalEvent(timestamp=TS, symbol="BR", signal_type="SHORT", strength=1.0),
+        SignalEvent(timestamp=TS, symbol="BR", signal_type="SHORT", strength=1.0, features={}),
+        OrderEvent(timestamp=TS, symbol="BR", side="SELL", qty=2.0),
+        FillEvent(
+            timestamp=TS, fill_id=str(uuid4()), order_id="O-7", symbol="NG",
+            side="BUY", qty=1.0, price=3.1, commission=0.05,
+        ),
+        MarketEvent(timestamp=None, symbol="NG", price=3.2),
+    ]
+
+
+def test_round_trip_all_event_types():
+    events = sample_events()
+
+    decoded = EventCodec().decode(EventCodec().encode_many(events))
+
+    assert decoded == events
+    assert [type(e) for e in decoded] == [type(e) for e in events]
+
+
+def test_symbols_announced_once_per_stream():
+    local, remote = SymbolTable(), SymbolTable()
+    remote.id_of("OTHER")  # ids differ between the two processes
+    encoder, decoder = EventCodec(local), EventCodec(remote)
+
+    first = encoder.encode(MarketEvent(timestamp=TS, symbol="NG", price=3.1))
+    second = encoder.encode(MarketEvent(timestamp=TS, symbol="NG", price=3.2))
+
+    assert len(second) < len(first)
+    out = decoder.decode(first) + decoder.decode(second)
+    assert [e.price for e in out] == [3.1, 3.2]
+    assert out[1].symbol == "NG" and remote.id_of("NG") == 1
+
+
+def test_unknown_types_fall_back_to_pickle():
+    event = TaggedMarket(timestamp=TS, symbol="NG", price=3.1, venue="MOEX")
+
+    (decoded,) = EventCodec().decode(EventCodec().encode(event))
+
+    assert decoded == event and type(decoded) is TaggedMarket
+
+
+def test_naive_and_aware_timestamps_round_trip_as_they_were():
+    naive = TS.replace(tzinfo=None)
+    events = [
+        MarketEvent(timestamp=naive, symbol="NG", price=3.1),
+        OrderEvent(timestamp=TS, symbol="NG", side="BUY", qty=1.0),
+    ]
+
+    decoded = EventCodec().decode(EventCodec().encode_many(events))
+
+    assert decoded == events
+    assert decoded[0].timestamp.tzinfo is None
+    assert decoded[1].timestamp.tzinfo is not None
+
+
+def test_non_float_feature_values_are_kept():
+    event = SignalEvent(
+        timestamp=TS, symbol="NG", signal_type="LONG", strength=1.0,
+        features={"bars": 20, "regime": "trend", "z": 1.5},
+    )
+
+    (decoded,) = EventCodec().decode(EventCodec().encode(event))
+
+    assert decoded == event
+    assert type(decoded.features["bars"]) is int
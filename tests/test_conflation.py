@@ -0,0 +1,112 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+from core.conflation import ConflatingHandler
+from core.event_bus import AsyncEventBus, EventBus
+from core.events import MarketEvent
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def tick(symbol, price, volume=1.0):
+    return MarketEvent(timestamp=TS, symbol=symbol, price=price, volume=volume)
+
+
+class SlowStrategy:
+    """Blocks in its first on_market call until released."""
+
+    def __init__(self):
+        self.seen = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def on_market(self, event):
+        self.seen.append(event)
+        if len(self.seen) == 1:
+            self.entered.set()
+            self.release.wait(5)
+
+
+def test_busy_consumer_sees_newest_tick_per_symbol():
+    strategy = SlowStrategy()
+    accounting = []
+
+    bus = EventBus()
+    conflating = bus.subscribe(MarketEvent, strategy.on_market, conflate=True)
+    bus.subscribe(MarketEvent, accounting.append)
+
+    first = threading.Thread(target=bus.publish, args=(tick("NG", 3.0),))
+    first.start()
+    strategy.entered.wait(5)
+
+    # the strategy is busy: these are parked and conflated per symbol
+    for i in range(1, 6):
+        conflating(tick("NG", 3.0 + i, volume=2.0))
+        conflating(tick("BR", 70.0 + i, volume=1.0))
+
+    strategy.release.set()
+    first.join(5)
+
+    assert [(e.symbol, e.price, e.volume) for e in strategy.seen] == [
+        ("NG", 3.0, 1.0), ("NG", 8.0, 10.0), ("BR", 75.0, 5.0),
+    ]
+    assert conflating.dropped == 8
+    assert conflating.metrics()["dropped_by_symbol"] == {"NG": 4, "BR": 4}
+    assert conflating.pending == 0
+
+
+def test_conflation_is_per_subscriber():
+    strategy = SlowStrategy()
+    strategy.release.set()
+    accounting = []
+
+    bus = EventBus()
+    bus.subscribe(MarketEvent, strategy.on_market, conflate=True)
+    bus.subscribe(MarketEvent, accounting.append)
+
+    for i in range(5):
+        bus.publish(tick("NG", float(i)))
+
+    # idle consumer: nothing is conflated, both see every tick
+    assert len(strategy.seen) == len(accounting) == 5
+
+
+def test_reentrant_publish_is_conflated():
+    bus = EventBus()
+    seen = []
+
+    def handler(event):
+        seen.append(event.price)
+        if event.price == 0.0:
+            for i in range(1, 4):
+                bus.publish(tick("NG", float(i)))
+
+    handler_ = bus.subscribe(MarketEvent, handler, conflate=True)
+    assert isinstance(handler_, ConflatingHandler)
+
+    bus.publish(tick("NG", 0.0))
+
+    assert seen == [0.0, 3.0]
+    assert handler_.dropped == 2
+
+
+def test_async_conflate_policy_aggregates_volume():
+    async def scenario():
+        bus = AsyncEventBus(maxsize=16)
+        seen = []
+        sub = bus.subscribe(MarketEvent, seen.append, conflate=True)
+
+        for i in range(4):
+            bus.publish(tick("NG", float(i), volume=1.5))
+        bus.publish(tick("BR", 70.0))
+
+        await bus.start()
+        await bus.stop()
+        return seen, sub.metrics()
+
+    seen, metrics = asyncio.run(scenario())
+
+    assert [(e.symbol, e.price, e.volume) for e in seen] == [("NG", 3.0, 6.0), ("BR", 70.0, 1.0)]
+    assert metrics["conflated_by_symbol"] == {"NG": 3}
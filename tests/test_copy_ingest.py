@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
+from storage.postgres import PostgresStorage, _CopyStream
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def drain(stream, size):
+    out = []
+    while chunk := stream.read(size):
+        out.append(chunk)
+    return "".join(out)
+
+
+def test_copy_stream_renders_market_data_rows():
+    rows = [
+        PostgresStorage.market_data_row(symbol="NGH6@RTSX", timeframe="5m", ts=TS, close_price=np.float64(3.5), volume=10),
+        PostgresStorage.market_data_row(symbol="odd\tname\\x", ts=TS, price=1.0),
+    ]
+
+    text = drain(_CopyStream(rows), 1 << 16)
+
+    assert text.splitlines() == [
+        "NGH6@RTSX\t5m\t\\N\t\\N\t\\N\t3.5\t10.0\t2026-01-05T10:00:00+00:00",
+        "odd\\tname\\\\x\t1m\t\\N\t\\N\t\\N\t1.0\t0.0\t2026-01-05T10:00:00+00:00",
+    ]
+
+
+def test_copy_stream_is_lazy_and_chunked():
+    consumed = []
+
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield ("NG", "5m", None, None, None, float(i), 0.0, TS)
+
+    stream = _CopyStream(rows())
+    first = stream.read(128)
+
+    assert len(first) == 128
+    assert len(consumed) < 10
+
+    rest = drain(stream, 100)
+    assert len((first + rest).splitlines()) == stream.count == 1000
+
+
+class RecordingCursor:
+    rowcount = 3
+
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        self.log.append((" ".join(sql.split()), params))
+
+
+class RecordingConnection:
+    def __init__(self):
+        self.log = []
+        self.commits = 0
+
+    def cursor(self):
+        return RecordingCursor(self.log)
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_relabel_moves_grid_rows_to_the_loaded_timeframe():
+    storage = PostgresStorage.__new__(PostgresStorage)
+    storage.conn = RecordingConnection()
+
+    moved = storage.relabel_market_data("NG", "5m", period=300, start=TS)
+
+    ((sql, params),) = storage.conn.log
+    assert moved == 3 and storage.conn.commits == 1
+    assert sql.startswith("UPDATE market_data m SET timeframe = %s WHERE symbol = %s AND timeframe = %s AND ts >= %s")
+    assert "%% %s = 0" in sql and "NOT EXISTS" in sql
+    assert params == ["5m", "NG", "1m", TS, 300, "5m"]
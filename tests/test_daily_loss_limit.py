@@ -1,4 +1,8 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
 import pytest
+from core.events import TimerEvent, TIMER_SESSION_ROLL
 from risk.risk_engine import RiskEngine
 from accounting.position_manager import PositionManager
 
@@ -23,4 +27,28 @@ def test_daily_loss_limit_block():
 
     approved = risk.evaluate(signal, context)
 
-    assert approved is None
\ No newline at end of file
+    assert approved is None
+
+
+def test_closing_fills_accrue_daily_pnl_until_session_roll():
+    def fill(fill_id, side, price):
+        return SimpleNamespace(
+            fill_id=fill_id, symbol="NG", side=side, qty=100, price=price, commission=0.0,
+        )
+
+    pm = PositionManager(starting_cash=100_000)
+    risk = RiskEngine(max_daily_loss_pct=0.05)
+
+    pm.on_fill(fill("f1", "BUY", 100.0))
+    assert pm.daily_realized_pnl == 0.0  # opening fills realize nothing
+
+    pm.on_fill(fill("f2", "SELL", 40.0))
+    assert pm.daily_realized_pnl == -6_000.0
+
+    # the accrued loss alone trips the daily limit
+    assert risk.evaluate(object(), pm.get_context()) is None
+    assert risk.is_frozen
+
+    pm.on_timer(TimerEvent(timestamp=datetime(2026, 3, 3, tzinfo=timezone.utc), name=TIMER_SESSION_ROLL, timer_id=1))
+    assert pm.daily_realized_pnl == 0.0
+    assert pm.positions["NG"].realized_pnl == -6_000.0
@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+
+from core.engine import Engine
+from core.dispatcher import HandlerRegistry
+from core.events import MarketEvent, SignalEvent, FillEvent
+
+
+class DummyStorage:
+    def __init__(self, events=()):
+        self.events = list(events)
+        self.prices = []
+
+    def get_pending_events(self):
+        return self.events
+
+    def log_market_price(self, **kwargs):
+        self.prices.append(kwargs["price"])
+
+
+def make_market(price):
+    return MarketEvent(
+        event_id="m",
+        timestamp=datetime.now(timezone.utc),
+        symbol="NG",
+        price=price,
+    )
+
+
+def test_registry_resolves_subclass_once():
+    class TickEvent(MarketEvent):
+        pass
+
+    seen = []
+    registry = HandlerRegistry()
+    registry.register(MarketEvent, seen.append)
+
+    tick = TickEvent(event_id="t", timestamp=None, symbol="NG", price=1.0)
+
+    assert registry.dispatch(tick)
+    assert registry.dispatch(tick)
+    assert seen == [tick, tick]
+    assert registry.counts[TickEvent] == 2
+    assert registry.resolve(TickEvent) == seen.append
+
+
+def test_engine_counts_per_type_and_keeps_unhandled():
+    fill = FillEvent(
+        event_id="f",
+        timestamp=None,
+        fill_id="F1",
+        order_id="O1",
+        symbol="NG",
+        side="BUY",
+        qty=1.0,
+        price=100.0,
+        commission=0.0,
+    )
+    storage = DummyStorage([make_market(100.0), make_market(101.0), fill])
+
+    engine = Engine(
+        oms=None,
+        position_manager=None,
+        portfolio_manager=None,
+        risk_engine=None,
+        storage=storage,
+    )
+
+    assert engine.run() == 3
+    assert storage.prices == [100.0, 101.0]
+    assert engine.processed == 2
+    assert engine.handlers.stats() == {
+        "handled": {"MarketEvent": 2},
+        "unhandled": {"FillEvent": 1},
+    }
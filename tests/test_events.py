@@ -0,0 +1,51 @@
+import pickle
+from datetime import datetime, timezone
+
+import pytest
+
+from core.events import MarketEvent, FillEvent, SignalEvent, SYMBOLS
+from domain.fill_event import FillEvent as DomainFillEvent
+from execution.order_model import Order
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def test_single_canonical_fill_event():
+    assert DomainFillEvent is FillEvent
+
+
+def test_events_are_slotted_and_get_default_ids():
+    event = MarketEvent(timestamp=TS, symbol="NG", price=3.1)
+
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.unknown = 1
+
+    assert event.event_id
+    assert event.event_id != MarketEvent(timestamp=TS, symbol="NG", price=3.1).event_id
+
+
+def test_symbols_are_interned():
+    a = SignalEvent(timestamp=TS, symbol="".join(["NGH6", "@RTSX"]), signal_type="LONG", strength=1.0)
+    b = MarketEvent(timestamp=TS, symbol="".join(["NGH6", "@", "RTSX"]), price=3.1)
+
+    assert a.symbol is b.symbol
+    assert SYMBOLS.symbol_of(SYMBOLS.id_of("NGH6@RTSX")) is a.symbol
+
+
+def test_slotted_events_and_orders_pickle():
+    fill = FillEvent(
+        timestamp=TS, fill_id="F1", order_id="O1", symbol="NG",
+        side="BUY", qty=1.0, price=3.1, commission=0.0,
+    )
+    order = Order(
+        order_id="O1", symbol="NG", side="BUY", qty=1.0, price=3.1,
+        signal_event_id="S1", created_ts=TS,
+    )
+    order.add_fill(fill)
+
+    restored = pickle.loads(pickle.dumps(order))
+
+    assert restored.fills == [fill]
+    assert restored.is_filled
@@ -0,0 +1,76 @@
+from datetime import datetime, timezone
+
+from core.engine import Engine
+from core.events import MarketEvent, SignalEvent, FillEvent
+from core.journal import EventJournal, read_journal
+from execution.oms import OMS
+from execution.sim_executor import SimExecutionEngine
+from accounting.position_manager import PositionManager
+from accounting.portfolio_manager import PortfolioManager
+from risk.risk_engine import RiskEngine
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+class NullStorage:
+    def save_order(self, order): pass
+    def save_fill(self, fill): pass
+    def update_order_status(self, **kwargs): pass
+    def log_signal(self, event): pass
+    def log_features(self, **kwargs): pass
+    def log_market_price(self, **kwargs): pass
+
+
+def build_engine(journal=None):
+    storage = NullStorage()
+    return Engine(
+        oms=OMS(storage=storage, execution_engine=SimExecutionEngine()),
+        position_manager=PositionManager(starting_cash=100_000),
+        portfolio_manager=PortfolioManager(initial_cash=100_000),
+        risk_engine=RiskEngine(),
+        storage=storage,
+        journal=journal,
+    )
+
+
+def make_market(i):
+    return MarketEvent(event_id=f"m{i}", timestamp=TS, symbol="NG", price=100.0 + i)
+
+
+def test_append_rotate_and_reopen(tmp_path):
+    journal = EventJournal(tmp_path, segment_size=512)
+    for i in range(20):
+        assert journal.append(make_market(i)) == i
+    journal.close()
+
+    assert len(list(tmp_path.glob("*.journal"))) > 1
+
+    reopened = EventJournal(tmp_path, segment_size=512)
+    assert reopened.next_seq == 20
+    reopened.append(make_market(20))
+    reopened.close()
+
+    events = list(read_journal(tmp_path))
+    assert [e.price for e in events] == [100.0 + i for i in range(21)]
+    assert [e.price for e in read_journal(tmp_path, from_seq=18)] == [118.0, 119.0, 120.0]
+
+
+def test_engine_recovers_positions_from_journal(tmp_path):
+    journal = EventJournal(tmp_path)
+    engine = build_engine(journal)
+
+    signal = SignalEvent(
+        event_id="s1", timestamp=TS, symbol="NG", signal_type="BUY", strength=1.0,
+    )
+    engine.run([make_market(0), signal])
+    journal.close()
+
+    journaled = list(read_journal(tmp_path))
+    assert [type(e) for e in journaled] == [MarketEvent, SignalEvent, FillEvent, FillEvent]
+
+    restarted = build_engine()
+    assert restarted.recover(read_journal(tmp_path)) == 4
+
+    assert restarted.position_manager.positions["NG"].qty == 1.0
+    assert restarted.portfolio_manager.cash == engine.portfolio_manager.cash
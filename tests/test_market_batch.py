@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from core.event_bus import EventBus
+from core.events import MarketEvent, MarketEventBatch, SymbolTable
+from accounting.position_manager import PositionManager
+from strategy.feature_engine import FeatureEngine
+
+
+T0 = datetime(2026, 2, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def make_events():
+    prices = {"NG": [3.10, 3.12, 3.18], "BR": [70.0, 71.5]}
+    events = []
+    for i in range(3):
+        for symbol, series in prices.items():
+            if i < len(series):
+                events.append(MarketEvent(
+                    event_id=f"{symbol}{i}",
+                    timestamp=T0 + timedelta(minutes=i),
+                    symbol=symbol,
+                    price=series[i],
+                    volume=10.0,
+                ))
+    return events
+
+
+def test_batch_round_trip_and_last_prices():
+    symbols = SymbolTable()
+    events = make_events()
+    batch = MarketEventBatch.from_events(events, symbols=symbols)
+
+    assert len(batch) == 5
+    assert batch.ts.dtype == np.int64 and batch.price.dtype == np.float64
+    assert batch.last_prices() == {"NG": 3.18, "BR": 71.5}
+
+    back = list(batch.events())
+    assert [(e.symbol, e.price, e.timestamp) for e in back] == [
+        (e.symbol, e.price, e.timestamp) for e in events
+    ]
+    assert list(batch.select("BR").price) == [70.0, 71.5]
+
+
+def test_bus_delivers_batch_and_per_event_fallback():
+    bus = EventBus()
+    batches, singles = [], []
+    bus.subscribe(MarketEventBatch, batches.append)
+    bus.subscribe(MarketEvent, singles.append)
+
+    batch = MarketEventBatch.from_events(make_events())
+    bus.publish_batch(batch)
+
+    assert batches == [batch]
+    assert [e.price for e in singles] == list(batch.price)
+
+
+def test_position_manager_marks_to_market_from_batch():
+    pm = PositionManager(starting_cash=100_000)
+    pm.positions["NG"].qty = 10
+    pm.positions["NG"].avg_price = 3.0
+
+    pm.update_market_batch(MarketEventBatch.from_events(make_events()))
+
+    assert pm.positions["NG"].market_price == 3.18
+    assert round(pm.unrealized_pnl, 6) == round(10 * 0.18, 6)
+
+
+def test_feature_engine_batch_update_matches_single_updates():
+    prices = np.linspace(100.0, 110.0, 200)
+
+    one_by_one = FeatureEngine(window=10)
+    for p in prices:
+        one_by_one.update(p)
+
+    batched = FeatureEngine(window=10)
+    batched.update_batch(prices)
+
+    assert batched.compute() == one_by_one.compute()
@@ -0,0 +1,221 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import psycopg2
+
+from core.events.market_batch import to_epoch_ns
+from storage.postgres import PostgresStorage
+
+
+T0 = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+class ServerCursor:
+    """
+    Named cursor over preset rows; counts how many rows left the 'server'.
+    Like Postgres, a commit ends it unless it was declared WITH HOLD.
+    """
+
+    def __init__(self, conn, name, withhold=False):
+        self.conn = conn
+        self.name = name
+        self.withhold = withhold
+        self.valid = True
+        self.itersize = 2000
+        self.pos = 0
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append((self.name, " ".join(sql.split()), params))
+
+    def fetchmany(self, size):
+        if not self.valid:
+            raise psycopg2.ProgrammingError("named cursor isn't valid anymore")
+        rows = self.conn.rows[self.pos:self.pos + size]
+        self.pos += len(rows)
+        self.conn.fetched.append(len(rows))
+        return rows
+
+    def close(self):
+        self.conn.closed_cursors += 1
+
+
+class PlainCursor(ServerCursor):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def fetchone(self):
+        return (len(self.conn.rows),)
+
+
+class FakeConnection:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+        self.fetched = []
+        self.closed_cursors = 0
+        self.commits = 0
+        self.named = []
+        self.closed = False
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def cursor(self, name=None, withhold=False):
+        if name is None:
+            return PlainCursor(self, None)
+        cur = ServerCursor(self, name, withhold)
+        self.named.append(cur)
+        return cur
+
+    def commit(self):
+        self.commits += 1
+        for cur in self.named:
+            if not cur.withhold:
+                cur.valid = False
+
+
+def storage_on(rows):
+    storage = PostgresStorage.__new__(PostgresStorage)
+    storage.conn = FakeConnection(rows)
+    return storage
+
+
+def bar_rows(n):
+    ts0 = to_epoch_ns(T0)
+    return [(ts0 + i * 60_000_000_000, float(i)) for i in range(n)]
+
+
+def test_chunks_come_from_a_named_cursor_as_arrays():
+    storage = storage_on(bar_rows(25))
+
+    chunks = list(storage.iter_market_data_chunks(
+        "NG", start=T0, timeframe="1m", chunk_size=10, columns=("close",),
+    ))
+
+    assert [len(c) for c in chunks] == [10, 10, 5]
+    assert chunks[0].ts.dtype == np.int64 and chunks[0].close.flags.c_contiguous
+    assert chunks[0].open is None
+    assert np.concatenate([c.close for c in chunks]).tolist() == [float(i) for i in range(25)]
+
+    conn = storage.conn
+    name, sql, params = conn.statements[0]
+    assert name.startswith("stream_")
+    assert sql.startswith("SELECT (EXTRACT(EPOCH FROM ts) * 1000000)::bigint * 1000, close_price FROM market_data")
+    assert sql.endswith("WHERE symbol = %s AND timeframe = %s AND ts >= %s ORDER BY ts ASC")
+    assert params == ["NG", "1m", T0]
+    assert max(conn.fetched) == 10
+    assert conn.closed_cursors == 1 and conn.commits == 1
+
+
+def test_load_fills_preallocated_arrays_chunk_by_chunk():
+    storage = storage_on(bar_rows(25))
+
+    bars = storage.load_market_data("NG", chunk_size=7, columns=("close",))
+
+    assert len(bars) == 25
+    assert bars.ts[1] - bars.ts[0] == 60_000_000_000
+    assert bars.close.tolist() == [float(i) for i in range(25)]
+    assert storage.conn.statements[0][1] == "SELECT count(*) FROM market_data WHERE symbol = %s"
+    assert max(storage.conn.fetched) == 7
+
+
+def test_abandoned_stream_closes_its_cursor():
+    storage = storage_on([(to_epoch_ns(T0 + timedelta(minutes=i)), float(i)) for i in range(50)])
+
+    chunks = storage.iter_market_data_chunks("NG", chunk_size=10, columns=("close",))
+    next(chunks)
+    chunks.close()
+
+    assert storage.conn.closed_cursors == 1
+    assert storage.conn.fetched == [10]
+
+
+def test_stream_runs_on_a_connection_of_its_own(monkeypatch):
+    import storage.postgres as postgres
+
+    readers = []
+
+    def connect(dsn):
+        readers.append(FakeConnection(bar_rows(30)))
+        return readers[-1]
+
+    monkeypatch.setattr(postgres.psycopg2, "connect", connect)
+    storage = storage_on([])
+    storage.dsn = "fake"
+
+    seen = 0
+    for chunk in storage.iter_market_data_chunks("NG", chunk_size=10, columns=("close",)):
+        seen += len(chunk)
+        storage.log_market_price(symbol="NG", ts=T0, price=1.0)
+
+    reader = readers[0]
+    assert seen == 30 and len(readers) == 1
+    # writes commit on storage.conn; the stream's transaction is untouched
+    assert not reader.named[0].withhold
+    assert reader.commits == 1 and reader.closed
+    assert storage.conn.commits == 3 and not storage.conn.named
+
+
+def test_stream_without_a_dsn_holds_its_cursor_across_commits():
+    storage = storage_on(bar_rows(30))
+
+    seen = 0
+    for chunk in storage.iter_market_data_chunks("NG", chunk_size=10, columns=("close",)):
+        seen += len(chunk)
+        # the Engine logging prices between replayed chunks commits on this connection
+        storage.log_market_price(symbol="NG", ts=T0, price=1.0)
+
+    assert seen == 30
+    assert storage.conn.named[0].withhold
+    assert storage.conn.commits == 3 + 1
+
+
+def test_pooled_stream_takes_a_second_connection():
+    from storage.pool import ConnectionPool, PooledStorage
+
+    conns = []
+
+    def connect(dsn):
+        conns.append(FakeConnection(bar_rows(30)))
+        return conns[-1]
+
+    pool = ConnectionPool("fake", maxconn=2, timeout=1.0, connect=connect)
+    storage = PooledStorage(pool)
+
+    seen = 0
+    for chunk in storage.iter_market_data_chunks("NG", chunk_size=10, columns=("close",)):
+        seen += len(chunk)
+        storage.log_market_price(symbol="NG", ts=T0, price=1.0)
+
+    session, reader = conns
+    assert seen == 30
+    assert reader.named and not reader.named[0].withhold and reader.commits == 1
+    assert session.commits == 3 and not session.named
+    assert pool.in_use == 0
+
+
+def test_pooled_stream_shares_its_session_when_the_pool_is_full():
+    from storage.pool import ConnectionPool, PooledStorage
+
+    conns = []
+
+    def connect(dsn):
+        conns.append(FakeConnection(bar_rows(30)))
+        return conns[-1]
+
+    storage = PooledStorage(ConnectionPool("fake", maxconn=1, timeout=1.0, connect=connect))
+
+    seen = 0
+    for chunk in storage.iter_market_data_chunks("NG", chunk_size=10, columns=("close",)):
+        seen += len(chunk)
+        # same task -> same session connection, which the write commits
+        storage.log_market_price(symbol="NG", ts=T0, price=1.0)
+
+    assert seen == 30 and len(conns) == 1
+    assert conns[0].commits == 3 + 1
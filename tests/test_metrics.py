@@ -0,0 +1,109 @@
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from core.event_bus import AsyncEventBus, EventBus
+from core.events import MarketEvent
+from core.metrics import BusInstrumentation, LatencyHistogram
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+class MetricsSink:
+    def __init__(self):
+        self.rows = []
+
+    def log_engine_metrics(self, rows):
+        self.rows.extend(rows)
+
+
+def tick(price=3.1):
+    return MarketEvent(timestamp=TS, symbol="NG", price=price)
+
+
+def test_histogram_percentiles_within_bucket_error():
+    rng = random.Random(7)
+    values = [rng.randint(1_000, 5_000_000) for _ in range(20_000)]
+
+    h = LatencyHistogram()
+    for v in values:
+        h.record(v)
+
+    values.sort()
+    for q in (50, 90, 99):
+        exact = values[int(q / 100 * len(values)) - 1]
+        assert exact <= h.percentile(q) <= exact * 1.07
+    assert h.percentile(100) == h.max == values[-1]
+    assert h.count == len(values)
+
+
+def test_bus_times_each_handler_and_flags_slow_ones():
+    inst = BusInstrumentation(budget=0.001)
+    bus = EventBus(instrumentation=inst)
+
+    def fast(event):
+        pass
+
+    def slow(event):
+        time.sleep(0.002)
+
+    def broken(event):
+        raise RuntimeError("boom")
+
+    bus.subscribe(MarketEvent, fast)
+    bus.subscribe(MarketEvent, slow)
+    bus.publish(tick())
+    bus.subscribe(MarketEvent, broken)
+
+    with pytest.raises(RuntimeError):
+        bus.publish(tick())
+
+    stats = inst.stats()
+    fast_name = f"MarketEvent:{fast.__qualname__}"
+    slow_name = f"MarketEvent:{slow.__qualname__}"
+    broken_name = f"MarketEvent:{broken.__qualname__}"
+
+    assert stats[fast_name]["calls"] == 2
+    assert stats[slow_name]["p99_us"] >= 2000
+    assert stats[broken_name]["errors"] == 1
+    assert inst.slow_handlers() == [slow_name]
+
+
+def test_flush_writes_engine_metrics_rows():
+    sink = MetricsSink()
+    inst = BusInstrumentation(storage=sink, flush_interval=3600)
+    bus = EventBus(instrumentation=inst)
+    bus.subscribe(MarketEvent, lambda e: None)
+
+    bus.publish(tick())
+    assert sink.rows == []
+
+    inst.flush(ts=TS)
+
+    names = {name for name, _, _ in sink.rows}
+    assert "bus.MarketEvent:test_flush_writes_engine_metrics_rows.<locals>.<lambda>.calls" in names
+    assert all(ts == TS for _, _, ts in sink.rows)
+
+
+def test_async_bus_times_handlers_not_enqueue():
+    async def scenario():
+        inst = BusInstrumentation()
+        bus = AsyncEventBus(instrumentation=inst)
+
+        async def handler(event):
+            await asyncio.sleep(0.002)
+
+        bus.subscribe(MarketEvent, handler)
+        await bus.start()
+        bus.publish(tick())
+        await bus.stop()
+        return inst.stats()
+
+    (stats,) = asyncio.run(scenario()).values()
+
+    assert stats["calls"] == 1
+    assert stats["p50_us"] >= 2000
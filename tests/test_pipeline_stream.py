@@ -0,0 +1,136 @@
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from accounting.portfolio_manager import PortfolioManager
+from accounting.position_manager import PositionManager
+from core.event_bus import EventBus
+from core.events import MarketEvent, SignalEvent
+from core.orchestrator import TradingPipeline
+from execution.sim_executor import SimExecutionEngine
+from risk.risk_engine import RiskEngine
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def ticks(n, symbols=("NG",)):
+    return [
+        MarketEvent(timestamp=TS, symbol=symbols[i % len(symbols)], price=float(i + 1))
+        for i in range(n)
+    ]
+
+
+class EvenStrategy:
+    """Buys on every even-priced tick."""
+
+    def __init__(self, event_bus):
+        self.event_bus = event_bus
+
+    def on_market(self, event):
+        if event.price % 2:
+            return
+        self.event_bus.publish(SignalEvent(
+            timestamp=event.timestamp, symbol=event.symbol,
+            signal_type="BUY", strength=event.price,
+        ))
+
+
+class SlowSimExecution(SimExecutionEngine):
+    def execute(self, order, market_price, ts):
+        time.sleep(0.005)
+        return super().execute(order, market_price, ts)
+
+
+class RecordingStorage:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.orders = []
+        self.fills = []
+        self.statuses = []
+        self.signals = []
+
+    def save_order(self, order):
+        self.orders.append(order)
+
+    def save_fill(self, fill):
+        self.fills.append(fill)
+
+    def update_order_status(self, **kwargs):
+        self.statuses.append(kwargs)
+
+    def log_signal(self, event):
+        time.sleep(self.delay)
+        self.signals.append(event)
+
+    def log_features(self, **kwargs): pass
+
+
+def build_pipeline(storage, risk_engine=None, execution=None):
+    bus = EventBus()
+    return TradingPipeline(
+        strategy=EvenStrategy(bus),
+        risk_engine=risk_engine,
+        portfolio=PortfolioManager(initial_cash=100_000.0),
+        execution=execution or SimExecutionEngine(),
+        accounting=PositionManager(starting_cash=100_000.0),
+        storage=storage,
+    )
+
+
+def test_run_forever_executes_through_oms_and_books_fills():
+    storage = RecordingStorage()
+    risk = RiskEngine()
+    risk.freeze("BR")
+    pipeline = build_pipeline(storage, risk_engine=risk)
+
+    stats = pipeline.run_forever(ticks(40, symbols=("NG", "BR", "NG", "NG")), maxsize=4)
+
+    # even prices 2, 4, ... 40 hit NG and BR in turn; BR is frozen
+    bought = [float(p) for p in range(2, 41, 2) if (p - 1) % 4 != 1]
+    assert [signal.strength for signal in storage.signals] == bought
+    assert len(storage.fills) == 2 * len(bought)
+    assert [fill.price for fill in storage.fills[::2]] == bought
+    assert all(status["status"] == "FILLED" for status in storage.statuses)
+
+    position = pipeline.accounting.positions["NG"]
+    assert position.qty == len(bought)
+    assert position.avg_price == pytest.approx(sum(bought) / len(bought))
+    assert pipeline.portfolio.cash == pytest.approx(100_000.0 - sum(bought))
+
+    assert stats["strategy"]["processed"] == 40
+    assert stats["risk"]["processed"] == 20
+    assert stats["risk"]["filtered"] == 20 - len(bought)
+    assert stats["execution"]["processed"] == stats["accounting"]["processed"] == len(bought)
+    assert sum(s["errors"] for s in stats.values()) == 0
+    assert all(s["max_depth"] <= 4 for s in stats.values())
+
+
+def test_broker_and_storage_io_overlap():
+    storage = RecordingStorage(delay=0.005)
+    pipeline = build_pipeline(storage, execution=SlowSimExecution())
+
+    start = time.perf_counter()
+    pipeline.run_forever(ticks(80))
+    elapsed = time.perf_counter() - start
+
+    serial = 40 * (0.005 + 0.005)
+    assert len(storage.signals) == 40
+    assert elapsed < 0.8 * serial
+
+
+def test_runs_reuse_one_subscription_and_ignore_signals_in_between():
+    storage = RecordingStorage()
+    pipeline = build_pipeline(storage)
+    bus = pipeline.bus
+
+    pipeline.run_forever(ticks(4))
+    bus.publish(SignalEvent(timestamp=TS, symbol="NG", signal_type="BUY", strength=99.0))
+    # not queued on the finished run's (stopped) risk stage
+    assert pipeline.stages[1].inbox.empty()
+    pipeline.run_forever(ticks(2))
+
+    assert [signal.strength for signal in storage.signals] == [2.0, 4.0, 2.0]
+    assert len(bus.subscribers()) == 1
+    assert pipeline.accounting.positions["NG"].qty == 3
@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+
+from storage.pool import ConnectionPool, PooledStorage, PoolTimeout
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.conn.statements.append(sql)
+
+    def fetchone(self):
+        return (1.5,)
+
+
+class FakeConnection:
+    def __init__(self, dsn):
+        self.dsn = dsn
+        self.closed = 0
+        self.autocommit = True
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = 1
+
+
+def test_nested_sessions_share_one_connection():
+    pool = ConnectionPool("dsn", maxconn=2, connect=FakeConnection)
+
+    with pool.session() as outer:
+        with pool.session() as inner:
+            assert inner is outer
+        assert pool.metrics()["in_use"] == 1
+
+    assert pool.current() is None
+    assert pool.metrics()["in_use"] == 0
+    assert outer.autocommit is False
+    assert outer.rollbacks == 1
+
+
+def test_threads_get_their_own_connection_and_pool_is_bounded():
+    opened = []
+
+    def connect(dsn):
+        conn = FakeConnection(dsn)
+        opened.append(conn)
+        return conn
+
+    pool = ConnectionPool("dsn", maxconn=2, connect=connect)
+    seen = []
+    barrier = threading.Barrier(4)
+
+    def worker():
+        barrier.wait()
+        with pool.session() as conn:
+            seen.append(conn)
+            time.sleep(0.02)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    metrics = pool.metrics()
+    assert len(opened) == 2
+    assert set(map(id, seen)) == set(map(id, opened))
+    assert metrics["max_in_use"] == 2
+    assert metrics["waited"] >= 2
+    assert metrics["wait_max_us"] > 1_000
+
+
+def test_acquire_times_out_when_exhausted():
+    pool = ConnectionPool("dsn", maxconn=1, timeout=0.01, connect=FakeConnection)
+    held = pool.acquire()
+
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    assert pool.metrics()["timeouts"] == 1
+
+    pool.release(held)
+    pool.release(pool.acquire())
+
+
+def test_pooled_storage_runs_methods_in_sessions():
+    pool = ConnectionPool("dsn", maxconn=1, connect=FakeConnection)
+    storage = PooledStorage(pool)
+
+    assert storage.last_price("NG") == 1.5
+    assert pool.metrics()["in_use"] == 0
+
+    with pytest.raises(RuntimeError):
+        storage.conn
+
+    with storage.session() as conn:
+        assert storage.conn is conn
+        storage.last_price("NG")
+        assert pool.metrics()["acquired"] == 2
+
+    storage.close()
+    assert conn.closed
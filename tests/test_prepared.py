@@ -0,0 +1,144 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from storage.postgres import PostgresStorage
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = self.connection = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if isinstance(sql, bytes):
+            sql = sql.decode()
+        self.conn.statements.append(" ".join(sql.split()))
+
+    def mogrify(self, template, args):
+        return repr(tuple(args)).encode()
+
+    def fetchone(self):
+        return ("signal_id",)
+
+
+class FakeConnection:
+    encoding = "UTF8"
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+
+def storage_on(conn):
+    storage = PostgresStorage.__new__(PostgresStorage)
+    storage.conn = conn
+    return storage
+
+
+def order(order_id):
+    return SimpleNamespace(
+        order_id=order_id, symbol="NG", side="BUY", qty=1, price=3.5,
+        status="NEW", signal_event_id="sig-1", created_ts=TS, updated_ts=TS,
+    )
+
+
+def test_save_order_is_one_prepared_statement_after_warmup():
+    conn = FakeConnection()
+    storage = storage_on(conn)
+
+    storage.save_order(order("o1"))
+    warmup = list(conn.statements)
+    conn.statements.clear()
+
+    storage.save_order(order("o2"))
+    storage.save_order(order("o3"))
+
+    # schema lookup + PREPARE + EXECUTE, then EXECUTE only
+    assert any("information_schema" in sql for sql in warmup)
+    assert warmup[-2].startswith("PREPARE ins_order_with_stub AS WITH stub AS ( INSERT INTO signals (signal_id,")
+    assert conn.statements == ["EXECUTE ins_order_with_stub (" + ", ".join(["%s"] * 18) + ")"] * 2
+    assert conn.commits == 3
+
+
+def test_schema_and_statements_are_cached_per_connection():
+    first, second = FakeConnection(), FakeConnection()
+
+    for conn in (first, second, first):
+        storage_on(conn).save_order(order("o"))
+
+    lookups = [sql for sql in first.statements + second.statements if "information_schema" in sql]
+    assert len(lookups) == 2
+    assert sum(sql.startswith("PREPARE") for sql in first.statements) == 1
+
+
+def test_single_rows_use_prepared_statements_batches_multi_row():
+    conn = FakeConnection()
+    storage = storage_on(conn)
+
+    storage.update_order_status(order_id="o1", status="FILLED", ts=TS, filled_qty=1)
+    assert conn.statements[0].startswith(
+        "PREPARE upd_orders AS UPDATE orders AS o SET status = v.status"
+    )
+    assert "FROM (VALUES ($1, $2, $3::timestamptz, $4::double precision))" in conn.statements[0]
+    assert conn.statements[1] == "EXECUTE upd_orders (%s, %s, %s, %s)"
+
+    conn.statements.clear()
+    fill = SimpleNamespace(
+        fill_id="f", order_id="o1", symbol="NG", side="BUY",
+        qty=1, price=3.5, commission=0.0, timestamp=TS,
+    )
+    storage.write_rows({"fills": [storage.fill_row(fill), storage.fill_row(fill)]})
+
+    assert len(conn.statements) == 1
+    assert conn.statements[0].startswith("INSERT INTO fills")
+    assert not any(sql.startswith(("PREPARE", "EXECUTE")) for sql in conn.statements)
+
+
+def test_features_are_one_statement_keyed_by_signal_id():
+    conn = FakeConnection()
+    storage = storage_on(conn)
+    storage._init_feature_buffer(1)
+
+    signal = SimpleNamespace(event_id="sig-1", timestamp=TS, features={"mom": 1, "vol": 0.5, "z": None})
+    assert PostgresStorage.feature_rows(event=signal) == [
+        ("sig-1", "mom", 1.0, TS), ("sig-1", "vol", 0.5, TS), ("sig-1", "z", None, TS),
+    ]
+
+    storage.log_features(event_id="sig-1", features=signal.features, timestamp=TS)
+
+    assert len(conn.statements) == 1
+    assert conn.statements[0].startswith("INSERT INTO signal_features (signal_id, feature_name, feature_value, ts)")
+    assert "ON CONFLICT (signal_id, feature_name) DO UPDATE" in conn.statements[0]
+    assert conn.commits == 1
+
+
+def test_features_accumulate_across_signals():
+    conn = FakeConnection()
+    storage = storage_on(conn)
+    storage._init_feature_buffer(3)
+
+    for i in range(7):
+        storage.log_features(event_id=f"sig-{i}", features={"a": i, "b": i}, timestamp=TS)
+
+    assert conn.commits == 2
+    storage.flush_features()
+    assert conn.commits == 3
+    assert all(sql.startswith("INSERT INTO signal_features") for sql in conn.statements)
+
+    # nothing pending: no statement
+    storage.flush_features()
+    assert conn.commits == 3
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.clock import VirtualClock
+from core.event_bus import EventBus
+from core.events import MarketEvent, QuoteEvent
+from data.quote_cache import QuoteCache
+
+
+T0 = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+class CountingStorage:
+    def __init__(self, prices):
+        self.prices = prices
+        self.calls = 0
+
+    def last_price(self, symbol):
+        self.calls += 1
+        return self.prices.get(symbol, 0.0)
+
+
+def test_bus_updates_last_bid_ask_and_age():
+    clock = VirtualClock(T0)
+    bus = EventBus()
+    quotes = QuoteCache(clock=clock).attach(bus)
+
+    bus.publish(MarketEvent(timestamp=T0, symbol="NG", price=3.1))
+    bus.publish(QuoteEvent(timestamp=T0 + timedelta(seconds=1), symbol="NG", bid=3.09, ask=3.11))
+    clock.advance(timedelta(seconds=5))
+
+    assert quotes.last_price("NG") == 3.1
+    assert (quotes.bid("NG"), quotes.ask("NG")) == (3.09, 3.11)
+    assert quotes.quote("NG").mid == pytest.approx(3.1)
+    assert quotes.age("NG") == timedelta(seconds=4)
+    assert quotes.is_stale("NG", timedelta(seconds=3))
+    assert not quotes.is_stale("NG", timedelta(seconds=10))
+    assert quotes.is_stale("BR", timedelta(days=1))
+
+
+def test_db_is_asked_only_on_cold_miss():
+    storage = CountingStorage({"NG": 3.0})
+    bus = EventBus()
+    quotes = QuoteCache(fallback=storage.last_price).attach(bus)
+
+    assert [quotes.last_price("NG") for _ in range(3)] == [3.0, 3.0, 3.0]
+    assert storage.calls == 1
+    assert quotes.quote("NG").source == "db"
+
+    bus.publish(MarketEvent(timestamp=T0, symbol="NG", price=3.2))
+    assert quotes.last_price("NG") == 3.2
+    assert storage.calls == 1
+
+    # unknown symbols are not cached as 0.0
+    assert quotes.last_price("BR") == 0.0
+    assert quotes.last_price("BR") == 0.0
+    assert storage.calls == 3
+    assert quotes.metrics() == {"symbols": 1, "hits": 3, "misses": 3}
@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+
+from core.engine import Engine
+from core.ring_buffer import RingBuffer
+from core.events import MarketEvent
+from market.sim_feed import SimMarketFeed
+
+
+class DummyStorage:
+    def __init__(self):
+        self.prices = []
+
+    def log_market_price(self, **kwargs):
+        self.prices.append(kwargs["price"])
+
+
+def test_capacity_must_be_power_of_two():
+    with pytest.raises(ValueError):
+        RingBuffer(capacity=100)
+
+
+def test_batch_claim_publish_reuses_slots():
+    ring = RingBuffer(capacity=4)
+    slots = ring._slots
+
+    ring.offer_batch([1, 2, 3])
+    seen = []
+    assert ring.drain(seen.append) == 3
+
+    ring.offer_batch([4, 5, 6])
+    assert ring.drain(seen.append, max_batch=2) == 2
+    assert ring.drain(seen.append) == 1
+
+    ring.close()
+    assert ring.drain(seen.append) == -1
+
+    assert seen == [1, 2, 3, 4, 5, 6]
+    assert ring._slots is slots and len(slots) == 4
+
+
+def test_engine_consumes_feed_through_small_ring():
+    ring = RingBuffer(capacity=16)
+    feed = SimMarketFeed(symbol="NG")
+
+    producer = threading.Thread(
+        target=ring.pump,
+        args=((e for e in feed.stream(steps=500) if isinstance(e, MarketEvent)),),
+    )
+    producer.start()
+
+    storage = DummyStorage()
+    engine = Engine(
+        oms=None,
+        position_manager=None,
+        portfolio_manager=None,
+        risk_engine=None,
+        storage=storage,
+    )
+
+    processed = engine.run(ring)
+    producer.join()
+
+    assert processed == 500
+    assert len(storage.prices) == 500
+    assert len(ring) == 0
@@ -0,0 +1,179 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from core.engine import Engine
+from core.events import FillEvent, MarketEvent, RiskEvent, SignalEvent, RISK_FREEZE, RISK_UNFREEZE
+from core.ring_buffer import RingBuffer
+from core.scheduler import PRIORITY_RISK, PriorityScheduler
+from execution.oms import OMS
+from execution.sim_executor import SimExecutionEngine
+from accounting.position_manager import PositionManager
+from accounting.portfolio_manager import PortfolioManager
+from risk.risk_engine import RiskEngine
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+@dataclass
+class PricedSignal(SignalEvent):
+    price: float = 0.0
+
+
+class NullStorage:
+    def save_order(self, order): pass
+    def save_fill(self, fill): pass
+    def update_order_status(self, **kwargs): pass
+    def log_signal(self, event): pass
+    def log_features(self, **kwargs): pass
+    def log_market_price(self, **kwargs): pass
+
+
+def bar(symbol, price):
+    return MarketEvent(event_id=f"{symbol}:{price}", timestamp=TS, symbol=symbol, price=price)
+
+
+def fill(symbol, i=0):
+    return FillEvent(
+        event_id=f"fill-{symbol}-{i}", timestamp=TS, fill_id=f"F{i}", order_id="O1",
+        symbol=symbol, side="BUY", qty=1.0, price=3.1, commission=0.0,
+    )
+
+
+def signal(symbol, i=0):
+    return PricedSignal(
+        event_id=f"sig-{symbol}-{i}", timestamp=TS, symbol=symbol,
+        signal_type="BUY", strength=1.0, price=100.0,
+    )
+
+
+def test_priority_classes_keep_per_symbol_order():
+    m1, s1, m2, s2 = bar("NG", 1), signal("NG", 1), bar("NG", 2), signal("NG", 2)
+    other_fill = fill("BR", 1)
+    freeze = RiskEvent(timestamp=TS, action=RISK_FREEZE)
+
+    out = list(PriorityScheduler().schedule([m1, s1, m2, s2, other_fill, freeze]))
+
+    # other symbols and portfolio-wide risk overtake, NG keeps arrival order
+    assert out[:2] == [other_fill, freeze]
+    assert out[2:] == [m1, s1, m2, s2]
+
+
+def test_higher_class_waits_for_earlier_events_of_its_symbol():
+    scheduler = PriorityScheduler()
+    for event in (bar("NG", 1), bar("BR", 1), fill("NG", 1), fill("BR", 2)):
+        scheduler.push(event)
+
+    out = [(e.symbol, type(e).__name__) for e in iter(scheduler.pop, None)]
+
+    assert out == [
+        ("NG", "MarketEvent"), ("NG", "FillEvent"),
+        ("BR", "MarketEvent"), ("BR", "FillEvent"),
+    ]
+    assert scheduler.metrics()["held"] == 0
+
+
+def test_starvation_bound_serves_lower_classes():
+    scheduler = PriorityScheduler(max_skips=3)
+    scheduler.push(bar("NG", 1))
+    for i in range(10):
+        scheduler.push(fill("BR", i))
+
+    order = [type(scheduler.pop()).__name__ for _ in range(5)]
+
+    assert order == ["FillEvent"] * 3 + ["MarketEvent", "FillEvent"]
+    assert scheduler.metrics()["forced"] == 1
+
+
+def test_subclasses_and_registered_types_are_classified():
+    class UrgentBar(MarketEvent):
+        pass
+
+    scheduler = PriorityScheduler()
+    assert scheduler.priority_of(PricedSignal) == scheduler.priority_of(SignalEvent)
+
+    scheduler.register(UrgentBar, PRIORITY_RISK)
+    assert scheduler.priority_of(UrgentBar) == PRIORITY_RISK
+
+
+def test_ring_source_is_topped_up_without_blocking():
+    ring = RingBuffer(64)
+    for i in range(20):
+        ring.offer(bar("NG", i))
+    ring.offer(fill("BR"))
+    ring.close()
+
+    out = list(PriorityScheduler(window=8).schedule(ring))
+
+    assert len(out) == 21
+    assert isinstance(out[0], MarketEvent)
+    assert [e.price for e in out if isinstance(e, MarketEvent)] == list(range(20))
+    # the fill overtakes the (other symbol's) bars still buffered when it arrived
+    assert out.index(next(e for e in out if isinstance(e, FillEvent))) < 20
+
+
+def test_plain_iterators_are_not_read_ahead():
+    pulled = []
+
+    def live():
+        for i in range(3):
+            pulled.append(i)
+            yield bar("NG", i)
+
+    scheduler = PriorityScheduler()
+    for event in scheduler.schedule(live()):
+        # each event goes out before the next one is asked for
+        assert pulled[-1] == event.price
+
+    replay = PriorityScheduler(read_ahead=True)
+    events = [bar("NG", 1), fill("BR", 1)]
+    assert list(replay.schedule(iter(events))) == events[::-1]
+
+
+def build_engine(scheduler=None):
+    storage = NullStorage()
+    position_manager = PositionManager()
+    portfolio_manager = PortfolioManager(initial_cash=50_000.0)
+
+    return Engine(
+        oms=OMS(storage=storage, execution_engine=SimExecutionEngine()),
+        position_manager=position_manager,
+        portfolio_manager=portfolio_manager,
+        risk_engine=RiskEngine(position_manager, portfolio_manager),
+        storage=storage,
+        scheduler=scheduler,
+    )
+
+
+def test_engine_applies_risk_freeze_ahead_of_queued_signal():
+    events = [bar("NG", i) for i in range(100)] + [
+        signal("NG"),
+        RiskEvent(timestamp=TS, action=RISK_FREEZE, reason="manual"),
+    ]
+
+    fifo = build_engine()
+    fifo.run(events)
+    assert fifo.risk_engine.is_frozen
+    assert fifo.position_manager.positions["NG"].qty > 0
+
+    prioritized = build_engine(PriorityScheduler())
+    assert prioritized.run(events) == len(events)
+    assert prioritized.risk_engine.is_frozen
+    assert prioritized.position_manager.positions["NG"].qty == 0
+
+
+def test_symbol_freeze_blocks_only_that_symbol():
+    engine = build_engine()
+    events = [
+        RiskEvent(timestamp=TS, action=RISK_FREEZE, symbol="NG", reason="manual"),
+        signal("NG"), signal("BR"),
+    ]
+
+    engine.run(events)
+
+    assert not engine.risk_engine.is_frozen
+    assert "NG" not in engine.position_manager.positions or engine.position_manager.positions["NG"].qty == 0
+    assert engine.position_manager.positions["BR"].qty > 0
+
+    engine.run([RiskEvent(timestamp=TS, action=RISK_UNFREEZE, symbol="NG"), signal("NG", 1)])
+    assert engine.position_manager.positions["NG"].qty > 0
@@ -0,0 +1,140 @@
+import queue
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.clock import VirtualClock
+from core.engine import Engine
+from core.events import EventCodec, SignalEvent
+from core.sharding import ShardAggregate, ShardError, ShardedEngine, _worker_loop, shard_for
+from execution.oms import OMS
+from execution.sim_executor import SimExecutionEngine
+from accounting.position_manager import PositionManager
+from accounting.portfolio_manager import PortfolioManager
+from risk.risk_engine import RiskEngine
+
+
+@dataclass
+class PricedSignal(SignalEvent):
+    price: float = 0.0
+
+
+class NullStorage:
+    def save_order(self, order): pass
+    def save_fill(self, fill): pass
+    def update_order_status(self, **kwargs): pass
+    def log_signal(self, event): pass
+    def log_features(self, **kwargs): pass
+    def log_market_price(self, **kwargs): pass
+
+
+def build_engine(shard):
+    storage = NullStorage()
+    position_manager = PositionManager()
+    portfolio_manager = PortfolioManager(initial_cash=50_000.0)
+
+    return Engine(
+        oms=OMS(storage=storage, execution_engine=SimExecutionEngine()),
+        position_manager=position_manager,
+        portfolio_manager=portfolio_manager,
+        risk_engine=RiskEngine(position_manager, portfolio_manager),
+        storage=storage,
+    )
+
+
+class FailingStorage(NullStorage):
+    def log_signal(self, event):
+        raise RuntimeError("disk full")
+
+
+def build_failing_engine(shard):
+    engine = build_engine(shard)
+    engine.storage = FailingStorage()
+    return engine
+
+
+def make_signal(symbol, price):
+    return PricedSignal(
+        event_id=f"sig-{symbol}",
+        timestamp=datetime.now(timezone.utc),
+        symbol=symbol,
+        signal_type="BUY",
+        strength=1.0,
+        price=price,
+    )
+
+
+def test_shard_for_is_stable():
+    assert shard_for("NGH6@RTSX", 4) == shard_for("NGH6@RTSX", 4)
+    assert shard_for(None, 4) == 0
+
+
+def test_sharded_engine_merges_portfolio():
+    symbols = ["NG", "BR", "SI", "GD"]
+    sharded = ShardedEngine(build_engine, n_shards=2, batch_size=1)
+
+    processed = sharded.run(make_signal(s, 100.0) for s in symbols)
+
+    assert processed == 4
+    assert sum(a.processed for a in sharded.aggregates.values()) == 4
+
+    p = sharded.portfolio
+    assert p.cash == 2 * 50_000.0 - 4 * 100.0
+    assert p.gross_exposure == 4 * 100.0
+    assert p.equity == 2 * 50_000.0
+    assert p.drawdown == 0.0
+
+
+def test_worker_error_is_raised_instead_of_hanging():
+    sharded = ShardedEngine(build_failing_engine, n_shards=2, batch_size=1, poll_interval=0.1)
+
+    start = time.monotonic()
+    with pytest.raises(ShardError, match="disk full"):
+        sharded.run(make_signal(s, 100.0) for s in ["NG", "BR", "SI", "GD"])
+
+    assert time.monotonic() - start < 10
+    assert sharded._workers == []
+
+
+def test_portfolio_freeze_is_broadcast_once_and_lifted_next_day():
+    clock = VirtualClock(datetime(2025, 3, 3, 10, tzinfo=timezone.utc))
+    sharded = ShardedEngine(
+        build_engine, n_shards=2, risk_engine=RiskEngine(max_daily_loss_pct=0.01, clock=clock),
+    )
+    sharded._inboxes = [queue.Queue(), queue.Queue()]
+
+    def sent():
+        return [[inbox.get_nowait() for _ in range(inbox.qsize())] for inbox in sharded._inboxes]
+
+    sharded._apply(ShardAggregate(shard=0, cash=49_000.0, equity=49_000.0, daily_realized_pnl=-1_000.0))
+    sharded._apply(ShardAggregate(shard=1, cash=50_000.0, equity=50_000.0))
+
+    # -1000 on a 100k day: over the 1% daily limit, broadcast once
+    assert sharded.portfolio.daily_drawdown == pytest.approx(-0.01)
+    assert sent() == [[("freeze", clock.now().date())]] * 2
+
+    clock.advance(timedelta(days=1))
+    sharded._apply(ShardAggregate(shard=0, cash=49_000.0, equity=49_000.0))
+
+    assert not sharded.risk_engine.is_frozen
+    assert sent() == [[("unfreeze", None)]] * 2
+
+
+def test_worker_applies_freeze_through_the_risk_engine():
+    inbox, outbox = queue.Queue(), queue.Queue()
+    codec = EventCodec()
+    inbox.put(("freeze", None))
+    inbox.put(("events", codec.encode(make_signal("NG", 100.0))))
+    inbox.put(("unfreeze", None))
+    inbox.put(("events", codec.encode(make_signal("BR", 100.0))))
+    inbox.put(("stop", None))
+
+    _worker_loop(0, build_engine, inbox, outbox)
+
+    reports = [outbox.get_nowait() for _ in range(outbox.qsize())]
+    assert [kind for kind, _ in reports] == ["aggregate", "aggregate", "done"]
+    # the frozen NG signal did not trade, BR after the unfreeze did
+    assert reports[0][1].gross_exposure == 0.0
+    assert reports[-1][1].gross_exposure == 100.0
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+
+from core.clock import VirtualClock
+from core.event_bus import EventBus
+from core.events import TimerEvent, TIMER_SESSION_ROLL
+from core.events.market_batch import to_epoch_ns
+from core.timers import TimerService, TimerWheel
+from accounting.position_manager import PositionManager
+from risk.risk_engine import RiskEngine
+
+
+T0 = datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc)
+SEC = 1_000_000_000
+
+
+def test_wheel_fires_in_deadline_order_and_cancels():
+    wheel = TimerWheel(timedelta(seconds=1))
+    base = to_epoch_ns(T0)
+
+    late = wheel.schedule("late", base + 5 * SEC)
+    early = wheel.schedule("early", base + 2 * SEC)
+    dropped = wheel.schedule("dropped", base + 3 * SEC)
+    # many far-future timers do not touch the ticks below
+    for i in range(10_000):
+        wheel.schedule("far", base + (3600 + i) * SEC)
+
+    assert wheel.cancel(dropped)
+    assert not wheel.cancel(dropped)
+
+    wheel.advance(base)
+    assert [t.name for t, _ in wheel.advance(base + 10 * SEC)] == ["early", "late"]
+    assert wheel.advance(base + 11 * SEC) == []
+    assert len(wheel) == 10_000
+    assert early.timer_id not in wheel._timers and late.timer_id not in wheel._timers
+
+
+def test_long_jump_visits_only_non_empty_buckets():
+    wheel = TimerWheel(timedelta(milliseconds=1))
+    base = to_epoch_ns(T0)
+    wheel.advance(base)
+    wheel.schedule("weekend", base + 2 * 86_400 * SEC)
+
+    fired = wheel.advance(base + 3 * 86_400 * SEC)
+
+    assert [t.name for t, _ in fired] == ["weekend"]
+
+
+def test_periodic_timer_on_virtual_clock():
+    clock = VirtualClock(T0)
+    bus = EventBus()
+    seen = []
+    bus.subscribe(TimerEvent, seen.append)
+
+    timers = TimerService(bus, clock)
+    snapshot = timers.schedule("snapshot", every=timedelta(minutes=1), payload={"k": 1})
+
+    for _ in range(3):
+        clock.advance(timedelta(minutes=1))
+        timers.advance()
+
+    # a gap of several periods fires once, then re-arms after "now"
+    clock.advance(timedelta(minutes=10))
+    timers.advance()
+
+    timers.cancel(snapshot)
+    clock.advance(timedelta(minutes=5))
+    timers.advance()
+
+    assert [e.timestamp for e in seen] == [
+        T0 + timedelta(minutes=m) for m in (1, 2, 3, 4)
+    ]
+    assert all(e.name == "snapshot" and e.payload == {"k": 1} for e in seen)
+
+
+def test_session_roll_resets_daily_pnl_and_freeze():
+    clock = VirtualClock(T0)
+    bus = EventBus()
+    positions = PositionManager(starting_cash=10_000)
+    risk = RiskEngine(positions, clock=clock)
+    bus.subscribe(TimerEvent, positions.on_timer)
+    bus.subscribe(TimerEvent, risk.on_timer)
+
+    timers = TimerService(bus, clock)
+    midnight = datetime(2026, 3, 3, tzinfo=timezone.utc)
+    timers.schedule(TIMER_SESSION_ROLL, at=midnight, every=timedelta(days=1))
+
+    positions.daily_realized_pnl = -500.0
+    risk.freeze()
+    risk.freeze("NG")
+
+    clock.advance_to(midnight + timedelta(seconds=1))
+    assert timers.advance() == 1
+
+    assert positions.daily_realized_pnl == 0.0
+    assert not risk.is_frozen
+    assert not risk.is_symbol_frozen("NG")
@@ -0,0 +1,92 @@
+import asyncio
+from datetime import datetime, timezone
+
+from core.event_bus import AsyncEventBus, EventBus
+from core.events import MarketEvent, MarketEventBatch, SignalEvent
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+def tick(symbol, price=1.0):
+    return MarketEvent(timestamp=TS, symbol=symbol, price=price)
+
+
+def test_exact_and_wildcard_topics():
+    bus = EventBus()
+    everything, ng, rtsx, signals = [], [], [], []
+
+    bus.subscribe(MarketEvent, everything.append)
+    bus.subscribe(MarketEvent, ng.append, symbol="NGH6@RTSX")
+    bus.subscribe(MarketEvent, rtsx.append, symbol="*@RTSX")
+    bus.subscribe(SignalEvent, signals.append, symbol="NGH6@RTSX")
+
+    for symbol in ("NGH6@RTSX", "BRJ6@RTSX", "SBER@MISX"):
+        bus.publish(tick(symbol))
+
+    assert [e.symbol for e in everything] == ["NGH6@RTSX", "BRJ6@RTSX", "SBER@MISX"]
+    assert [e.symbol for e in ng] == ["NGH6@RTSX"]
+    assert [e.symbol for e in rtsx] == ["NGH6@RTSX", "BRJ6@RTSX"]
+    assert signals == []
+
+
+def test_handlers_keep_subscription_order_and_cache_resets():
+    bus = EventBus()
+    calls = []
+
+    bus.subscribe(MarketEvent, lambda e: calls.append("pattern"), symbol="NG*")
+    bus.subscribe(MarketEvent, lambda e: calls.append("all"))
+    bus.publish(tick("NG"))
+
+    bus.subscribe(MarketEvent, lambda e: calls.append("exact"), symbol="NG")
+    bus.publish(tick("NG"))
+
+    assert calls == ["pattern", "all", "pattern", "all", "exact"]
+
+
+def test_single_symbol_strategies_are_not_called_for_other_symbols():
+    symbols = [f"S{i:03d}@RTSX" for i in range(200)]
+    calls = [0]
+
+    def on_market(event):
+        calls[0] += 1
+
+    bus = EventBus()
+    for symbol in symbols[:50]:
+        bus.subscribe(MarketEvent, on_market, symbol=symbol)
+
+    for symbol in symbols:
+        bus.publish(tick(symbol))
+
+    # type-only subscriptions would have made 200 * 50 calls
+    assert calls[0] == 50
+
+
+def test_batch_fallback_respects_topics():
+    bus = EventBus()
+    ng = []
+    bus.subscribe(MarketEvent, ng.append, symbol="NG")
+
+    bus.publish_batch(MarketEventBatch.from_events([tick("NG", 1.0), tick("BR", 2.0), tick("NG", 3.0)]))
+
+    assert [e.price for e in ng] == [1.0, 3.0]
+
+
+def test_async_bus_routes_by_symbol():
+    async def scenario():
+        bus = AsyncEventBus()
+        ng, all_ = [], []
+        bus.subscribe(MarketEvent, ng.append, symbol="NG")
+        bus.subscribe(MarketEvent, all_.append)
+
+        await bus.start()
+        bus.publish(tick("NG"))
+        bus.publish(tick("BR"))
+        await bus.publish_async(tick("BR"))
+        await bus.stop()
+        return ng, all_
+
+    ng, all_ = asyncio.run(scenario())
+
+    assert [e.symbol for e in ng] == ["NG"]
+    assert len(all_) == 3
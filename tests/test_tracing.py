@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from core.engine import Engine
+from core.events import SignalEvent
+from core.tracing import NULL_SPAN, Tracer
+from execution.oms import OMS
+from execution.sim_executor import SimExecutionEngine
+from accounting.position_manager import PositionManager
+from accounting.portfolio_manager import PortfolioManager
+from risk.risk_engine import RiskEngine
+
+
+@dataclass
+class PricedSignal(SignalEvent):
+    price: float = 0.0
+
+
+class NullStorage:
+    def save_order(self, order): pass
+    def save_fill(self, fill): pass
+    def update_order_status(self, **kwargs): pass
+    def log_signal(self, event): pass
+    def log_features(self, **kwargs): pass
+
+
+def build_engine(tracer):
+    storage = NullStorage()
+    position_manager = PositionManager()
+    portfolio_manager = PortfolioManager(initial_cash=50_000.0)
+
+    return Engine(
+        oms=OMS(storage=storage, execution_engine=SimExecutionEngine()),
+        position_manager=position_manager,
+        portfolio_manager=portfolio_manager,
+        risk_engine=RiskEngine(position_manager, portfolio_manager),
+        storage=storage,
+        tracer=tracer,
+    )
+
+
+def make_signal(i):
+    return PricedSignal(
+        event_id=f"sig-{i}",
+        timestamp=datetime.now(timezone.utc),
+        symbol="NG",
+        signal_type="BUY",
+        strength=1.0,
+        price=100.0,
+    )
+
+
+def test_disabled_tracer_hands_out_null_spans():
+    tracer = Tracer()
+
+    assert tracer.span("x") is NULL_SPAN
+    assert tracer.trace("c") is NULL_SPAN
+
+    engine = build_engine(tracer)
+    engine.dispatch(make_signal(0))
+
+    assert tracer.breakdown() == {}
+    assert not tracer.traces
+
+
+def test_signal_path_is_traced_per_stage_once_enabled():
+    tracer = Tracer()
+    engine = build_engine(tracer)
+
+    engine.dispatch(make_signal(0))
+    tracer.enable()
+    for i in range(1, 4):
+        engine.dispatch(make_signal(i))
+    tracer.disable()
+    engine.dispatch(make_signal(4))
+
+    breakdown = tracer.breakdown()
+    for stage in ("create_order", "process_order", "log_signal", "log_features", Tracer.TOTAL):
+        assert breakdown[stage]["count"] == 3
+        assert breakdown[stage]["p50_us"] <= breakdown[stage]["p99_us"]
+    # once per (partial) fill
+    for stage in ("position", "portfolio", "risk"):
+        assert breakdown[stage]["count"] >= 3
+
+    correlation_id, spans, total = tracer.trace_of("sig-2")
+    assert correlation_id == "sig-2"
+    assert [stage for stage, _ in spans][:2] == ["create_order", "process_order"]
+    assert sum(ns for _, ns in spans) <= total
+    assert tracer.trace_of("sig-4") is None
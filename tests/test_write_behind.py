@@ -0,0 +1,199 @@
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from storage.postgres import PostgresStorage
+from storage.write_behind import WriteBehindStorage
+
+
+TS = datetime(2026, 1, 5, 10, 0, tzinfo=timezone.utc)
+
+
+class RecordingStorage(PostgresStorage):
+    """PostgresStorage row builders, with write_rows recorded instead of sent."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+        self.closed = False
+        self.write_thread = None
+
+    def write_rows(self, batches):
+        self.write_thread = threading.current_thread()
+        if self.fail:
+            raise RuntimeError("db down")
+        self.batches.append({table: list(rows) for table, rows in batches.items() if rows})
+
+    def close(self):
+        self.closed = True
+
+    def last_price(self, symbol):
+        return 42.0
+
+    def rows(self, table):
+        return [row for batch in self.batches for row in batch.get(table, [])]
+
+
+def order(order_id, signal_id="sig-1"):
+    return SimpleNamespace(
+        order_id=order_id, symbol="NG", side="BUY", qty=1, price=3.5,
+        status="NEW", signal_event_id=signal_id, created_ts=TS, updated_ts=TS,
+    )
+
+
+def fill(fill_id, order_id):
+    return SimpleNamespace(
+        fill_id=fill_id, order_id=order_id, symbol="NG", side="BUY",
+        qty=1, price=3.5, commission=0.1, timestamp=TS,
+    )
+
+
+def test_rows_are_batched_by_table_and_written_off_thread():
+    storage = RecordingStorage()
+    writer = WriteBehindStorage(storage, max_rows=1000, max_delay=10.0)
+
+    for i in range(5):
+        writer.save_order(order(f"o{i}"))
+        writer.save_fill(fill(f"f{i}", f"o{i}"))
+        writer.update_order_status(order_id=f"o{i}", status="FILLED", ts=TS, filled_qty=1)
+
+    # neither threshold reached: nothing written yet
+    time.sleep(0.05)
+    assert storage.batches == []
+
+    assert writer.barrier(timeout=5)
+
+    assert len(storage.batches) == 1
+    assert [row[0] for row in storage.rows("orders")] == [f"o{i}" for i in range(5)]
+    assert len(storage.rows("signal_stubs")) == 5
+    assert len(storage.rows("fills")) == 5
+    assert len(storage.rows("order_updates")) == 5
+    assert storage.write_thread is not threading.current_thread()
+    writer.close()
+
+
+def test_size_threshold_flushes_without_barrier():
+    storage = RecordingStorage()
+    writer = WriteBehindStorage(storage, max_rows=10, max_delay=10.0)
+
+    for i in range(10):
+        writer.log_market_price(symbol="NG", ts=TS.replace(minute=i), price=float(i))
+
+    deadline = time.monotonic() + 5
+    while not storage.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert len(storage.rows("market_data")) == 10
+    writer.close()
+
+
+def test_time_threshold_flushes_a_trickle():
+    storage = RecordingStorage()
+    writer = WriteBehindStorage(storage, max_rows=1000, max_delay=0.02)
+
+    writer.log_engine_metrics([("bus.p99", 1.0, TS)])
+
+    deadline = time.monotonic() + 5
+    while not storage.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert storage.rows("engine_metrics") == [("bus.p99", 1.0, TS)]
+    writer.close()
+
+
+def test_close_flushes_and_closes_storage():
+    storage = RecordingStorage()
+    writer = WriteBehindStorage(storage, max_rows=1000, max_delay=10.0)
+
+    writer.save_fill(fill("f1", "o1"))
+    writer.close()
+
+    assert len(storage.rows("fills")) == 1
+    assert storage.closed
+    with pytest.raises(RuntimeError):
+        writer.save_fill(fill("f2", "o1"))
+
+
+def test_write_errors_surface_on_barrier():
+    storage = RecordingStorage(fail=True)
+    writer = WriteBehindStorage(storage, max_rows=1000, max_delay=10.0)
+
+    writer.save_fill(fill("f1", "o1"))
+    with pytest.raises(RuntimeError, match="db down"):
+        writer.barrier(timeout=5)
+
+    assert writer.metrics()["errors"] == 1
+    writer.close()
+
+
+def test_reads_pass_through():
+    writer = WriteBehindStorage(RecordingStorage())
+    assert writer.last_price("NG") == 42.0
+    writer.close()
+
+
+class StallingStorage(RecordingStorage):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write_rows(self, batches):
+        self.release.wait(5)
+        super().write_rows(batches)
+
+
+def test_calls_return_immediately_then_backpressure_when_full():
+    storage = StallingStorage()
+    writer = WriteBehindStorage(storage, max_rows=1000, max_delay=0.0, max_pending=4)
+
+    # the first batch goes to the stalled writer, four more fill the buffer
+    start = time.perf_counter()
+    for i in range(5):
+        writer.save_fill(fill(f"f{i}", "o1"))
+        time.sleep(0.01)
+    assert time.perf_counter() - start < 1.0
+    assert writer.metrics()["stalls"] == 0
+
+    def release_later():
+        time.sleep(0.05)
+        storage.release.set()
+
+    threading.Thread(target=release_later).start()
+    writer.save_fill(fill("f5", "o1"))
+
+    assert writer.metrics()["stalls"] == 1
+    assert writer.barrier(timeout=5)
+    assert [row[0] for row in storage.rows("fills")] == [f"f{i}" for i in range(6)]
+    writer.close()
+
+
+def test_engine_run_raises_storage_errors():
+    from core.engine import Engine
+    from core.events import MarketEvent
+
+    reported = []
+    storage = RecordingStorage(fail=True)
+    writer = WriteBehindStorage(storage, max_rows=1, on_error=reported.append)
+
+    engine = Engine(
+        oms=None, position_manager=None, portfolio_manager=None,
+        risk_engine=None, storage=writer,
+    )
+
+    def ticks():
+        yield MarketEvent(timestamp=TS, symbol="NG", price=1.0)
+        # the writer has failed by the time the next event is processed
+        deadline = time.monotonic() + 5
+        while not reported and time.monotonic() < deadline:
+            time.sleep(0.01)
+        yield MarketEvent(timestamp=TS, symbol="NG", price=2.0)
+        yield MarketEvent(timestamp=TS, symbol="NG", price=3.0)
+
+    with pytest.raises(RuntimeError, match="db down"):
+        engine.run(ticks())
+
+    assert engine.processed == 2
+    writer.close()